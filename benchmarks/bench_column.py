@@ -0,0 +1,55 @@
+"""
+Benchmark of tzcity.tzcity_column() against calling tzcity.tzcity() on
+each row of a pandas column
+
+With tzcity and pandas installed (see CONTRIBUTING.md), run
+
+    python benchmarks/bench_column.py [ROWS]
+
+ROWS defaults to 10 million.
+"""
+
+import random
+import sys
+import time
+
+import pandas
+
+import tzcity
+from tzcity.data import CITY_DICT
+
+
+def per_row(city: str) -> object:
+    """
+    Look up a city the way it is done without tzcity_column().
+    """
+    try:
+        return tzcity.tzcity(city)
+    except ValueError:
+        return None
+
+
+def main() -> None:
+    """
+    Time both ways of looking up a column of city names.
+    """
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    names = [city for cities in CITY_DICT.values() for city in cities]
+    names += [f"unknown city {i}" for i in range(len(names) // 10)]
+    rng = random.Random(0)
+    column = pandas.Series(rng.choices(names, k=rows))
+    print(f"rows: {rows}")
+
+    start = time.perf_counter()
+    expected = column.map(per_row)
+    print(f"map(tzcity.tzcity): {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    result = tzcity.tzcity_column(column)
+    print(f"tzcity_column: {time.perf_counter() - start:.2f} s")
+
+    assert (result.astype(object).fillna('') == expected.fillna('')).all()
+
+
+if __name__ == '__main__':
+    main()
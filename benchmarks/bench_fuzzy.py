@@ -0,0 +1,55 @@
+"""
+Latency benchmark of tzcity.tzcity_fuzzy()
+
+With tzcity installed (see CONTRIBUTING.md), run
+
+    python benchmarks/bench_fuzzy.py
+"""
+
+import random
+import statistics
+import time
+
+import tzcity
+
+
+def typo(name: str, rng: random.Random) -> str:
+    """
+    Return name with one character deleted, replaced or transposed.
+    """
+    i = rng.randrange(len(name) - 1)
+    kind = rng.choice(['delete', 'replace', 'transpose'])
+    if kind == 'delete':
+        return name[:i] + name[i+1:]
+    if kind == 'replace':
+        return name[:i] + rng.choice('aeiou') + name[i+1:]
+    return name[:i] + name[i+1] + name[i] + name[i+2:]
+
+
+def main() -> None:
+    """
+    Time fuzzy lookups of misspelt names and print latency percentiles.
+    """
+    rng = random.Random(0)
+    names = [name for name in tzcity.core._index() if len(name) > 3]
+    queries = [typo(rng.choice(names), rng) for _ in range(5000)]
+
+    tzcity.tzcity_fuzzy('londn')  # build the index
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        try:
+            tzcity.tzcity_fuzzy(query)
+        except ValueError:
+            pass
+        timings.append((time.perf_counter() - start) * 1e6)
+
+    cuts = statistics.quantiles(timings, n=100)
+    print(f"queries: {len(timings)}")
+    print(f"p50: {cuts[49]:.1f} us")
+    print(f"p99: {cuts[98]:.1f} us")
+    print(f"max: {max(timings):.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark of tzcity.nearest_many() against a linear haversine scan
+
+With tzcity installed (see CONTRIBUTING.md), run
+
+    python benchmarks/bench_geo.py
+
+The linear scan is timed on a sample, as it takes minutes for all points.
+"""
+
+import math
+import random
+import time
+from typing import List, Tuple
+
+import tzcity
+from tzcity.data import COORDINATES
+
+# Number of points of each batch
+POINTS = 1_000_000
+
+# Number of points timed with the linear scan
+SAMPLE = 10_000
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Return the great circle distance between two points in radians.
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    return 2 * math.asin(math.sqrt(
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2)
+        * math.sin((lon2 - lon1) / 2) ** 2))
+
+
+def linear(points: List[Tuple[float, float]]) -> List[str]:
+    """
+    Find the nearest city of each point by computing all distances.
+    """
+    cities = list(COORDINATES.items())
+    return [min(cities, key=lambda city: haversine(lat, lon, *city[1]))[0]
+            for lat, lon in points]
+
+
+def main() -> None:
+    """
+    Time batches of random points and print the times taken.
+    """
+    rng = random.Random(0)
+    points = [(math.degrees(math.asin(rng.uniform(-1, 1))),
+               rng.uniform(-180, 180)) for _ in range(POINTS)]
+
+    for label in ['nearest_many', 'again (warm)']:
+        start = time.perf_counter()
+        for _ in tzcity.nearest_many(points):
+            pass
+        print(f"{label:<15} {time.perf_counter() - start:6.2f} s")
+
+    start = time.perf_counter()
+    linear(points[:SAMPLE])
+    seconds = (time.perf_counter() - start) * POINTS / SAMPLE
+    print(f"{'linear scan':<15} {seconds:6.2f} s (estimated)")
+
+
+if __name__ == '__main__':
+    main()
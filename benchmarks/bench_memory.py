@@ -0,0 +1,47 @@
+"""
+Benchmark of the memory retained by the data of tzcity and its indexes
+
+With tzcity installed (see CONTRIBUTING.md), run
+
+    python benchmarks/bench_memory.py
+
+Prints the memory allocated by each index as it is built, in the order in
+which lookups build them, and the total.
+"""
+
+import sys
+import tracemalloc
+
+tracemalloc.start()
+
+# pylint: disable=protected-access,wrong-import-position
+import tzcity  # noqa: E402
+from tzcity import core, prefix  # noqa: E402
+
+STEPS = [
+    ('lookup index', core._dict_index),
+    ('folded index', core._folded_index),
+    ('multi-valued index', core._multi_index),
+    ('reverse table', core._reverse_table),
+    ('completion index', prefix._sorted_names),
+]
+
+
+def main() -> None:
+    """
+    Build the indexes one by one and print the memory each one took.
+    """
+    start = tracemalloc.get_traced_memory()[0]
+    before = start
+    for label, build in STEPS:
+        build()
+        after = tracemalloc.get_traced_memory()[0]
+        print(f"{label:<20} {(after - before) / 1024:8.1f} KiB")
+        before = after
+    tzcity.tzcity('london')
+    print(f"{'total':<20} {(before - start) / 1024:8.1f} KiB")
+    print(f"CITY_DICT loaded: {'tzcity.data' in sys.modules}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark of tzcity.offset.tzoffset_many() against building datetimes
+
+With tzcity installed (see CONTRIBUTING.md), run
+
+    python benchmarks/bench_offset.py
+"""
+
+import random
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import tzcity
+from tzcity.data import CITY_DICT
+from tzcity.offset import tzoffset_many
+
+# Number of (city, timestamp) pairs converted
+ROWS = 1_000_000
+
+
+def per_row(pairs):
+    """
+    Convert each pair with tzcity() and a ZoneInfo, as callers used to.
+    """
+    result = []
+    for city, timestamp in pairs:
+        zone = ZoneInfo(tzcity.tzcity(city))
+        local = datetime.fromtimestamp(timestamp, zone)
+        result.append((local.utcoffset(), bool(local.dst())))
+    return result
+
+
+def main() -> None:
+    """
+    Time both ways of converting pairs and print the times taken.
+    """
+    rng = random.Random(0)
+    cities = [tz.split('/')[-1].replace('_', ' ') for tz in CITY_DICT
+              if tz not in ('america/la_paz', 'america/argentina/la_rioja',
+                            'antarctica/dumontdurville')]
+    # A year of timestamps, as in a year of logs
+    start = datetime(2023, 1, 1).timestamp()
+    pairs = [(rng.choice(cities), start + rng.random() * 365 * 86400)
+             for _ in range(ROWS)]
+
+    for name, func in [('per row', per_row),
+                       ('tzoffset_many', lambda pairs: list(
+                           tzoffset_many(pairs)))]:
+        begin = time.perf_counter()
+        func(pairs)
+        print(f"{name:<15} {time.perf_counter() - begin:6.2f} s")
+
+
+if __name__ == '__main__':
+    main()
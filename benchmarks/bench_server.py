@@ -0,0 +1,121 @@
+"""
+Load test of the tzcity HTTP server
+
+With tzcity installed (see CONTRIBUTING.md), run
+
+    python benchmarks/bench_server.py
+
+to start a server and send it lookups over keep-alive connections, or
+
+    python benchmarks/bench_server.py --url http://127.0.0.1:8080
+
+to load test a server which is already running. Prints the throughput and
+latency percentiles of the requests.
+"""
+
+import argparse
+import http.client
+import json
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import List
+from urllib.parse import quote, urlsplit
+
+from tzcity.data import CITY_DICT
+
+
+def _paths(count: int, batch: int) -> List[str]:
+    """
+    Return count request paths, or batch request bodies if batch > 0.
+    """
+    rng = random.Random(0)
+    names = [city for cities in CITY_DICT.values() for city in cities]
+    names += [f"unknown city {i}" for i in range(len(names) // 10)]
+    if batch:
+        return [json.dumps(rng.choices(names, k=batch))
+                for _ in range(count)]
+    return [f"/tzcity?city={quote(rng.choice(names))}"
+            for _ in range(count)]
+
+
+def _client(host: str, port: int, requests: List[str], batch: int,
+            timings: List[float]) -> None:
+    """
+    Send requests over one connection, adding their latencies to timings.
+    """
+    connection = http.client.HTTPConnection(host, port)
+    for request in requests:
+        start = time.perf_counter()
+        if batch:
+            connection.request('POST', '/tzcity', body=request)
+        else:
+            connection.request('GET', request)
+        response = connection.getresponse()
+        response.read()
+        timings.append(time.perf_counter() - start)
+    connection.close()
+
+
+def _start_server() -> subprocess.Popen:
+    """
+    Start a server on any free port in a new process.
+    """
+    return subprocess.Popen(
+        [sys.executable, '-m', 'tzcity.server', '--port', '0'],
+        stdout=subprocess.PIPE, universal_newlines=True)
+
+
+def main() -> None:
+    """
+    Run the load test and print its results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--url', help="server to test instead of starting one")
+    parser.add_argument('--connections', type=int, default=8,
+                        help="number of concurrent connections")
+    parser.add_argument('--requests', type=int, default=5000,
+                        help="number of requests per connection")
+    parser.add_argument('--batch', type=int, default=0,
+                        help="names per batch request, 0 for single lookups")
+    args = parser.parse_args()
+
+    server = None
+    if args.url is None:
+        server = _start_server()
+        assert server.stdout is not None
+        args.url = server.stdout.readline().split()[-1]
+    url = urlsplit(args.url)
+
+    try:
+        timings: List[float] = []
+        threads = [
+            threading.Thread(target=_client, args=(
+                url.hostname, url.port, _paths(args.requests, args.batch),
+                args.batch, timings))
+            for _ in range(args.connections)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    cuts = statistics.quantiles(timings, n=100)
+    lookups = len(timings) * max(args.batch, 1)
+    print(f"requests: {len(timings)} over {args.connections} connections")
+    print(f"throughput: {len(timings) / elapsed:.0f} requests/s, "
+          f"{lookups / elapsed:.0f} lookups/s")
+    print(f"p50: {cuts[49] * 1e3:.3f} ms")
+    print(f"p99: {cuts[98] * 1e3:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark of tzcity.sources with a large extra source
+
+With tzcity installed (see CONTRIBUTING.md), run
+
+    python benchmarks/bench_sources.py
+
+A GeoNames dump is generated with random names instead of downloading
+one, so the results do not depend on the network.
+"""
+
+import random
+import statistics
+import string
+import time
+from typing import Callable, Iterator, List, TypeVar
+
+import tzcity
+from tzcity import core
+from tzcity.data import CITY_DICT
+from tzcity.sources import add_source, read_geonames
+
+# Number of places in the generated dump
+PLACES = 150_000
+
+T = TypeVar('T')
+
+
+def geonames(rng: random.Random) -> Iterator[str]:
+    """
+    Yield lines of a GeoNames dump of random places.
+    """
+    zones = [tz.title() for tz in CITY_DICT]
+    for geoname_id in range(PLACES):
+        name = ''.join(rng.choices(string.ascii_lowercase,
+                                   k=rng.randint(5, 14))).title()
+        fields = [''] * 19
+        fields[0] = str(geoname_id)
+        fields[1] = fields[2] = name
+        fields[14] = str(rng.randint(15000, 10 ** 7))
+        fields[17] = rng.choice(zones)
+        yield '\t'.join(fields) + '\n'
+
+
+def percentiles(names: List[str]) -> str:
+    """
+    Time a lookup of each name and return latency percentiles.
+    """
+    timings = []
+    for name in names:
+        start = time.perf_counter()
+        tzcity.tzcity(name)
+        timings.append((time.perf_counter() - start) * 1e6)
+    cuts = statistics.quantiles(timings, n=100)
+    return f"p50 {cuts[49]:.2f} us, p99 {cuts[98]:.2f} us"
+
+
+def timed(label: str, func: Callable[[], T]) -> T:
+    """
+    Call func, print the time it took and return its result.
+    """
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<18}{(time.perf_counter() - start) * 1e3:8.1f} ms")
+    return result
+
+
+def rebuild() -> None:
+    """
+    Build the lookup index of all sources from scratch.
+    """
+    core._dict_index.cache_clear()
+    core._dict_index()
+
+
+def main() -> None:
+    """
+    Time reading and adding the source, rebuilding and lookups.
+    """
+    rng = random.Random(0)
+    lines = list(geonames(rng))
+    tzcity.tzcity('london')  # build the index of the bundled data
+
+    source = timed('read_geonames', lambda: read_geonames(lines))
+    timed('add_source', lambda: add_source(source))
+    print(f"{'names':<18}{len(core._index()):8d}")
+    timed('add small source',
+          lambda: add_source({'Asia/Kolkata': ['springfield']}))
+    timed('full rebuild', rebuild)
+
+    names = [city for cities in source.values() for city in cities]
+    print(f"{'lookups':<18}{percentiles(rng.sample(names, 100_000))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""
+Benchmark suite of tzcity
+
+With tzcity installed (see CONTRIBUTING.md), run
+
+    python benchmarks/run.py --output results.json
+
+to time every workload and save the results as JSON. Results of another
+run, say from an earlier commit, can be compared against with
+
+    python benchmarks/run.py --compare results.json
+
+Workloads can be picked by giving their names as arguments.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+import tzcity
+import tzcity.cache
+from tzcity.data import CITY_DICT
+
+# Number of timings taken of each workload
+REPEAT = 7
+
+# Number of lookups done by the bulk workloads
+BULK_SIZE = 100_000
+
+
+def _zones() -> List[str]:
+    return list(CITY_DICT)
+
+
+def _aliases() -> List[str]:
+    return [city for cities in CITY_DICT.values() for city in cities]
+
+
+def _tails() -> List[str]:
+    return [tz.split('/')[-1].replace('_', ' ') for tz in CITY_DICT]
+
+
+def _zipf(names: List[str], size: int, exponent: float = 1.1) -> List[str]:
+    """
+    Return size names drawn with a Zipfian distribution over their order.
+    """
+    weights = [1 / rank ** exponent for rank in range(1, len(names) + 1)]
+    return random.Random(0).choices(names, weights, k=size)
+
+
+def _variants(names: List[str]) -> List[str]:
+    """
+    Return names written differently at random, as in raw input.
+    """
+    rng = random.Random(0)
+    forms = [str.title, str.upper, lambda name: f" {name} ",
+             lambda name: name.replace(' ', '-')]
+    return [rng.choice(forms)(name) for name in names]
+
+
+def _cached(func: Callable[[], None]) -> Callable[[], None]:
+    """
+    Return a function calling func with an empty result cache enabled,
+    large enough for the distinct names of the bulk workloads.
+    """
+    def run() -> None:
+        tzcity.cache.enable(maxsize=4096)
+        try:
+            func()
+        finally:
+            tzcity.cache.disable()
+    return run
+
+
+def _each(func: Callable[[str], object],
+          names: List[str]) -> Callable[[], None]:
+    """
+    Return a function calling func with each name, ignoring ValueError.
+    """
+    def run() -> None:
+        for name in names:
+            try:
+                func(name)
+            except ValueError:
+                pass
+    return run
+
+
+def _cold_import(code: str) -> Callable[[], None]:
+    """
+    Return a function running code in a new interpreter.
+    """
+    def run() -> None:
+        subprocess.run([sys.executable, '-c', code], check=True)
+    return run
+
+
+def workloads() -> Dict[str, Tuple[Callable[[], object], int]]:
+    """
+    Return the benchmarked workloads by name, each with the number of
+    operations it does.
+    """
+    front = _tails()[:20]
+    tail = _tails()[-20:]
+    misses = [f"unknown city {i}" for i in range(20)]
+    aliases = _aliases()[::len(_aliases()) // 20][:20]
+    zones = _zones()[::len(_zones()) // 20][:20]
+    zipf = _zipf(_tails() + _aliases(), BULK_SIZE)
+    variants = _variants(zipf)
+    free_text = [f"{name} city" for name in _aliases()[:20]]
+    folded = [name.upper().replace(' ', '-') + '.' for name in front]
+    records = [f"Software engineer, {name.title()} / remote (since 2019)"
+               for name in front]
+    return {
+        'hit_front': (_each(tzcity.tzcity, front), len(front)),
+        'hit_tail': (_each(tzcity.tzcity, tail), len(tail)),
+        'miss': (_each(tzcity.tzcity, misses), len(misses)),
+        'hit_alias': (_each(tzcity.tzcity, aliases), len(aliases)),
+        'hit_zone': (_each(tzcity.tzcity, zones), len(zones)),
+        'hit_folded': (_each(tzcity.tzcity, folded), len(folded)),
+        'bulk_zipf_loop': (_each(tzcity.tzcity, zipf), len(zipf)),
+        'bulk_zipf_many': (lambda: list(tzcity.tzcity_many(zipf)),
+                           len(zipf)),
+        'extract_record': (_each(tzcity.extract, records), len(records)),
+        'bulk_variants_loop': (_each(tzcity.tzcity, variants),
+                               len(variants)),
+        'bulk_variants_cached': (_cached(_each(tzcity.tzcity, variants)),
+                                 len(variants)),
+        'capitalize_zone': (_each(tzcity.capitalize, zones), len(zones)),
+        'capitalize_text': (_each(tzcity.capitalize, free_text),
+                            len(free_text)),
+        'import_cold': (_cold_import('import tzcity'), 1),
+        'import_first_lookup': (
+            _cold_import('import tzcity; tzcity.tzcity("london")'), 1),
+    }
+
+
+def measure(func: Callable[[], object], operations: int) -> Dict[str, float]:
+    """
+    Time func and return statistics of the time per operation in
+    microseconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = [total / number / operations * 1e6
+               for total in timer.repeat(repeat=REPEAT, number=number)]
+    return {
+        'min_us': min(timings),
+        'median_us': statistics.median(timings),
+        'max_us': max(timings),
+        'operations': operations,
+        'loops': number,
+    }
+
+
+def main(argv: List[str]) -> None:
+    """
+    Run the benchmarks selected by command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('names', nargs='*', help="workloads to run")
+    parser.add_argument('--output', help="file to save results as JSON")
+    parser.add_argument('--compare', help="JSON results to compare with")
+    args = parser.parse_args(argv)
+
+    available = workloads()
+    names = args.names or list(available)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+
+    results = {}
+    for name in names:
+        func, operations = available[name]
+        results[name] = measure(func, operations)
+        line = f"{name:<20} {results[name]['median_us']:>12.3f} us"
+        if name in baseline:
+            ratio = results[name]['median_us'] / baseline[name]['median_us']
+            line += f" {ratio:>8.2f}x"
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'results': results,
+            }, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,7 +1,57 @@
+import asyncio
+import contextlib
+import http.client
+import io
+import json
+import os
+import random
+import runpy
+import socketserver
+import subprocess
+import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
+import tzcity.cache
+import tzcity.cli
+import tzcity.compiler
 import tzcity.core
+import tzcity.fuzzy
+import tzcity.geo
+import tzcity.iana
+import tzcity.offset
+import tzcity.profiling
+import tzcity.server
+import tzcity.shared
+import tzcity.sources
+import tzcity.stats
+import tzcity.text
 import tzcity
+from tzcity.data import CITY_DICT, COORDINATES
+
+
+def _linear_tzcity(city):
+    """Reference implementation: linear scan over CITY_DICT"""
+    city = city.strip().lower()
+    for tz in CITY_DICT:
+        if tz == city:
+            return tzcity.capitalize(tz)
+        if city == tz.split('/')[-1].replace('_', ' '):
+            return tzcity.capitalize(tz)
+        if city in CITY_DICT[tz]:
+            return tzcity.capitalize(tz)
+    raise ValueError(city)
+
+
+_ALL_NAMES = sorted({
+    name
+    for tz, cities in CITY_DICT.items()
+    for name in [tz, tz.split('/')[-1].replace('_', ' '), *cities]
+})
 
 
 class TestTZCity:
@@ -24,6 +74,1590 @@ class TestTZCity:
         with pytest.raises(ValueError):
             tzcity.tzcity(city)
 
+    @pytest.mark.parametrize('city', _ALL_NAMES)
+    def test_index_parity(self, city):
+        assert tzcity.tzcity(city) == _linear_tzcity(city)
+
+    def test_index_first_match_wins(self):
+        city_dict = {
+            'asia/one': ['shared', 'two'],
+            'asia/two': ['shared'],
+        }
+        index = tzcity.core._build_index(city_dict)
+        assert index['shared'] == 'asia/one'
+        assert index['two'] == 'asia/one'
+        assert index['one'] == 'asia/one'
+        assert index['asia/two'] == 'asia/two'
+
+
+class TestFold:
+    @pytest.mark.parametrize('city,expected', [
+        ('São Paulo', 'America/Sao_Paulo'),
+        ('ZÜRICH', 'Europe/Zurich'),
+        ('Ho Chi Minh City', 'Asia/Ho_Chi_Minh'),
+        ("St. John's", 'America/St_Johns'),
+        ('St Petersburg', 'Europe/Moscow'),
+        ('saint petersburg', 'Europe/Moscow'),
+        ('  new   york ', 'America/New_York'),
+        ('Port-au Prince', 'America/Port-au-Prince'),
+        ('cote d\u2019ivoire', 'Africa/Abidjan'),
+        ('N\u2019Djamena', 'Africa/Ndjamena'),
+        ('america/new york', 'America/New_York'),
+        ('Kuwait City', 'Asia/Kuwait'),
+    ])
+    def test_variants(self, city, expected):
+        assert tzcity.tzcity(city) == expected
+        assert list(tzcity.tzcity_many([city])) == [expected]
+        assert tzcity.candidates(city)[0].tz == expected
+        assert tzcity.tzcity_fuzzy(city) == (expected, 1.0)
+
+    @pytest.mark.parametrize('city', ['Atlantis City', 'Wonder–land', ''])
+    def test_unknown(self, city):
+        with pytest.raises(ValueError):
+            tzcity.tzcity(city)
+        assert not tzcity.candidates(city)
+
+    @pytest.mark.parametrize('name,expected', [
+        ('tromsø', 'tromso'),
+        ('ærøskøbing', 'aeroskobing'),
+        ('ﬁji', 'fiji'),
+        ('straße', 'strasse'),
+        ('foo\u00a0–\u00a0bar', 'foo bar'),
+        ("st. john's", 'saint johns'),
+        ('ste-foy', 'sainte foy'),
+        ('a_b/c', 'a b/c'),
+        ('', ''),
+    ])
+    def test_fold(self, name, expected):
+        assert tzcity.core._fold(name) == expected
+
+    def test_fast_path(self, monkeypatch):
+        def fold(name):
+            raise AssertionError(name)
+
+        monkeypatch.setattr(tzcity.core, '_fold', fold)
+        assert tzcity.tzcity(' London') == 'Europe/London'
+        assert list(tzcity.tzcity_many(['paris'])) == ['Europe/Paris']
+
+    def test_no_collisions(self):
+        folded = {}
+        for name, tz in tzcity.core._index().items():
+            folded.setdefault(tzcity.core._fold(name), set()).add(tz)
+        assert all(len(zones) == 1 for zones in folded.values())
+
+    def test_stats(self):
+        stats = tzcity.stats.enable()
+        try:
+            tzcity.tzcity('Zürich')
+            tzcity.tzcity('St. Petersburg')
+        finally:
+            tzcity.stats.disable()
+        assert stats.snapshot()['hits'] == {
+            'zone': 0, 'tz city': 1, 'alias': 1}
+        assert stats.snapshot()['top_aliases'] == [('st petersburg', 1)]
+
+
+class TestCandidates:
+    def test_single(self):
+        assert tzcity.candidates(' Mumbai') == [
+            tzcity.core.Candidate('Asia/Kolkata', 'alias', 242)]
+        assert tzcity.candidates('kolkata') == [
+            ('Asia/Kolkata', 'tz city', 242)]
+        assert tzcity.candidates('asia/kolkata') == [
+            ('Asia/Kolkata', 'zone', 242)]
+
+    def test_unknown(self):
+        assert tzcity.candidates('wonderland') == []
+
+    @pytest.mark.parametrize('city', _ALL_NAMES)
+    def test_first(self, city):
+        assert tzcity.candidates(city)[0].tz == tzcity.tzcity(city)
+
+    def test_multiple(self):
+        city_dict = {
+            'asia/one': ['shared', 'two', 'one'],
+            'asia/two': ['shared'],
+        }
+        index = tzcity.core._build_multi_index(city_dict)
+        assert index['shared'] == (('Asia/One', 'alias', 0),
+                                   ('Asia/Two', 'alias', 1))
+        assert index['two'] == (('Asia/One', 'alias', 0),
+                                ('Asia/Two', 'tz city', 1))
+        assert index['one'] == (('Asia/One', 'tz city', 0),)
+
+    def test_no_collisions(self):
+        # Names shared by time zones hide all but one of them from
+        # tzcity(). Make them intentional by listing them here.
+        assert tzcity.core.collisions() == {}
+
+
+class TestCitiesFor:
+    def test_cities_for(self):
+        cities = tzcity.cities_for(' Asia/Kolkata')
+        assert cities[:4] == ('Kolkata', 'India', 'New Delhi', 'Delhi')
+        assert tzcity.cities_for('africa/ceuta') == ('Ceuta',)
+
+    def test_display_label(self):
+        assert tzcity.display_label('asia/kolkata') == \
+            'Asia/Kolkata (India, New Delhi)'
+        assert tzcity.display_label('Africa/Ceuta') == 'Africa/Ceuta'
+
+    def test_tz_city_alias(self):
+        for tz in CITY_DICT:
+            cities = tzcity.cities_for(tz)
+            assert len(set(cities)) == len(cities)
+
+    def test_shared(self):
+        assert tzcity.cities_for('europe/london') is \
+            tzcity.cities_for('Europe/London')
+        assert tzcity.display_label('europe/london') is \
+            tzcity.display_label('Europe/London')
+
+    @pytest.mark.parametrize('zone', ['mumbai', 'asia/mumbai', ''])
+    def test_unknown(self, zone):
+        with pytest.raises(ValueError):
+            tzcity.cities_for(zone)
+        with pytest.raises(ValueError):
+            tzcity.display_label(zone)
+
+
+def _linear_nearest(lat, lon):
+    x, y, z = tzcity.geo._vector(lat, lon)
+    return max(tzcity.geo._cities(),
+               key=lambda city: city[1] * x + city[2] * y + city[3] * z)[0]
+
+
+class TestNearest:
+    @pytest.mark.parametrize('lat,lon,expected', [
+        (51.5, -0.1, 'Europe/London'),
+        (40.7, -74.0, 'America/New_York'),
+        (22.6, 88.4, 'Asia/Kolkata'),
+        (-33.9, 151.2, 'Australia/Sydney'),
+        (90, 0, 'Arctic/Longyearbyen'),
+        (-90, 0, 'Antarctica/Vostok'),
+        (-21.0, 180, 'Pacific/Fiji'),
+        (-21.0, -180, 'Pacific/Fiji'),
+    ])
+    def test_nearest(self, lat, lon, expected):
+        assert tzcity.nearest(lat, lon) == expected
+
+    @pytest.mark.parametrize('lat,lon', [
+        (90.1, 0), (-91, 0), (0, 180.5), (0, -181), (float('nan'), 0),
+    ])
+    def test_out_of_range(self, lat, lon):
+        with pytest.raises(ValueError):
+            tzcity.nearest(lat, lon)
+        with pytest.raises(ValueError):
+            list(tzcity.nearest_many([(lat, lon)]))
+
+    def test_linear(self):
+        rng = random.Random(0)
+        points = [(rng.uniform(-90, 90), rng.uniform(-180, 180))
+                  for _ in range(2000)]
+        points += [(lat, lon) for lat, lon in COORDINATES.values()]
+        points += [(90, 180), (-90, -180), (0, 180)]
+        expected = [_linear_nearest(lat, lon) for lat, lon in points]
+        assert [tzcity.nearest(lat, lon) for lat, lon in points] == expected
+        assert list(tzcity.nearest_many(points)) == expected
+
+    def test_cities(self):
+        assert len(tzcity.geo._cities()) == len(CITY_DICT)
+
+
+class TestExtract:
+    @pytest.fixture(autouse=True)
+    def clear(self):
+        yield
+        tzcity.sources.clear_sources()
+
+    def test_extract(self):
+        text = "Software engineer, Bangalore / remote (IST)"
+        assert tzcity.extract(text) == [
+            ('Bangalore', 'Asia/Kolkata', 19, 28)]
+        assert text[19:28] == 'Bangalore'
+
+    @pytest.mark.parametrize('text,expected', [
+        ('Moved from Equatorial Guinea to Guinea-Bissau',
+         [('Equatorial Guinea', 'Africa/Malabo', 11, 28),
+          ('Guinea-Bissau', 'Africa/Bissau', 32, 45)]),
+        ('asia/kolkata and America/New_York',
+         [('Asia/Kolkata', 'Asia/Kolkata', 0, 12),
+          ('America/New_York', 'America/New_York', 17, 33)]),
+        ('Bangalore/remote', [('Bangalore', 'Asia/Kolkata', 0, 9)]),
+        ('ST. PETERSBURG', [('St Petersburg', 'Europe/Moscow', 0, 14)]),
+        ('S\u00e3o Paulo, C\u00f4te d\u2019Ivoire',
+         [('Sao Paulo', 'America/Sao_Paulo', 0, 9),
+          ("Cote d'Ivoire", 'Africa/Abidjan', 11, 24)]),
+        ('Sa\u0303o Paulo', [('Sao Paulo', 'America/Sao_Paulo', 0, 10)]),
+        ('Londonderry, Parisian', []),
+        ('', []),
+    ])
+    def test_matches(self, text, expected):
+        assert tzcity.extract(text) == expected
+
+    def test_sources(self):
+        assert tzcity.extract('Springfield') == []
+        tzcity.sources.add_source({'America/Chicago': ['Springfield']})
+        assert tzcity.extract('Springfield') == [
+            ('Springfield', 'America/Chicago', 0, 11)]
+
+
+class TestLazyData:
+    @pytest.mark.skipif(sys.version_info < (3, 7),
+                        reason="data is loaded on import before Python 3.7")
+    def test_import_skips_data(self):
+        code = "import sys, tzcity; print('tzcity.data' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                stdout=subprocess.PIPE).stdout
+        assert output.strip() == b'False'
+
+    @pytest.mark.skipif(sys.version_info < (3, 7),
+                        reason="imported with tzcity before Python 3.7")
+    def test_import_skips_modules(self):
+        code = "import sys, tzcity; print(*sorted(sys.modules))"
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                stdout=subprocess.PIPE).stdout
+        modules = [module for module in output.split()
+                   if module.startswith(b'tzcity')]
+        assert modules == [b'tzcity', b'tzcity.core']
+        assert b'unicodedata' not in output.split()
+
+    def test_city_dict(self):
+        assert tzcity.core.CITY_DICT is CITY_DICT
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            tzcity.core.NOT_AN_ATTRIBUTE
+
+
+# Forks workers which look up cities with and without a shared table and
+# prints the largest growth of private dirty memory of a worker for each.
+_RSS_SCRIPT = textwrap.dedent('''
+    import os, sys
+    import tzcity
+    import tzcity.shared
+
+    def private_dirty():
+        with open('/proc/self/smaps_rollup') as smaps:
+            for line in smaps:
+                if line.startswith('Private_Dirty:'):
+                    return int(line.split()[1])
+
+    def worker(path):
+        before = private_dirty()
+        tzcity.shared.use_table(path)
+        for city in ['london', 'new york', 'mumbai', 'asia/kolkata',
+                     'Sao-Paulo', 'Mumbai City']:
+            tzcity.tzcity(city)
+        return private_dirty() - before
+
+    for path in [sys.argv[1], None]:
+        deltas = []
+        for _ in range(4):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.write(write_fd, str(worker(path)).encode())
+                os._exit(0)
+            os.close(write_fd)
+            deltas.append(int(os.read(read_fd, 64)))
+            os.close(read_fd)
+            os.waitpid(pid, 0)
+        print(max(deltas))
+''')
+
+
+# Builds the data and every index used by lookups, capitalization and
+# completion, and prints the bytes they retain and whether CITY_DICT was
+# loaded.
+_MEMORY_SCRIPT = textwrap.dedent('''
+    import sys, tracemalloc
+    import tzcity
+
+    tracemalloc.start()
+    tzcity.tzcity('london')
+    tzcity.tzcity('Sao-Paulo')
+    tzcity.capitalize('new york')
+    tzcity.candidates('springfield')
+    tzcity.cities_for('asia/kolkata')
+    tzcity.complete('lon')
+    print(tracemalloc.get_traced_memory()[0], 'tzcity.data' in sys.modules)
+''')
+
+# Bytes which the data and its indexes may retain, about a third more than
+# they take now
+_MEMORY_BUDGET = 1024 * 1024
+
+
+def _geonames_line(name, alternate_names, population, tz):
+    fields = [''] * 19
+    fields[1] = name
+    fields[2] = name.replace('ã', 'a')
+    fields[3] = alternate_names
+    fields[14] = population
+    fields[17] = tz
+    return '\t'.join(fields) + '\n'
+
+
+_GEONAMES = ''.join([
+    _geonames_line('Springfield', 'Springfeld,Sprngfld', '116250',
+                   'America/Chicago'),
+    _geonames_line('Springfield', '', '155929', 'America/New_York'),
+    _geonames_line('São Paulo', '', '10021295', 'America/Sao_Paulo'),
+    _geonames_line('Nowhere', '', '', ''),
+    '\n',
+])
+
+
+class TestSources:
+    @pytest.fixture(autouse=True)
+    def clear(self):
+        yield
+        tzcity.sources.clear_sources()
+
+    def test_add(self):
+        tzcity.sources.add_source({'Asia/Kolkata': ['Springfield ']})
+        assert tzcity.tzcity('springfield') == 'Asia/Kolkata'
+        tzcity.sources.add_source({'Europe/Atlantis': ['Poseidonia']})
+        assert tzcity.tzcity('atlantis') == 'Europe/Atlantis'
+        assert tzcity.tzcity('poseidonia') == 'Europe/Atlantis'
+
+    def test_precedence(self):
+        tzcity.sources.add_source({'Asia/Kolkata': ['london', 'spam']})
+        assert tzcity.tzcity('london') == 'Europe/London'
+        tzcity.sources.add_source({'Asia/Tokyo': ['spam']})
+        assert tzcity.tzcity('spam') == 'Asia/Kolkata'
+        tzcity.sources.add_source({'Asia/Tokyo': ['london']}, override=True)
+        assert tzcity.tzcity('london') == 'Asia/Tokyo'
+        tzcity.sources.add_source({'Asia/Dubai': ['london']}, override=True)
+        assert tzcity.tzcity('london') == 'Asia/Dubai'
+        assert [candidate.tz for candidate in tzcity.candidates('london')] \
+            == ['Asia/Dubai', 'Asia/Tokyo', 'Europe/London', 'Asia/Kolkata']
+
+    def test_capitalization(self):
+        tzcity.sources.add_source({'Europe/Paris': [
+            'Saint-Jean-de-Luz', 'Saint-Martin-de-Ré', "d'"]})
+        assert tzcity.cities_for('europe/paris')[-3:] == (
+            'Saint-Jean-de-Luz', 'Saint-Martin-de-Ré', "D'")
+        assert tzcity.display_label('europe/london') == (
+            'Europe/London (United Kingdom, UK)')
+        assert tzcity.extract('Back from Saint-Jean-de-Luz') == [
+            tzcity.text.Match('Saint-Jean-de-Luz', 'Europe/Paris', 10, 27)]
+        assert tzcity.complete("d'") == [("D'", 'Europe/Paris')]
+
+    @pytest.mark.parametrize('first_lookup', ['', 'london', 'zürich'])
+    def test_incremental(self, first_lookup):
+        if first_lookup:
+            tzcity.tzcity(first_lookup)
+        tzcity.sources.add_source({'Asia/Kolkata': ['london', 'spam']})
+        tzcity.sources.add_source({'Asia/Tokyo': ['eggs', 'kyoto']})
+        tzcity.sources.add_source({'Asia/Dubai': ['spam', 'paris']},
+                                  override=True)
+        index = dict(tzcity.core._dict_index())
+        folded = dict(tzcity.core._folded_index())
+        tzcity.core._reset_index()
+        assert index == tzcity.core._dict_index()
+        assert folded == tzcity.core._folded_index()
+        assert index['paris'] == 'asia/dubai'
+        assert index['london'] == 'europe/london'
+
+    def test_derived(self):
+        assert not tzcity.complete('springf')
+        assert not tzcity.candidates('springfield')
+        tzcity.sources.add_source({'Asia/Kolkata': ['springfield']})
+        assert tzcity.complete('springf') == [
+            ('Springfield', 'Asia/Kolkata')]
+        assert tzcity.tzcity_fuzzy('springfeld')[0] == 'Asia/Kolkata'
+        assert tzcity.candidates('springfield') == [
+            tzcity.core.Candidate('Asia/Kolkata', 'alias', len(CITY_DICT))]
+        assert tzcity.cities_for('asia/kolkata')[-1] == 'Springfield'
+
+    def test_clear(self):
+        tzcity.sources.add_source({'Asia/Kolkata': ['springfield']})
+        tzcity.sources.clear_sources()
+        with pytest.raises(ValueError):
+            tzcity.tzcity('springfield')
+        assert not tzcity.complete('springf')
+
+    def test_read_csv(self):
+        lines = io.StringIO('tz,city\nAsia/Kolkata,Springfield\n'
+                            'Asia/Kolkata,Shelbyville\nAsia/Tokyo,Kyoto\n')
+        assert tzcity.sources.read_csv(lines) == {
+            'Asia/Kolkata': ['Springfield', 'Shelbyville'],
+            'Asia/Tokyo': ['Kyoto'],
+        }
+
+    @pytest.mark.parametrize('text', ['name,tz\nspam,Asia/Tokyo\n', ''])
+    def test_read_csv_columns(self, text):
+        with pytest.raises(ValueError):
+            tzcity.sources.read_csv(io.StringIO(text))
+
+    def test_read_geonames(self):
+        cities = tzcity.sources.read_geonames(io.StringIO(_GEONAMES))
+        assert cities == {
+            'America/Sao_Paulo': ['são paulo', 'sao paulo'],
+            'America/New_York': ['springfield'],
+        }
+
+    def test_read_geonames_alternate_names(self):
+        cities = tzcity.sources.read_geonames(io.StringIO(_GEONAMES),
+                                              alternate_names=True)
+        assert cities['America/Chicago'] == ['springfeld', 'sprngfld']
+        tzcity.sources.add_source(cities)
+        assert tzcity.tzcity('sprngfld') == 'America/Chicago'
+        assert tzcity.tzcity('sao paulo') == 'America/Sao_Paulo'
+
+
+class TestCompiler:
+    def test_valid(self):
+        assert tzcity.compiler.validate(CITY_DICT, COORDINATES) == []
+
+    def test_up_to_date(self):
+        assert tzcity.compiler.main(['--check']) == 0
+
+    def test_problems(self):
+        assert tzcity.compiler.validate({
+            'europe/london': ['Foo', 'bar', 'bar', 'são paulo'],
+            'europe/paris': ['bar', 'sao paulo'],
+        }) == [
+            "'Foo' of europe/london: Not normalized",
+            "'bar' of europe/london: Listed more than once",
+            "'bar': Associated with Europe/London as alias, "
+            "Europe/Paris as alias",
+            "'são paulo' and 'sao paulo': Same when folded",
+        ]
+
+    def test_not_in_database(self):
+        pytest.importorskip('zoneinfo')
+        assert tzcity.compiler.validate({'europe/atlantis': []}) == [
+            "europe/atlantis: Not in the time zone database",
+        ]
+
+    def test_coordinate_problems(self):
+        assert tzcity.compiler.validate({
+            'europe/london': [],
+            'europe/paris': [],
+            'europe/rome': [],
+        }, {
+            'europe/london': (51.51, -0.12),
+            'europe/paris': (48.87, 182.33),
+            'europe/atlantis': (36.0, -25.0),
+        }) == [
+            "europe/rome: No coordinates",
+            "europe/paris: Coordinates out of range",
+            "europe/atlantis: Coordinates of unknown time zone",
+        ]
+
+    def test_capitalization(self):
+        pytest.importorskip('zoneinfo')
+        assert tzcity.compiler.validate({'etc/gmt+5': []}) == [
+            "etc/gmt+5: Capitalized as Etc/Gmt+5, not Etc/GMT+5 as in the "
+            "time zone database",
+        ]
+
+    def test_without_zoneinfo(self, monkeypatch):
+        tzcity.iana._database.cache_clear()
+        monkeypatch.setitem(sys.modules, 'zoneinfo', None)
+        try:
+            assert tzcity.compiler.validate({'europe/atlantis': []}) == []
+        finally:
+            tzcity.iana._database.cache_clear()
+
+    def test_generate(self):
+        namespace = {}
+        exec(tzcity.compiler.generate({
+            'europe/london': ['london'],
+            'europe/paris': ['paris', 'lutetia'],
+        }), namespace)
+        assert namespace['ZONES'] == 'europe/london\neurope/paris'
+        assert namespace['ZONE_CAPS'] == 'Europe/London\nEurope/Paris'
+        zones = namespace['ZONES'].split('\n')
+        assert dict(zip(namespace['NAMES'].split('\n'),
+                        [zones[ord(char)]
+                         for char in namespace['NAME_ZONES']])) == {
+            'europe/london': 'europe/london', 'london': 'europe/london',
+            'europe/paris': 'europe/paris', 'paris': 'europe/paris',
+            'lutetia': 'europe/paris',
+        }
+
+    def test_write(self, tmp_path):
+        path = str(tmp_path / 'compiled.py')
+        assert tzcity.compiler.main(['--check', '--output', path]) == 1
+        assert tzcity.compiler.main(['--output', path]) == 0
+        assert tzcity.compiler.main(['--check', '--output', path]) == 0
+        with open(path, 'a') as compiled:
+            compiled.write('#')
+        assert tzcity.compiler.main(['--check', '--output', path]) == 1
+
+    def test_invalid(self, monkeypatch, capsys):
+        monkeypatch.setattr(tzcity.compiler, 'validate',
+                            lambda city_dict, coordinates: ['problem'])
+        assert tzcity.compiler.main(['--check']) == 1
+        assert capsys.readouterr().err == 'problem\n'
+
+    @pytest.mark.filterwarnings('ignore::RuntimeWarning')
+    def test_module(self, monkeypatch):
+        monkeypatch.setattr(sys, 'argv', ['tzcity.compiler', '--check'])
+        with pytest.raises(SystemExit) as exc_info:
+            runpy.run_module('tzcity.compiler', run_name='__main__')
+        assert exc_info.value.code == 0
+
+
+# Part of a tzdata.zi file of the time zone database, standing in for the
+# installed one
+_TZDATA_ZI = textwrap.dedent('''\
+    # version 2024a
+    Z Antarctica/DumontDUrville 0 - -00 1947
+    10 - +10
+    Z Asia/Kolkata 5:53:28 - LMT 1854 Jun 28
+    5:30 - IST
+    Z Etc/GMT+5 -5 - -05
+    Z Europe/Kyiv 2:2:4 - LMT 1880
+    2 E EE%sT
+    L Asia/Kolkata Asia/Calcutta
+    L Europe/Kyiv Europe/Kiev
+''')
+
+
+class TestIANA:
+    @pytest.fixture(autouse=True)
+    def clear(self, monkeypatch, tmp_path):
+        zoneinfo = pytest.importorskip('zoneinfo')
+        (tmp_path / 'tzdata.zi').write_text(_TZDATA_ZI)
+        monkeypatch.setattr(zoneinfo, 'TZPATH', (str(tmp_path),))
+        tzcity.iana._database.cache_clear()
+        yield
+        tzcity.iana._database.cache_clear()
+
+    @pytest.mark.parametrize('tz,expected', [
+        ('asia/kolkata', 'Asia/Kolkata'),
+        ('ETC/GMT+5', 'Etc/GMT+5'),
+        ('antarctica/dumontdurville', 'Antarctica/DumontDUrville'),
+        ('asia/calcutta', 'Asia/Calcutta'),
+        ('europe/atlantis', None),
+    ])
+    def test_iana_name(self, tz, expected):
+        assert tzcity.iana.iana_name(tz) == expected
+
+    @pytest.mark.parametrize('tz,expected', [
+        ('asia/kolkata', 'Asia/Kolkata'),
+        ('asia/calcutta', 'Asia/Kolkata'),
+        ('Europe/Kiev', 'Europe/Kyiv'),
+        ('europe/atlantis', None),
+    ])
+    def test_canonical_name(self, tz, expected):
+        assert tzcity.iana.canonical_name(tz) == expected
+
+    def test_check(self):
+        differences = tzcity.iana.check()
+        assert 'europe/london' in differences.missing
+        assert 'asia/kolkata' not in differences.missing
+        assert differences.renamed == {'europe/kiev': 'Europe/Kyiv'}
+        assert differences.capitalization == {}
+
+    def test_check_city_dict(self):
+        assert tzcity.iana.check({
+            'asia/calcutta': [],
+            'etc/gmt+5': [],
+            'europe/atlantis': [],
+        }) == (['europe/atlantis'], {'asia/calcutta': 'Asia/Kolkata'},
+               {'etc/gmt+5': 'Etc/GMT+5'})
+
+    def test_read_tzdata(self):
+        assert tzcity.iana._read_tzdata([
+            '# version 2024a\n',
+            'R E 1981 ma - Mar lastSu 1u 1 S\n',
+            'Z Europe/Kyiv 2:2:4 - LMT 1880\n',
+            '2 E EE%sT\n',
+            'L Europe/Kyiv Europe/Kiev\n',
+        ]) == ({'europe/kyiv': 'Europe/Kyiv', 'europe/kiev': 'Europe/Kiev'},
+               {'europe/kiev': 'Europe/Kyiv'})
+
+    def test_without_tzdata_zi(self, monkeypatch, tmp_path):
+        import zoneinfo
+        monkeypatch.setattr(zoneinfo, 'TZPATH', (str(tmp_path / 'empty'),))
+        monkeypatch.setattr(zoneinfo, 'available_timezones',
+                            lambda: {'Asia/Kolkata', 'Etc/GMT+5'})
+        assert tzcity.iana.iana_name('etc/gmt+5') == 'Etc/GMT+5'
+        assert tzcity.iana.canonical_name('asia/kolkata') == 'Asia/Kolkata'
+        assert tzcity.iana.iana_name('asia/calcutta') is None
+
+    def test_source_capitalization(self, monkeypatch):
+        monkeypatch.setattr(tzcity.core, '_TZ_CAPS', {})
+        tzcity.sources.add_source({'Etc/GMT+5': ['somewhere west']})
+        try:
+            assert tzcity.tzcity('somewhere west') == 'Etc/GMT+5'
+        finally:
+            tzcity.sources.clear_sources()
+
+    def test_source_without_zoneinfo(self, monkeypatch):
+        monkeypatch.setattr(tzcity.core, '_TZ_CAPS', {})
+        monkeypatch.setitem(sys.modules, 'zoneinfo', None)
+        tzcity.sources.add_source({'etc/gmt+5': ['somewhere west']})
+        try:
+            assert tzcity.tzcity('somewhere west') == 'Etc/Gmt+5'
+        finally:
+            tzcity.sources.clear_sources()
+
+
+class TestSharedTable:
+    @pytest.fixture
+    def table(self, tmp_path):
+        path = str(tmp_path / 'tzcity.table')
+        tzcity.shared.build_table(path)
+        tzcity.shared.use_table(path)
+        yield path
+        tzcity.shared.use_table(None)
+
+    @pytest.mark.usefixtures('table')
+    def test_parity(self):
+        assert isinstance(tzcity.core._index(), tzcity.shared.SharedTable)
+        for city in _ALL_NAMES:
+            assert tzcity.tzcity(city) == _linear_tzcity(city)
+
+    @pytest.mark.usefixtures('table')
+    def test_mapping(self):
+        shared = tzcity.core._index()
+        index = tzcity.core._dict_index()
+        assert len(shared) == len(index)
+        assert list(shared) == list(index)
+        assert shared['xi\'an'] == 'asia/shanghai'
+        assert 'wonderland' not in shared
+
+    @pytest.mark.usefixtures('table')
+    @pytest.mark.parametrize('city', ['wonderland', 'lond\udcffon'])
+    def test_invalid(self, city):
+        with pytest.raises(ValueError):
+            tzcity.tzcity(city)
+        assert city not in tzcity.core._index()
+
+    @pytest.mark.usefixtures('table')
+    def test_folded(self):
+        assert tzcity.tzcity('Sao-Paulo') == 'America/Sao_Paulo'
+        assert tzcity.tzcity('Mumbai City') == 'Asia/Kolkata'
+        assert tzcity.explain('Sao-Paulo').match == 'folded'
+        assert tzcity.core._folded_index.cache_info().currsize == 0
+        folded = tzcity.core._folded()
+        expected = tzcity.core._build_folded_index(tzcity.core._dict_index())
+        assert len(folded) == len(expected)
+        assert dict(folded) == expected
+        assert 'lond\udcffon' not in folded
+
+    @pytest.mark.usefixtures('table')
+    def test_capitalize(self):
+        assert tzcity.capitalize('africa/dar_es_salaam') == (
+            'Africa/Dar_es_Salaam')
+        assert tzcity.capitalize('dar es salaam') == 'Dar es Salaam'
+
+    @pytest.mark.usefixtures('table')
+    def test_sources(self):
+        try:
+            tzcity.sources.add_source({'Asia/Kolkata': ['Springfield',
+                                                        'london']})
+            tzcity.sources.add_source({'Asia/Tokyo': ['London']},
+                                      override=True)
+            for city in ['springfield', 'Springfield.', 'london',
+                         'mumbai']:
+                assert tzcity.tzcity(city) == \
+                    tzcity.candidates(city)[0].tz.title()
+            assert tzcity.tzcity('london') == 'Asia/Tokyo'
+            index = tzcity.core._index()
+            assert len(index) == len(tzcity.core._dict_index())
+            assert dict(index) == tzcity.core._dict_index()
+            assert 'wonderland' not in index
+        finally:
+            tzcity.sources.clear_sources()
+        assert isinstance(tzcity.core._index(), tzcity.shared.SharedTable)
+        assert tzcity.tzcity('london') == 'Europe/London'
+
+    def test_not_a_table(self, tmp_path):
+        path = tmp_path / 'not.table'
+        path.write_bytes(b'\0' * 64)
+        with pytest.raises(ValueError):
+            tzcity.shared.use_table(str(path))
+
+    @pytest.mark.skipif(not os.path.exists('/proc/self/smaps_rollup'),
+                        reason="needs /proc/self/smaps_rollup")
+    def test_fork_rss(self, tmp_path):
+        path = str(tmp_path / 'tzcity.table')
+        tzcity.shared.build_table(path)
+        env = dict(os.environ,
+                   PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run([sys.executable, '-c', _RSS_SCRIPT, path],
+                                check=True, stdout=subprocess.PIPE,
+                                env=env).stdout
+        table_rss, dict_rss = map(int, output.split())
+        assert table_rss < dict_rss
+
+
+class TestMemory:
+    def test_budget(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run([sys.executable, '-c', _MEMORY_SCRIPT],
+                                check=True, stdout=subprocess.PIPE,
+                                env=env).stdout
+        retained, city_dict_loaded = output.split()
+        assert int(retained) < _MEMORY_BUDGET
+        # CITY_DICT is loaded on import before Python 3.7
+        assert city_dict_loaded == str(sys.version_info < (3, 7)).encode()
+
+    def test_shared_names(self):
+        index = tzcity.core._dict_index()
+        for tz, names in tzcity.core._bundled().items():
+            assert index[tz] is tz
+            assert all(index[name] is tz for name in names)
+        folded = tzcity.core._folded_index()
+        key = next(key for key in folded if key == 'london')
+        assert key is folded['london']
+
+    def test_shared_candidates(self):
+        multi_index = tzcity.core._multi_index()
+        assert multi_index['mumbai'] is multi_index['chennai']
+
+
+class TestTZCityMany:
+    def test_order(self):
+        cities = ['lOnDon', 'atlantis', 'new YORK', 'wonderland', ' london ']
+        assert list(tzcity.tzcity_many(cities)) == [
+            'Europe/London', None, 'America/New_York', None,
+            'Europe/London']
+
+    def test_default(self):
+        result = tzcity.tzcity_many(['wonderland', 'awst'], default='')
+        assert list(result) == ['', 'Australia/Perth']
+
+    def test_generator(self):
+        lines = (line for line in ['london\n', 'london\n', 'cairo\n'])
+        assert list(tzcity.tzcity_many(lines)) == [
+            'Europe/London', 'Europe/London', 'Africa/Cairo']
+
+    @pytest.mark.parametrize('city', _ALL_NAMES)
+    def test_parity(self, city):
+        assert list(tzcity.tzcity_many([city])) == [tzcity.tzcity(city)]
+
+    def test_bounded(self, monkeypatch):
+        monkeypatch.setattr(tzcity.core, '_MANY_RESULTS', 2)
+        lookups = []
+        lookup = tzcity.core._lookup
+        monkeypatch.setattr(tzcity.core, '_lookup',
+                            lambda city: lookups.append(city) or lookup(city))
+        cities = ['london', 'london', 'paris', 'tokyo', 'london', 'tokyo']
+        assert list(tzcity.tzcity_many(cities)) == [
+            'Europe/London', 'Europe/London', 'Europe/Paris', 'Asia/Tokyo',
+            'Europe/London', 'Asia/Tokyo']
+        assert lookups == ['london', 'paris', 'tokyo', 'london']
+
+
+class TestTZCityFuzzy:
+    @pytest.mark.parametrize('city,expected', [
+        ('bangalor', 'Asia/Kolkata'),
+        ('sao paolo', 'America/Sao_Paulo'),
+        ('kuala lumper', 'Asia/Kuala_Lumpur'),
+        ('Lndon', 'Europe/London'),
+        ('amerca/new_york', 'America/New_York'),
+    ])
+    def test_typo(self, city, expected):
+        tz, score = tzcity.tzcity_fuzzy(city)
+        assert tz == expected
+        assert 0.75 <= score < 1
+
+    def test_exact(self):
+        assert tzcity.tzcity_fuzzy(' New York') == ('America/New_York', 1.0)
+
+    @pytest.mark.parametrize('city', [
+        'wonderland', 'zzzz', 'x', '',
+    ])
+    def test_invalid(self, city):
+        with pytest.raises(ValueError):
+            tzcity.tzcity_fuzzy(city)
+
+    def test_cutoff(self):
+        with pytest.raises(ValueError):
+            tzcity.tzcity_fuzzy('bangalor', cutoff=0.9)
+        assert tzcity.tzcity_fuzzy('bangalor', cutoff=0.8)[0] == (
+            'Asia/Kolkata')
+
+    @pytest.mark.parametrize('cutoff', [0, -0.5, 1.5, float('nan')])
+    def test_invalid_cutoff(self, cutoff):
+        for city in ['bangalor', 'london']:
+            with pytest.raises(ValueError, match='cutoff'):
+                tzcity.tzcity_fuzzy(city, cutoff=cutoff)
+
+    def test_exact_cutoff(self):
+        assert tzcity.tzcity_fuzzy('london', cutoff=1) == (
+            'Europe/London', 1.0)
+
+    @pytest.mark.parametrize('first,second,limit,expected', [
+        ('kitten', 'sitting', 5, 3),
+        ('kitten', 'sitting', 2, 3),
+        ('flaw', 'lawn', 2, 2),
+        ('abc', 'abc', 0, 0),
+        ('abc', 'abcdef', 2, 3),
+        ('', 'ab', 2, 2),
+    ])
+    def test_distance(self, first, second, limit, expected):
+        assert tzcity.fuzzy._distance(first, second, limit) == expected
+
+
+class TestComplete:
+    def test_ranked(self):
+        assert tzcity.complete('NEW') == [
+            ('New York', 'America/New_York'),
+            ('Newark', 'America/New_York'),
+            ('New Delhi', 'Asia/Kolkata'),
+            ('New Caledonia', 'Pacific/Noumea'),
+        ]
+
+    def test_limit(self):
+        assert tzcity.complete(' a', limit=3) == [
+            ('Africa/Abidjan', 'Africa/Abidjan'),
+            ('Abidjan', 'Africa/Abidjan'),
+            ('Africa/Accra', 'Africa/Accra'),
+        ]
+
+    def test_word_boundary(self):
+        assert tzcity.complete('new ', limit=1) == [
+            ('New York', 'America/New_York')]
+        assert tzcity.complete('new y') == [
+            ('New York', 'America/New_York')]
+
+    def test_zone(self):
+        assert tzcity.complete('america/argentina/b') == [
+            ('America/Argentina/Buenos_Aires',
+             'America/Argentina/Buenos_Aires')]
+
+    def test_unknown(self):
+        assert not tzcity.complete('wonderl')
+
+    def test_not_lookups(self):
+        stats = tzcity.stats.enable()
+        cache = tzcity.cache.enable()
+        try:
+            assert tzcity.complete('lond')
+        finally:
+            tzcity.stats.disable()
+            tzcity.cache.disable()
+        assert stats.snapshot()['hits'] == {'zone': 0, 'tz city': 0,
+                                            'alias': 0}
+        assert len(cache) == 0
+
+
+class TestColumn:
+    @pytest.fixture(autouse=True)
+    def pandas(self):
+        return pytest.importorskip('pandas')
+
+    def test_list(self, pandas):
+        result = tzcity.tzcity_column(
+            ['lOnDon', 'Mumbai ', None, 'wonderland', 5, 'london'])
+        assert isinstance(result.dtype, pandas.CategoricalDtype)
+        assert list(result.cat.categories) == [
+            'Europe/London', 'Asia/Kolkata']
+        assert result.tolist()[:2] == ['Europe/London', 'Asia/Kolkata']
+        assert result.isna().tolist() == [False, False, True, True, True,
+                                          False]
+        assert result[5] == 'Europe/London'
+
+    def test_series(self, pandas):
+        cities = pandas.Series(['cairo', 'atlantis', 'Zürich'],
+                               index=[10, 20, 30], name='city')
+        result = tzcity.tzcity_column(cities)
+        assert result.name == 'city'
+        assert result.index.tolist() == [10, 20, 30]
+        assert result[10] == 'Africa/Cairo'
+        assert pandas.isna(result[20])
+        assert result[30] == 'Europe/Zurich'
+
+    def test_numpy(self):
+        numpy = pytest.importorskip('numpy')
+        result = tzcity.tzcity_column(numpy.array(['awst', 'xyz']))
+        assert result[0] == 'Australia/Perth'
+
+    def test_arrow(self):
+        pyarrow = pytest.importorskip('pyarrow')
+        result = tzcity.tzcity_column(pyarrow.array(['awst', None]))
+        assert result[0] == 'Australia/Perth'
+
+    def test_to_pandas(self, pandas):
+        class Column:
+            def to_pandas(self):
+                return pandas.Series(['awst'])
+
+        assert tzcity.tzcity_column(Column())[0] == 'Australia/Perth'
+
+    def test_empty(self):
+        assert tzcity.tzcity_column([]).empty
+
+    @pytest.mark.parametrize('city', _ALL_NAMES[::7])
+    def test_parity(self, city):
+        assert tzcity.tzcity_column([city])[0] == tzcity.tzcity(city)
+
+
+class TestCache:
+    @pytest.fixture
+    def cache(self):
+        yield tzcity.cache.enable(maxsize=4)
+        tzcity.cache.disable()
+        tzcity.sources.clear_sources()
+
+    def test_hits(self, cache):
+        assert cache.snapshot()['hit_rate'] == 0.0
+        assert tzcity.tzcity(' London ') == 'Europe/London'
+        assert tzcity.tzcity(' London ') == 'Europe/London'
+        assert tzcity.tzcity('Sao-Paulo') == 'America/Sao_Paulo'
+        assert tzcity.tzcity('Sao-Paulo') == 'America/Sao_Paulo'
+        assert cache.snapshot() == {'hits': 2, 'misses': 2, 'hit_rate': 0.5,
+                                    'size': 2, 'maxsize': 4}
+        assert cache[' London '] == ('london', 'europe/london')
+        assert cache['Sao-Paulo'] == ('sao paulo', 'america/sao_paulo')
+
+    def test_misses(self, cache):
+        for _ in range(2):
+            with pytest.raises(ValueError, match='^wonderland: '):
+                tzcity.tzcity('Wonderland')
+        assert cache['Wonderland'] == ('wonderland', None)
+        assert cache.hits == 1
+        with pytest.raises(KeyError):
+            cache['Atlantis']
+
+    def test_eviction(self, cache):
+        for city in ['london', 'paris', 'tokyo', 'delhi', 'lima']:
+            tzcity.tzcity(city)
+        assert list(cache) == ['paris', 'tokyo', 'delhi', 'lima']
+        tzcity.tzcity('paris')
+        for city in ['rome', 'oslo']:
+            tzcity.tzcity(city)
+        assert list(cache) == ['lima', 'paris', 'rome', 'oslo']
+        assert len(cache) == 4
+
+    def test_delete(self, cache):
+        for city in ['london', 'paris', 'tokyo', 'delhi', 'lima']:
+            tzcity.tzcity(city)
+        tzcity.tzcity('paris')
+        del cache['paris']
+        del cache['tokyo']
+        assert list(cache) == ['delhi', 'lima']
+        with pytest.raises(KeyError):
+            del cache['tokyo']
+
+    def test_data_changed(self, cache):
+        with pytest.raises(ValueError):
+            tzcity.tzcity('springfield')
+        tzcity.sources.add_source({'America/Chicago': ['springfield']})
+        assert len(cache) == 0
+        assert tzcity.tzcity('springfield') == 'America/Chicago'
+
+    def test_snapshot_file(self, cache, tmp_path):
+        path = str(tmp_path / 'cache.json')
+        for city in ['Paris', 'Wonderland', 'Tokyo']:
+            with contextlib.suppress(ValueError):
+                tzcity.tzcity(city)
+        cache.save(path)
+        warm = tzcity.cache.enable(snapshot=path)
+        assert dict(warm) == dict(cache)
+        assert list(warm) == ['Paris', 'Wonderland', 'Tokyo']
+        assert tzcity.tzcity('Paris') == 'Europe/Paris'
+        assert warm.snapshot()['hits'] == 1
+
+    def test_threads(self, cache):
+        cities = ['london', 'Paris', 'TOKYO', 'sao-paulo', 'wonderland',
+                  'mumbai', 'kuwait city'] * 500
+
+        def lookup(city):
+            try:
+                return tzcity.tzcity(city)
+            except ValueError:
+                return None
+
+        expected = [lookup(city) for city in cities]
+        with ThreadPoolExecutor(8) as executor:
+            assert list(executor.map(lookup, cities)) == expected
+        assert len(cache) <= 4
+
+    def test_stats(self, cache):
+        stats = tzcity.stats.enable()
+        try:
+            for _ in range(2):
+                tzcity.tzcity('mumbai')
+        finally:
+            tzcity.stats.disable()
+        assert stats.snapshot()['top_aliases'] == [('mumbai', 2)]
+        assert cache.hits == 1
+
+
+class TestExplain:
+    @pytest.mark.parametrize('city,match,matched,kind,tz,label', [
+        ('London', 'exact', 'london', 'tz city', 'Europe/London', 'London'),
+        ('asia/kolkata', 'exact', 'asia/kolkata', 'zone', 'Asia/Kolkata',
+         'Asia/Kolkata'),
+        ('Sao-Paulo', 'folded', 'sao paulo', 'tz city', 'America/Sao_Paulo',
+         'Sao Paulo'),
+        ('Mumbai City', 'folded city', 'mumbai', 'alias', 'Asia/Kolkata',
+         'Mumbai'),
+        ('Wonderland', None, None, None, None, None),
+    ])
+    def test_explain(self, city, match, matched, kind, tz, label):
+        explanation = tzcity.explain(city)
+        assert explanation[:7] == (city, city.lower(), match, matched, kind,
+                                   tz, label)
+        assert explanation.seconds == sum(
+            stage.seconds for stage in explanation.stages)
+
+    @pytest.mark.parametrize('city,stages', [
+        ('London', [('normalize', 0), ('exact', 1), ('capitalize tz', 1),
+                    ('capitalize name', 1)]),
+        ('Mumbai City', [('normalize', 0), ('exact', 1), ('folded', 2),
+                         ('capitalize tz', 1), ('capitalize name', 1)]),
+        ('Wonderland', [('normalize', 0), ('exact', 1), ('folded', 1)]),
+        ('Wonder City', [('normalize', 0), ('exact', 1), ('folded', 2)]),
+    ])
+    def test_stages(self, city, stages):
+        assert [(stage.name, stage.probes)
+                for stage in tzcity.explain(city).stages] == stages
+
+    def test_capitalization(self, monkeypatch):
+        monkeypatch.setattr(tzcity.core, '_TZ_CAPS', {})
+        tzcity.core._caps_city.cache_clear()
+        details = [[stage.detail for stage in tzcity.explain(city).stages
+                    if stage.name.startswith('capitalize')]
+                   for city in ['Mumbai', 'Mumbai', 'asia/kolkata']]
+        assert details == [['computed', 'computed'], ['cached', 'cached'],
+                           ['cached', 'tz name']]
+
+    def test_profile(self):
+        with tzcity.profiling.profile() as report:
+            cities = ['London', 'Sao-Paulo', 'Mumbai City', 'Wonderland']
+            for city in cities * 3:
+                try:
+                    tzcity.tzcity(city)
+                except ValueError:
+                    pass
+            assert list(tzcity.tzcity_many(['paris', 'paris'])) == [
+                'Europe/Paris'] * 2
+        assert tzcity.core._PROFILER is None
+        snapshot = report.snapshot()
+        assert snapshot['lookups'] == 13
+        assert snapshot['matches'] == {'exact': 4, 'folded': 3,
+                                       'folded city': 3, 'unrecognized': 3}
+        assert snapshot['kinds'] == {'zone': 0, 'tz city': 7, 'alias': 3}
+        assert snapshot['probes']['folded'] == 3 + 6 + 3
+        assert set(snapshot['seconds']) == {
+            'normalize', 'exact', 'folded', 'capitalize tz',
+            'capitalize name'}
+        slowest = [seconds for _, seconds in snapshot['slowest']]
+        assert len(slowest) == 10
+        assert slowest == sorted(slowest, reverse=True)
+
+    def test_profile_error(self):
+        with pytest.raises(ValueError):
+            with tzcity.profiling.profile():
+                tzcity.tzcity('Wonderland')
+        assert tzcity.core._PROFILER is None
+
+    def test_profile_overlapping(self):
+        outer = tzcity.profiling.profile()
+        first = outer.__enter__()
+        with tzcity.profiling.profile() as second:
+            tzcity.tzcity('london')
+            outer.__exit__(None, None, None)
+            tzcity.tzcity('paris')
+        tzcity.tzcity('tokyo')
+        assert tzcity.core._PROFILER is None
+        assert first.lookups == 1
+        assert second.lookups == 2
+
+    def test_profile_threads(self):
+        def profiled(city):
+            with tzcity.profiling.profile() as report:
+                for _ in range(50):
+                    tzcity.tzcity(city)
+            return report.lookups
+
+        with ThreadPoolExecutor(4) as executor:
+            counts = list(executor.map(profiled, ['london', 'paris'] * 4))
+        assert all(count >= 50 for count in counts)
+        assert tzcity.core._PROFILER is None
+
+    def test_profile_lookups_once(self, monkeypatch):
+        calls = []
+        find_folded = tzcity.core._find_folded
+        monkeypatch.setattr(tzcity.core, '_find_folded',
+                            lambda *args: calls.append(args) or
+                            find_folded(*args))
+        with tzcity.profiling.profile():
+            assert tzcity.tzcity('Sao-Paulo') == 'America/Sao_Paulo'
+        assert len(calls) == 1
+
+    def test_uncapitalizable(self):
+        tzcity.sources.add_source({'Europe/Paris': ["d'"]})
+        try:
+            with tzcity.profiling.profile():
+                assert tzcity.tzcity("d'") == 'Europe/Paris'
+            assert tzcity.explain("d'").label == "D'"
+        finally:
+            tzcity.sources.clear_sources()
+
+
+class TestStats:
+    @pytest.fixture
+    def stats(self):
+        yield tzcity.stats.enable(top=2)
+        tzcity.stats.disable()
+
+    def test_counts(self, stats):
+        for city in ['asia/kolkata', 'Kolkata', 'mumbai', 'mumbai',
+                     'wonderland', 'atlantis', 'wonderland']:
+            try:
+                tzcity.tzcity(city)
+            except ValueError:
+                pass
+        snapshot = stats.snapshot()
+        assert snapshot['hits'] == {'zone': 1, 'tz city': 1, 'alias': 2}
+        assert snapshot['misses'] == 3
+        assert snapshot['top_missed'] == [('wonderland', 2), ('atlantis', 1)]
+        assert snapshot['top_aliases'] == [('mumbai', 2)]
+        assert sum(snapshot['latency_ns'].values()) == 7
+
+    def test_many(self, stats):
+        list(tzcity.tzcity_many(['london', 'wonderland', 'london']))
+        snapshot = stats.snapshot()
+        assert snapshot['hits']['tz city'] == 1
+        assert snapshot['misses'] == 1
+
+    def test_callback(self):
+        calls = []
+        tzcity.stats.enable(callback=lambda *args: calls.append(args[:3]))
+        try:
+            tzcity.tzcity('mumbai')
+            list(tzcity.tzcity_many(['atlantis']))
+        finally:
+            tzcity.stats.disable()
+        assert calls == [('mumbai', 'asia/kolkata', 'alias'),
+                         ('atlantis', None, None)]
+
+    def test_disabled(self):
+        stats = tzcity.stats.enable()
+        tzcity.stats.disable()
+        tzcity.tzcity('london')
+        assert stats.snapshot()['hits']['tz city'] == 0
+
+    def test_top_counter(self):
+        counter = tzcity.stats.TopCounter(2)
+        for item in 'aabcc':
+            counter.add(item)
+        assert counter.most_common() == [('c', 3), ('a', 2)]
+        empty = tzcity.stats.TopCounter(0)
+        empty.add('a')
+        empty.add('b')
+        assert empty.most_common() == [('b', 2)]
+
+    def test_threads(self, stats):
+        # Switching threads as often as possible makes races likely
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        names = [f"unknown {i}" for i in range(50)] + ['mumbai', 'bombay']
+
+        def look_up(offset):
+            for name in (names[offset:] + names[:offset]) * 20:
+                try:
+                    tzcity.tzcity(name)
+                except ValueError:
+                    pass
+
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(look_up, range(0, 48, 6)))
+        finally:
+            sys.setswitchinterval(interval)
+        snapshot = stats.snapshot()
+        assert sum(snapshot['hits'].values()) + snapshot['misses'] <= 8320
+        stats.top_missed.add('one more')
+        assert len(stats.top_missed.counts) == 2
+
+
+class TestOffset:
+    @pytest.fixture(autouse=True)
+    def zoneinfo(self):
+        return pytest.importorskip('zoneinfo')
+
+    def test_transition(self):
+        # Daylight saving time started at 2021-03-14 07:00 UTC
+        before = tzcity.tzoffset('new york', 1615705199)
+        after = tzcity.tzoffset('new york', 1615705200)
+        assert before == ('America/New_York', timedelta(hours=-5), False)
+        assert after == ('America/New_York', timedelta(hours=-4), True)
+
+    @pytest.mark.parametrize('when', [
+        datetime(2021, 7, 1, 12),
+        datetime(2021, 7, 1, 14, tzinfo=timezone(timedelta(hours=2))),
+        1625140800,
+        1625140800.5,
+    ])
+    def test_when(self, when):
+        assert tzcity.tzoffset('london', when) == (
+            'Europe/London', timedelta(hours=1), True)
+
+    def test_now(self, zoneinfo):
+        local = datetime.now(zoneinfo.ZoneInfo('Asia/Kolkata'))
+        assert tzcity.tzoffset('mumbai').utcoffset == local.utcoffset()
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            tzcity.tzoffset('wonderland')
+
+    def test_iana_key(self):
+        assert tzcity.tzoffset('la paz', 0).tz == 'America/La_Paz'
+
+    def test_matches_zoneinfo(self, zoneinfo):
+        for tz in list(CITY_DICT)[::7]:
+            zone = tzcity.offset._zone(tzcity.capitalize(tz))
+            for timestamp in range(-2 ** 31, 2 ** 31, 2 ** 26 + 12345):
+                local = datetime.fromtimestamp(timestamp, zone)
+                state = tzcity.tzoffset(tz, timestamp)
+                assert state.tz == zone.key
+                assert state.utcoffset == local.utcoffset()
+                assert state.dst == bool(local.dst())
+
+    def test_many(self):
+        pairs = [('london', 0), ('wonderland', 0), ('london', 1615705200)]
+        assert list(tzcity.tzoffset_many(pairs, default=())) == [
+            ('Europe/London', timedelta(hours=1), False),
+            (),
+            ('Europe/London', timedelta(0), False),
+        ]
+
+    def test_many_bounded(self, monkeypatch):
+        monkeypatch.setattr(tzcity.core, '_MANY_RESULTS', 1)
+        lookups = []
+        tzcity_ = tzcity.core.tzcity
+        monkeypatch.setattr(tzcity.core, 'tzcity',
+                            lambda city: lookups.append(city) or tzcity_(city))
+        pairs = [('london', 0), ('london', 0), ('cairo', 0), ('london', 0)]
+        assert [state.tz for state in tzcity.tzoffset_many(pairs)] == [
+            'Europe/London', 'Europe/London', 'Africa/Cairo',
+            'Europe/London']
+        assert lookups == ['london', 'cairo', 'london']
+
+    def test_table_limit(self, monkeypatch):
+        monkeypatch.setattr(tzcity.offset, '_MAX_DAYS', 1)
+        monkeypatch.setattr(tzcity.offset, '_DAYS', {})
+        tzcity.tzoffset('cairo', 0)
+        tzcity.tzoffset('cairo', 10 ** 6)
+        assert len(tzcity.offset._DAYS) == 1
+
+    @pytest.mark.skipif(sys.version_info < (3, 7),
+                        reason="imported with tzcity before Python 3.7")
+    def test_lazy_import(self):
+        code = "import sys, tzcity; print('datetime' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                stdout=subprocess.PIPE).stdout
+        assert output.strip() == b'False'
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def _collect(async_iterator):
+    return [item async for item in async_iterator]
+
+
+class TestAsync:
+    def test_atzcity(self):
+        assert _run(tzcity.atzcity('lOnDon')) == 'Europe/London'
+        with pytest.raises(ValueError):
+            _run(tzcity.atzcity('wonderland'))
+
+    def test_atzcity_executor(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            coroutine = tzcity.atzcity('awst', executor=executor)
+            assert _run(coroutine) == 'Australia/Perth'
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 1000])
+    def test_atzcity_many(self, chunk_size):
+        cities = ['london', 'wonderland', 'new york'] * 5
+        expected = ['Europe/London', '', 'America/New_York'] * 5
+        result = tzcity.atzcity_many(iter(cities), default='',
+                                     chunk_size=chunk_size)
+        assert _run(_collect(result)) == expected
+
+    @pytest.mark.parametrize('chunk_size', [2, 3])
+    def test_atzcity_many_async_iterable(self, chunk_size):
+        async def cities():
+            for city in ['cairo', 'wonderland', 'cairo']:
+                yield city
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = tzcity.atzcity_many(cities(), chunk_size=chunk_size,
+                                         executor=executor)
+            assert _run(_collect(result)) == [
+                'Africa/Cairo', None, 'Africa/Cairo']
+
+    @pytest.mark.parametrize('chunk_size', [0, -1])
+    def test_atzcity_many_chunk_size(self, chunk_size):
+        async def cities():
+            yield 'cairo'
+
+        for iterable in [['cairo'], cities()]:
+            with pytest.raises(ValueError):
+                _run(_collect(tzcity.atzcity_many(iterable,
+                                                  chunk_size=chunk_size)))
+
+    def test_atzcity_many_empty(self):
+        assert not _run(_collect(tzcity.atzcity_many([])))
+
+    @pytest.mark.skipif(sys.version_info < (3, 7),
+                        reason="imported with tzcity before Python 3.7")
+    def test_lazy_import(self):
+        code = "import sys, tzcity; print('asyncio' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                stdout=subprocess.PIPE).stdout
+        assert output.strip() == b'False'
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            tzcity.not_an_attribute
+
+
+class TestCLI:
+    def run(self, monkeypatch, capsys, text, *args):
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(text))
+        status = tzcity.cli.main(list(args))
+        out, err = capsys.readouterr()
+        return status, out, err
+
+    @pytest.mark.parametrize('miss,expected', [
+        ('empty', 'Europe/London\n\nAsia/Kolkata\n'),
+        ('skip', 'Europe/London\nAsia/Kolkata\n'),
+    ])
+    def test_lines(self, monkeypatch, capsys, miss, expected):
+        text = 'london\nwonderland\n Mumbai\r\n'
+        status, out, _ = self.run(monkeypatch, capsys, text, '--miss', miss)
+        assert status == 0
+        assert out == expected
+
+    def test_error(self, monkeypatch, capsys):
+        text = 'london\nwonderland\nmumbai\n'
+        status, out, err = self.run(monkeypatch, capsys, text,
+                                    '--miss', 'error')
+        assert status == 1
+        assert out == 'Europe/London\n'
+        assert 'wonderland' in err
+
+    def test_capitalize(self, monkeypatch, capsys):
+        text = "dar es salaam\nd'\n"
+        _, out, _ = self.run(monkeypatch, capsys, text, '--capitalize',
+                             '--miss', 'skip')
+        assert out == 'Dar es Salaam\n'
+
+    def test_csv_header(self, monkeypatch, capsys):
+        text = 'id,city\n1,london\n2,"port au prince"\n3\n4,atlantis\n'
+        _, out, _ = self.run(monkeypatch, capsys, text, '--column', 'city')
+        assert out == ('id,city,tz\n1,london,Europe/London\n'
+                       '2,port au prince,America/Port-au-Prince\n'
+                       '3,\n4,atlantis,\n')
+
+    def test_csv_number(self, monkeypatch, capsys):
+        text = 'london,1\nwonderland,2\n'
+        _, out, _ = self.run(monkeypatch, capsys, text, '--column', '1',
+                             '--capitalize', '--miss', 'skip')
+        assert out == 'London,1\nWonderland,2\n'
+
+    @pytest.mark.parametrize('column', ['0', '00'])
+    def test_csv_column_zero(self, monkeypatch, capsys, column):
+        with pytest.raises(SystemExit) as exit_info:
+            self.run(monkeypatch, capsys, 'a,london\n', '--column', column,
+                     '--capitalize')
+        assert exit_info.value.code == 2
+        out, err = capsys.readouterr()
+        assert out == ''
+        assert 'start from 1' in err
+
+    def test_csv_missing_column(self, monkeypatch, capsys):
+        status, _, err = self.run(monkeypatch, capsys, 'a,b\n',
+                                  '--column', 'city')
+        assert status == 1
+        assert 'city' in err
+
+    def test_chunks(self, monkeypatch, capsys):
+        monkeypatch.setattr(tzcity.cli, '_CHUNK_SIZE', 2)
+        text = 'london\n' * 5
+        _, out, _ = self.run(monkeypatch, capsys, text)
+        assert out == 'Europe/London\n' * 5
+
+    def test_broken_pipe(self, monkeypatch, tmp_path):
+        path = tmp_path / 'output'
+        with open(str(path), 'w') as output:
+            class ClosedOutput(io.StringIO):
+                def write(self, text):
+                    raise BrokenPipeError
+
+                def fileno(self):
+                    return output.fileno()
+
+            monkeypatch.setattr(sys, 'stdin', io.StringIO('london\n'))
+            monkeypatch.setattr(sys, 'stdout', ClosedOutput())
+            assert tzcity.cli.main([]) == 1
+            # Standard output now goes to devnull
+            os.write(output.fileno(), b'Europe/London\n')
+        assert path.read_text() == ''
+
+    def test_head(self, tmp_path):
+        path = tmp_path / 'cities'
+        path.write_text('london\n' * 100_000)
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        with open(str(path)) as stdin:
+            process = subprocess.Popen(
+                [sys.executable, '-m', 'tzcity'], stdin=stdin,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+        assert process.stdout.readline() == b'Europe/London\n'
+        process.stdout.close()
+        assert process.stderr.read() == b''
+        process.stderr.close()
+        assert process.wait() == 1
+
+    def test_module(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'stdin', io.StringIO('awst\n'))
+        monkeypatch.setattr(sys, 'argv', ['tzcity'])
+        with pytest.raises(SystemExit) as exit_info:
+            runpy.run_module('tzcity', run_name='__main__')
+        assert exit_info.value.code == 0
+        assert capsys.readouterr().out == 'Australia/Perth\n'
+
+
+class TestServer:
+    @pytest.fixture
+    def connection(self):
+        server = tzcity.server.make_server(port=0)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        connection = http.client.HTTPConnection(*server.server_address)
+        yield connection
+        connection.close()
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    def request(self, connection, method, path, body=None):
+        connection.request(method, path, body=body)
+        response = connection.getresponse()
+        assert response.getheader('Content-Type') == 'application/json'
+        return response.status, json.loads(response.read())
+
+    def test_lookup(self, connection):
+        assert self.request(connection, 'GET', '/tzcity?city=New%20York') \
+            == (200, {'city': 'New York', 'tz': 'America/New_York'})
+        status, body = self.request(connection, 'GET',
+                                    '/tzcity?city=wonderland')
+        assert status == 404
+        assert 'wonderland' in body['error']
+
+    def test_batch(self, connection):
+        body = json.dumps(['london', 'wonderland', 'mumbai'])
+        assert self.request(connection, 'POST', '/tzcity', body) == (
+            200, {'tz': ['Europe/London', None, 'Asia/Kolkata']})
+
+    @pytest.mark.parametrize('path,body', [
+        ('/tzcity', 'not json'),
+        ('/tzcity', '{"city": "london"}'),
+        ('/tzcity', '["london", 1]'),
+        ('/capitalize', '["london"]'),
+    ])
+    def test_bad_batch(self, connection, path, body):
+        assert self.request(connection, 'POST', path, body)[0] == 400
+
+    @pytest.mark.parametrize('length', [None, 'abc', '-1'])
+    def test_bad_length(self, connection, length):
+        connection.putrequest('POST', '/tzcity')
+        if length is not None:
+            connection.putheader('Content-Length', length)
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == 400
+        assert 'Content-Length' in json.loads(response.read())['error']
+
+    def test_capitalize(self, connection):
+        assert self.request(connection, 'GET',
+                            '/capitalize?name=dar%20es%20salaam') == (
+            200, {'name': 'dar es salaam', 'capitalized': 'Dar es Salaam'})
+        assert self.request(connection, 'GET', '/capitalize?name=d%27')[0] \
+            == 404
+
+    @pytest.mark.parametrize('path', ['/', '/tzcity', '/capitalize'])
+    def test_bad_request(self, connection, path):
+        assert self.request(connection, 'GET', path)[0] == 400
+
+    def test_metrics(self, connection):
+        for path in ['/tzcity?city=london', '/tzcity?city=atlantis',
+                     '/wp-login.php', '/tzcity/']:
+            self.request(connection, 'GET', path)
+        self.request(connection, 'POST', '/capitalize', '[]')
+        _, metrics = self.request(connection, 'GET', '/metrics')
+        assert metrics['requests'] == {'GET /tzcity': 2, 'other': 3,
+                                       'GET /metrics': 1}
+        assert metrics['lookups']['hits']['tz city'] == 1
+        assert metrics['lookups']['top_missed'] == [['atlantis', 1]]
+
+    def test_metrics_no_stats(self):
+        server = tzcity.server.make_server(port=0, record_stats=False)
+        server.requests['GET /tzcity'] += 1
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            connection = http.client.HTTPConnection(*server.server_address)
+            _, metrics = self.request(connection, 'GET', '/metrics')
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        assert metrics == {'requests': {'GET /tzcity': 1, 'GET /metrics': 1}}
+
+    def test_program_stats(self):
+        program_stats = tzcity.stats.enable()
+        try:
+            server = tzcity.server.make_server(port=0)
+            tzcity.tzcity('london')
+            server.server_close()
+            tzcity.tzcity('paris')
+            assert tzcity.core._OBSERVER is program_stats
+        finally:
+            tzcity.stats.disable()
+        assert program_stats.snapshot()['hits']['tz city'] == 2
+        assert server.lookup_stats.snapshot()['hits']['tz city'] == 1
+
+    def test_stats_closed(self):
+        server = tzcity.server.make_server(port=0)
+        server.server_close()
+        assert tzcity.core._OBSERVER is None
+        stats = tzcity.stats.enable()
+        server.server_close()
+        assert tzcity.core._OBSERVER is stats
+        tzcity.stats.disable()
+
+    def test_keep_alive(self, connection):
+        self.request(connection, 'GET', '/tzcity?city=london')
+        sock = connection.sock
+        self.request(connection, 'GET', '/tzcity?city=paris')
+        assert connection.sock is sock
+
+    @pytest.mark.filterwarnings('ignore::RuntimeWarning')
+    def test_module(self, monkeypatch, capsys):
+        def interrupt(self):
+            raise KeyboardInterrupt
+
+        # run_module() creates a new Server class
+        monkeypatch.setattr(socketserver.BaseServer, 'serve_forever',
+                            interrupt)
+        monkeypatch.setattr(sys, 'argv', ['tzcity.server', '--port', '0',
+                                          '--no-stats'])
+        runpy.run_module('tzcity.server', run_name='__main__')
+        assert capsys.readouterr().out.startswith('Serving on http://')
+
 
 class TestCapitalize:
     @pytest.mark.parametrize('name,expected', [
@@ -35,6 +1669,8 @@ class TestCapitalize:
         ('america/port_of_spain', 'America/Port_of_Spain'),
         ('washington dc', 'Washington DC'),
         ('america/argentina/buenos_aires', 'America/Argentina/Buenos_Aires'),
+        ('america/la_paz', 'America/La_Paz'),
+        ('antarctica/dumontdurville', 'Antarctica/DumontDUrville'),
     ])
     def test_valid(self, name, expected):
         assert tzcity.capitalize(name) == expected
@@ -46,6 +1682,21 @@ class TestCapitalize:
         with pytest.raises(ValueError):
             tzcity.capitalize(name)
 
+    @pytest.mark.parametrize('name', list(CITY_DICT))
+    def test_tz_cached(self, name):
+        expected = tzcity.core._caps_tz(name)
+        assert tzcity.capitalize(name) == expected
+        assert tzcity.capitalize(name) is tzcity.capitalize(name)
+
+    def test_cache_info(self):
+        hits, misses, maxsize, _ = tzcity.core.capitalize_cache_info()
+        assert maxsize == tzcity.core._CAPS_CACHE_SIZE
+        tzcity.capitalize('some uncached city name')
+        tzcity.capitalize('some uncached city name')
+        new_hits, new_misses, _, _ = tzcity.core.capitalize_cache_info()
+        assert new_misses == misses + 1
+        assert new_hits == hits + 1
+
 
 class TestCapsify:
     @pytest.mark.parametrize('name,expected', [
@@ -61,10 +1712,21 @@ class TestCapsify:
         ('port-au-prince', 'Port-au-Prince'),
         ('fort-de-france', 'Fort-de-France'),
         ('nur-sultan', 'Nur-Sultan'),
+        ('saint-jean-de-luz', 'Saint-Jean-de-Luz'),
+        ('villefranche-de-lauragais', 'Villefranche-de-Lauragais'),
+        ('-de-', '-de-'),
     ])
     def test_valid(self, name, expected):
         assert tzcity.core._caps_city(name) == expected
 
+    @pytest.mark.parametrize('name', sorted({
+        city for cities in CITY_DICT.values() for city in cities
+    }))
+    def test_cached(self, name):
+        uncached = tzcity.core._caps_city.__wrapped__(name)
+        assert tzcity.core._caps_city(name) == uncached
+        assert tzcity.core._caps_city(name) == uncached
+
     @pytest.mark.parametrize('name', [
         "d'",
     ])
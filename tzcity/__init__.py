@@ -4,6 +4,52 @@ Module to translate city names to time zone names
 
 __version__ = "0.0.4-alpha1"
 
-from tzcity.core import tzcity, capitalize
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ['tzcity', 'capitalize']
+from tzcity.core import (tzcity, tzcity_many, capitalize, candidates,
+                         cities_for, display_label)
+
+if TYPE_CHECKING:  # pragma: no cover
+    # For type checkers, as these are imported by __getattr__ on first use
+    from tzcity.column import tzcity_column
+    from tzcity.fuzzy import tzcity_fuzzy
+    from tzcity.geo import nearest, nearest_many
+    from tzcity.prefix import complete
+    from tzcity.profiling import explain
+    from tzcity.text import extract
+
+__all__ = ['tzcity', 'tzcity_many', 'tzcity_fuzzy', 'capitalize', 'complete',
+           'candidates', 'tzcity_column', 'cities_for', 'display_label',
+           'nearest', 'nearest_many', 'extract', 'explain']
+
+# Names imported on first use from the modules of tzcity defining them,
+# keeping their modules and those they import out of the import of tzcity
+_LAZY = {
+    'tzcity_fuzzy': 'fuzzy',
+    'complete': 'prefix',
+    'tzcity_column': 'column',
+    'nearest': 'geo',
+    'nearest_many': 'geo',
+    'extract': 'text',
+    'explain': 'profiling',
+    'atzcity': 'aio',
+    'atzcity_many': 'aio',
+    'tzoffset': 'offset',
+    'tzoffset_many': 'offset',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the names of _LAZY on first use.
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"tzcity.{_LAZY[name]}"), name)
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # No module __getattr__ before Python 3.7
+    globals().update({name: __getattr__(name) for name in _LAZY})
@@ -0,0 +1,9 @@
+"""
+Run the command line interface of tzcity with python -m tzcity
+"""
+
+import sys
+
+from tzcity.cli import main
+
+sys.exit(main())
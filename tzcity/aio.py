@@ -0,0 +1,90 @@
+"""
+Lookups from asyncio code without blocking the event loop
+"""
+
+import asyncio
+from collections import abc, deque
+from concurrent.futures import Executor
+from itertools import islice
+from typing import (AsyncIterable, AsyncIterator, Deque, Iterable, List,
+                    Optional, Union)
+
+from tzcity.core import tzcity, tzcity_many
+
+# Maximum number of chunks being looked up at a time by atzcity_many()
+_MAX_PENDING = 4
+
+
+async def atzcity(city: str, executor: Optional[Executor] = None) -> str:
+    """
+    Find the time zone associated with a city in an executor.
+
+    Uses the default executor of the event loop if executor is None.
+
+    Raises ValueError if unable to recognize city.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, tzcity, city)
+
+
+async def atzcity_many(
+        cities: Union[Iterable[str], AsyncIterable[str]],
+        default: Optional[str] = None,
+        chunk_size: int = 1000,
+        executor: Optional[Executor] = None,
+) -> AsyncIterator[Optional[str]]:
+    """
+    Find the time zones associated with many cities in an executor.
+
+    Accepts an iterable or an asynchronous iterable of city names.
+    They are looked up in chunks of chunk_size cities in executor, or in
+    the default executor of the event loop if executor is None.
+
+    Yields time zone names in the order of the input, as soon as the
+    chunk having them is looked up. Unrecognized names yield default.
+
+    Raises ValueError if chunk_size is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size {chunk_size}: Must be at least 1")
+    loop = asyncio.get_event_loop()
+    pending: Deque['asyncio.Future[List[Optional[str]]]'] = deque()
+    async for chunk in _chunks(cities, chunk_size):
+        pending.append(loop.run_in_executor(executor, _lookup_chunk,
+                                            chunk, default))
+        if len(pending) == _MAX_PENDING:
+            for result in await pending.popleft():
+                yield result
+    while pending:
+        for result in await pending.popleft():
+            yield result
+
+
+async def _chunks(cities: Union[Iterable[str], AsyncIterable[str]],
+                  size: int) -> AsyncIterator[List[str]]:
+    """
+    Yield lists of up to size consecutive cities.
+    """
+    if isinstance(cities, abc.AsyncIterable):
+        chunk = []
+        async for city in cities:
+            chunk.append(city)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    else:
+        iterator = iter(cities)
+        chunk = list(islice(iterator, size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, size))
+
+
+def _lookup_chunk(chunk: List[str],
+                  default: Optional[str]) -> List[Optional[str]]:
+    """
+    Return the time zones associated with a chunk of cities.
+    """
+    return list(tzcity_many(chunk, default))
@@ -0,0 +1,152 @@
+"""
+Optional cache of the results of tzcity() by the names passed to it
+
+Nothing is cached until enable() is called. The cache is shared by the
+threads of a process and is safe with or without the GIL, taking a lock
+only to change which results are kept. Its names can be saved to a file
+to warm up the cache of processes started later.
+"""
+
+# pylint: disable=protected-access
+
+import json
+import threading
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+from tzcity import core
+
+# Recognized name and tz name found for a name, or the normalized name
+# and None if it was not recognized
+Result = Tuple[str, Optional[str]]
+
+
+class ResultCache(MutableMapping[str, Result]):
+    """
+    Results of recently looked up names, including those which were not
+    recognized, in bounded memory.
+
+    Results are kept in two generations to evict the least recently used
+    ones without taking a lock on hits. New results go to the young
+    generation. When the cache is full, the oldest result of the old
+    generation is evicted, and once that is empty the young generation
+    becomes the old one. A hit in the old generation moves the result back
+    to the young one.
+
+    The cache is emptied when the data changes, as by
+    tzcity.sources.add_source(). Hits and misses are counted without a
+    lock, so counts may be slightly off when many threads look up names at
+    once.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._young: Dict[str, Result] = {}
+        self._old: Dict[str, Result] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the result for key, or default if there is none, counting
+        a hit or a miss.
+        """
+        result = self._young.get(key)
+        if result is None:
+            with self._lock:
+                result = self._old.pop(key, None)
+                if result is not None:
+                    self._young[key] = result
+            if result is None:
+                self.misses += 1
+                return default
+        self.hits += 1
+        return result
+
+    def __getitem__(self, key: str) -> Result:
+        result = self._young.get(key)
+        if result is None:
+            result = self._old[key]
+        return result
+
+    def __setitem__(self, key: str, result: Result) -> None:
+        with self._lock:
+            self._old.pop(key, None)
+            self._young[key] = result
+            if len(self._young) + len(self._old) > self.maxsize:
+                if not self._old:
+                    self._old, self._young = self._young, {}
+                del self._old[next(iter(self._old))]
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if self._young.pop(key, None) is None:
+                del self._old[key]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._old) + list(self._young))
+
+    def __len__(self) -> int:
+        return len(self._young) + len(self._old)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._young = {}
+            self._old = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the number of hits and misses so far, the hit rate and the
+        current and maximum number of results as a dictionary.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self),
+            'maxsize': self.maxsize,
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Save the cached names to a file, less recently used ones first.
+        """
+        with open(path, 'w', encoding='utf-8') as snapshot:
+            json.dump(list(self), snapshot)
+
+    def load(self, path: str) -> None:
+        """
+        Look up the names saved to a file by save() and cache the results.
+
+        Names are looked up again rather than trusting saved results, as
+        the data may differ between processes.
+        """
+        with open(path, encoding='utf-8') as snapshot:
+            names: List[str] = json.load(snapshot)
+        for name in names:
+            self[name] = core._lookup(name)
+
+
+def enable(maxsize: int = 1024,
+           snapshot: Optional[str] = None) -> ResultCache:
+    """
+    Start caching the results of tzcity() and return the cache.
+
+    Up to maxsize results are kept. If snapshot is the path of a file
+    written by ResultCache.save(), the cache is filled with the names in
+    it.
+    """
+    cache = ResultCache(maxsize)
+    if snapshot is not None:
+        cache.load(snapshot)
+    core._CACHE = cache
+    return cache
+
+
+def disable() -> None:
+    """
+    Stop caching the results of tzcity().
+    """
+    core._CACHE = None
@@ -0,0 +1,168 @@
+"""
+Command line interface of tzcity
+
+Reads city names from standard input and writes their time zone names to
+standard output, one line per input line. With --column, the input is CSV
+and the time zone name is added as a new last column.
+"""
+
+import argparse
+import csv
+import os
+import sys
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from tzcity.core import capitalize, tzcity_many
+
+# Number of lines read, looked up and written at a time
+_CHUNK_SIZE = 10_000
+
+T = TypeVar('T')
+
+
+class _Miss(Exception):
+    """
+    Raised on an unrecognized name when misses are errors.
+    """
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command line interface with the given arguments.
+
+    Returns the exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog='tzcity',
+        description="Find time zones of the city names read from "
+                    "standard input, one per line.")
+    parser.add_argument(
+        '--column',
+        help="read CSV and look up this column, given as a header name or "
+             "a column number starting from 1")
+    parser.add_argument(
+        '--capitalize', action='store_true',
+        help="capitalize the names instead of looking them up; with "
+             "--column, the column is capitalized in place")
+    parser.add_argument(
+        '--miss', choices=['skip', 'empty', 'error'], default='empty',
+        help="what to do with unrecognized names: skip the line, leave "
+             "the output empty (default) or stop with an error")
+    args = parser.parse_args(argv)
+    if args.column is not None and args.column.isdigit() \
+            and int(args.column) < 1:
+        parser.error("column numbers start from 1")
+
+    try:
+        return _run(args)
+    except BrokenPipeError:
+        # Output closed early, as by head. Send what is left to devnull,
+        # as Python flushes standard output again on exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+
+
+def _run(args: argparse.Namespace) -> int:
+    """
+    Convert standard input to standard output as args tell.
+
+    Returns the exit status.
+    """
+    try:
+        if args.column is None:
+            _convert_lines(sys.stdin, args.capitalize, args.miss)
+        else:
+            _convert_csv(sys.stdin, args.column, args.capitalize, args.miss)
+    except _Miss as miss:
+        sys.stdout.flush()
+        print(f"tzcity: {miss}", file=sys.stderr)
+        return 1
+    sys.stdout.flush()
+    return 0
+
+
+def _convert_lines(lines: Iterable[str], caps: bool, miss: str) -> None:
+    """
+    Write the converted form of each line to standard output.
+    """
+    for chunk in _chunks(lines):
+        names = [line.rstrip('\r\n') for line in chunk]
+        output = []
+        try:
+            for _, result in _convert(names, names, caps, miss):
+                output.append(f"{result}\n")
+        finally:
+            sys.stdout.write(''.join(output))
+
+
+def _convert_csv(lines: Iterable[str], column: str, caps: bool,
+                 miss: str) -> None:
+    """
+    Write CSV rows with the converted form of column to standard output.
+    """
+    rows = csv.reader(lines)
+    writer = csv.writer(sys.stdout, lineterminator='\n')
+    if column.isdigit():
+        position = int(column) - 1
+    else:
+        header = next(rows, [])
+        if column not in header:
+            raise _Miss(f"{column}: No such column")
+        position = header.index(column)
+        writer.writerow(header if caps else header + ['tz'])
+
+    for chunk in _chunks(rows):
+        names = [row[position] if position < len(row) else ''
+                 for row in chunk]
+        output = []
+        try:
+            for row, result in _convert(chunk, names, caps, miss):
+                if caps:
+                    row = row[:position] + [result] + row[position+1:]
+                else:
+                    row = row + [result]
+                output.append(row)
+        finally:
+            writer.writerows(output)
+
+
+def _convert(items: List[T], names: List[str], caps: bool,
+             miss: str) -> Iterator[Tuple[T, str]]:
+    """
+    Yield each item with the time zone or capitalized form of its name.
+
+    Items with unrecognized names are left out if miss is 'skip', get an
+    empty string if it is 'empty', and raise _Miss if it is 'error'.
+    """
+    if caps:
+        results: List[Optional[str]] = []
+        for name in names:
+            try:
+                results.append(capitalize(name.strip()))
+            except ValueError:
+                results.append(None)
+    else:
+        results = list(tzcity_many(names))
+
+    for item, name, result in zip(items, names, results):
+        if result is None:
+            if miss == 'error':
+                raise _Miss(f"{name}: Ambiguous or unknown name")
+            if miss == 'skip':
+                continue
+            result = ''
+        yield item, result
+
+
+def _chunks(items: Iterable[T]) -> Iterator[List[T]]:
+    """
+    Yield lists of consecutive items, to process input in bulk while
+    using constant memory.
+    """
+    iterator = iter(items)
+    chunk = list(islice(iterator, _CHUNK_SIZE))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, _CHUNK_SIZE))
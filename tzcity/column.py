@@ -0,0 +1,60 @@
+"""
+Lookups over whole columns of data with pandas
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, List
+
+from tzcity import core
+
+
+def tzcity_column(values: Any) -> Any:
+    """
+    Find the time zones associated with a column of city names.
+
+    Accepts a pandas Series, a NumPy array, an Arrow array or any
+    sequence. Returns a pandas Series of categorical dtype with the time
+    zone names, which are missing where a city is unrecognized or is not
+    a string. A Series argument keeps its index and name.
+
+    Every distinct value is looked up only once, so this is much faster
+    than calling tzcity() on each row of a large column.
+
+    Needs pandas to be installed.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy
+    import pandas  # type: ignore
+
+    if hasattr(values, 'to_pandas'):
+        # Arrow arrays
+        values = values.to_pandas()
+    if not isinstance(values, pandas.Series):
+        values = pandas.Series(values)
+
+    codes, uniques = pandas.factorize(values)
+    index = core._index()
+    tz_codes: List[int] = []
+    categories: List[str] = []
+    category_codes = {}
+    for city in uniques:
+        tz_value = None
+        if isinstance(city, str):
+            name = core._normalize(city)
+            tz_value = index.get(name)
+            if tz_value is None:
+                tz_value = core._find_folded(index, name)[1]
+        if tz_value is None:
+            tz_codes.append(-1)
+            continue
+        if tz_value not in category_codes:
+            category_codes[tz_value] = len(categories)
+            categories.append(core.capitalize(tz_value))
+        tz_codes.append(category_codes[tz_value])
+
+    # Missing values have a code of -1, which picks the -1 appended last
+    lookup = numpy.array(tz_codes + [-1], dtype=numpy.int64)
+    result = pandas.Categorical.from_codes(lookup[codes],
+                                           categories=categories)
+    return pandas.Series(result, index=values.index, name=values.name)
@@ -0,0 +1,2114 @@
+"""
+Lookup index compiled from tzcity/data.py by python -m tzcity.compiler
+
+Do not edit.
+"""
+
+# pylint: disable=too-many-lines
+
+# tz names separated by newlines
+ZONES = (
+    'africa/abidjan\n'
+    'africa/accra\n'
+    'africa/addis_ababa\n'
+    'africa/algiers\n'
+    'africa/asmara\n'
+    'africa/bamako\n'
+    'africa/bangui\n'
+    'africa/banjul\n'
+    'africa/bissau\n'
+    'africa/blantyre\n'
+    'africa/brazzaville\n'
+    'africa/bujumbura\n'
+    'africa/cairo\n'
+    'africa/casablanca\n'
+    'africa/ceuta\n'
+    'africa/conakry\n'
+    'africa/dakar\n'
+    'africa/dar_es_salaam\n'
+    'africa/djibouti\n'
+    'africa/douala\n'
+    'africa/el_aaiun\n'
+    'africa/freetown\n'
+    'africa/gaborone\n'
+    'africa/harare\n'
+    'africa/johannesburg\n'
+    'africa/juba\n'
+    'africa/kampala\n'
+    'africa/khartoum\n'
+    'africa/kigali\n'
+    'africa/kinshasa\n'
+    'africa/lagos\n'
+    'africa/libreville\n'
+    'africa/lome\n'
+    'africa/luanda\n'
+    'africa/lubumbashi\n'
+    'africa/lusaka\n'
+    'africa/malabo\n'
+    'africa/maputo\n'
+    'africa/maseru\n'
+    'africa/mbabane\n'
+    'africa/mogadishu\n'
+    'africa/monrovia\n'
+    'africa/nairobi\n'
+    'africa/ndjamena\n'
+    'africa/niamey\n'
+    'africa/nouakchott\n'
+    'africa/ouagadougou\n'
+    'africa/porto-novo\n'
+    'africa/sao_tome\n'
+    'africa/tripoli\n'
+    'africa/tunis\n'
+    'africa/windhoek\n'
+    'america/adak\n'
+    'america/anchorage\n'
+    'america/anguilla\n'
+    'america/antigua\n'
+    'america/araguaina\n'
+    'america/argentina/buenos_aires\n'
+    'america/argentina/catamarca\n'
+    'america/argentina/cordoba\n'
+    'america/argentina/jujuy\n'
+    'america/argentina/la_rioja\n'
+    'america/argentina/mendoza\n'
+    'america/argentina/rio_gallegos\n'
+    'america/argentina/salta\n'
+    'america/argentina/san_luis\n'
+    'america/argentina/tucuman\n'
+    'america/argentina/ushuaia\n'
+    'america/aruba\n'
+    'america/asuncion\n'
+    'america/atikokan\n'
+    'america/bahia\n'
+    'america/bahia_banderas\n'
+    'america/barbados\n'
+    'america/belem\n'
+    'america/belize\n'
+    'america/blanc-sablon\n'
+    'america/boa_vista\n'
+    'america/bogota\n'
+    'america/boise\n'
+    'america/cambridge_bay\n'
+    'america/campo_grande\n'
+    'america/cancun\n'
+    'america/caracas\n'
+    'america/cayenne\n'
+    'america/cayman\n'
+    'america/chicago\n'
+    'america/chihuahua\n'
+    'america/costa_rica\n'
+    'america/creston\n'
+    'america/cuiaba\n'
+    'america/curacao\n'
+    'america/danmarkshavn\n'
+    'america/dawson\n'
+    'america/dawson_creek\n'
+    'america/denver\n'
+    'america/detroit\n'
+    'america/dominica\n'
+    'america/edmonton\n'
+    'america/eirunepe\n'
+    'america/el_salvador\n'
+    'america/fortaleza\n'
+    'america/fort_nelson\n'
+    'america/glace_bay\n'
+    'america/goose_bay\n'
+    'america/grand_turk\n'
+    'america/grenada\n'
+    'america/guadeloupe\n'
+    'america/guatemala\n'
+    'america/guayaquil\n'
+    'america/guyana\n'
+    'america/halifax\n'
+    'america/havana\n'
+    'america/hermosillo\n'
+    'america/indiana/indianapolis\n'
+    'america/indiana/tell_city\n'
+    'america/indiana/vevay\n'
+    'america/indiana/vincennes\n'
+    'america/indiana/winamac\n'
+    'america/inuvik\n'
+    'america/iqaluit\n'
+    'america/jamaica\n'
+    'america/juneau\n'
+    'america/kentucky/louisville\n'
+    'america/kralendijk\n'
+    'america/la_paz\n'
+    'america/lima\n'
+    'america/los_angeles\n'
+    'america/lower_princes\n'
+    'america/maceio\n'
+    'america/managua\n'
+    'america/manaus\n'
+    'america/marigot\n'
+    'america/martinique\n'
+    'america/matamoros\n'
+    'america/mazatlan\n'
+    'america/menominee\n'
+    'america/merida\n'
+    'america/metlakatla\n'
+    'america/mexico_city\n'
+    'america/miquelon\n'
+    'america/moncton\n'
+    'america/monterrey\n'
+    'america/montevideo\n'
+    'america/montserrat\n'
+    'america/nassau\n'
+    'america/new_york\n'
+    'america/nipigon\n'
+    'america/nome\n'
+    'america/noronha\n'
+    'america/north_dakota/beulah\n'
+    'america/nuuk\n'
+    'america/ojinaga\n'
+    'america/panama\n'
+    'america/pangnirtung\n'
+    'america/paramaribo\n'
+    'america/phoenix\n'
+    'america/port-au-prince\n'
+    'america/port_of_spain\n'
+    'america/porto_velho\n'
+    'america/puerto_rico\n'
+    'america/punta_arenas\n'
+    'america/rainy_river\n'
+    'america/rankin_inlet\n'
+    'america/recife\n'
+    'america/regina\n'
+    'america/resolute\n'
+    'america/rio_branco\n'
+    'america/santarem\n'
+    'america/santiago\n'
+    'america/santo_domingo\n'
+    'america/sao_paulo\n'
+    'america/scoresbysund\n'
+    'america/sitka\n'
+    'america/st_barthelemy\n'
+    'america/st_johns\n'
+    'america/st_kitts\n'
+    'america/st_lucia\n'
+    'america/st_vincent\n'
+    'america/swift_current\n'
+    'america/tegucigalpa\n'
+    'america/thule\n'
+    'america/thunder_bay\n'
+    'america/tijuana\n'
+    'america/toronto\n'
+    'america/tortola\n'
+    'america/vancouver\n'
+    'america/whitehorse\n'
+    'america/winnipeg\n'
+    'america/yakutat\n'
+    'america/yellowknife\n'
+    'antarctica/casey\n'
+    'antarctica/davis\n'
+    'antarctica/dumontdurville\n'
+    'antarctica/macquarie\n'
+    'antarctica/mawson\n'
+    'antarctica/mcmurdo\n'
+    'antarctica/palmer\n'
+    'antarctica/rothera\n'
+    'antarctica/syowa\n'
+    'antarctica/troll\n'
+    'antarctica/vostok\n'
+    'arctic/longyearbyen\n'
+    'asia/aden\n'
+    'asia/almaty\n'
+    'asia/amman\n'
+    'asia/anadyr\n'
+    'asia/aqtau\n'
+    'asia/aqtobe\n'
+    'asia/ashgabat\n'
+    'asia/atyrau\n'
+    'asia/baghdad\n'
+    'asia/bahrain\n'
+    'asia/baku\n'
+    'asia/bangkok\n'
+    'asia/barnaul\n'
+    'asia/beirut\n'
+    'asia/bishkek\n'
+    'asia/brunei\n'
+    'asia/chita\n'
+    'asia/choibalsan\n'
+    'asia/colombo\n'
+    'asia/damascus\n'
+    'asia/dhaka\n'
+    'asia/dili\n'
+    'asia/dubai\n'
+    'asia/dushanbe\n'
+    'asia/famagusta\n'
+    'asia/gaza\n'
+    'asia/hebron\n'
+    'asia/ho_chi_minh\n'
+    'asia/hong_kong\n'
+    'asia/hovd\n'
+    'asia/irkutsk\n'
+    'asia/jakarta\n'
+    'asia/jayapura\n'
+    'asia/jerusalem\n'
+    'asia/kabul\n'
+    'asia/kamchatka\n'
+    'asia/karachi\n'
+    'asia/kathmandu\n'
+    'asia/khandyga\n'
+    'asia/kolkata\n'
+    'asia/krasnoyarsk\n'
+    'asia/kuala_lumpur\n'
+    'asia/kuching\n'
+    'asia/kuwait\n'
+    'asia/macau\n'
+    'asia/magadan\n'
+    'asia/makassar\n'
+    'asia/manila\n'
+    'asia/muscat\n'
+    'asia/nicosia\n'
+    'asia/novokuznetsk\n'
+    'asia/novosibirsk\n'
+    'asia/omsk\n'
+    'asia/oral\n'
+    'asia/phnom_penh\n'
+    'asia/pontianak\n'
+    'asia/pyongyang\n'
+    'asia/qatar\n'
+    'asia/qostanay\n'
+    'asia/qyzylorda\n'
+    'asia/riyadh\n'
+    'asia/sakhalin\n'
+    'asia/samarkand\n'
+    'asia/seoul\n'
+    'asia/shanghai\n'
+    'asia/singapore\n'
+    'asia/srednekolymsk\n'
+    'asia/taipei\n'
+    'asia/tashkent\n'
+    'asia/tbilisi\n'
+    'asia/tehran\n'
+    'asia/thimphu\n'
+    'asia/tokyo\n'
+    'asia/tomsk\n'
+    'asia/ulaanbaatar\n'
+    'asia/urumqi\n'
+    'asia/ust-nera\n'
+    'asia/vientiane\n'
+    'asia/vladivostok\n'
+    'asia/yakutsk\n'
+    'asia/yangon\n'
+    'asia/yekaterinburg\n'
+    'asia/yerevan\n'
+    'atlantic/azores\n'
+    'atlantic/bermuda\n'
+    'atlantic/canary\n'
+    'atlantic/cape_verde\n'
+    'atlantic/faroe\n'
+    'atlantic/madeira\n'
+    'atlantic/reykjavik\n'
+    'atlantic/south_georgia\n'
+    'atlantic/stanley\n'
+    'atlantic/st_helena\n'
+    'australia/adelaide\n'
+    'australia/brisbane\n'
+    'australia/broken_hill\n'
+    'australia/currie\n'
+    'australia/darwin\n'
+    'australia/eucla\n'
+    'australia/hobart\n'
+    'australia/lindeman\n'
+    'australia/lord_howe\n'
+    'australia/melbourne\n'
+    'australia/perth\n'
+    'australia/sydney\n'
+    'europe/amsterdam\n'
+    'europe/andorra\n'
+    'europe/astrakhan\n'
+    'europe/athens\n'
+    'europe/belgrade\n'
+    'europe/berlin\n'
+    'europe/bratislava\n'
+    'europe/brussels\n'
+    'europe/bucharest\n'
+    'europe/budapest\n'
+    'europe/busingen\n'
+    'europe/chisinau\n'
+    'europe/copenhagen\n'
+    'europe/dublin\n'
+    'europe/gibraltar\n'
+    'europe/guernsey\n'
+    'europe/helsinki\n'
+    'europe/isle_of_man\n'
+    'europe/istanbul\n'
+    'europe/jersey\n'
+    'europe/kaliningrad\n'
+    'europe/kiev\n'
+    'europe/kirov\n'
+    'europe/lisbon\n'
+    'europe/ljubljana\n'
+    'europe/london\n'
+    'europe/luxembourg\n'
+    'europe/madrid\n'
+    'europe/malta\n'
+    'europe/mariehamn\n'
+    'europe/minsk\n'
+    'europe/monaco\n'
+    'europe/moscow\n'
+    'europe/oslo\n'
+    'europe/paris\n'
+    'europe/podgorica\n'
+    'europe/prague\n'
+    'europe/riga\n'
+    'europe/rome\n'
+    'europe/samara\n'
+    'europe/san_marino\n'
+    'europe/sarajevo\n'
+    'europe/saratov\n'
+    'europe/simferopol\n'
+    'europe/skopje\n'
+    'europe/sofia\n'
+    'europe/stockholm\n'
+    'europe/tallinn\n'
+    'europe/tirane\n'
+    'europe/ulyanovsk\n'
+    'europe/uzhgorod\n'
+    'europe/vaduz\n'
+    'europe/vatican\n'
+    'europe/vienna\n'
+    'europe/vilnius\n'
+    'europe/volgograd\n'
+    'europe/warsaw\n'
+    'europe/zagreb\n'
+    'europe/zaporozhye\n'
+    'europe/zurich\n'
+    'indian/antananarivo\n'
+    'indian/chagos\n'
+    'indian/christmas\n'
+    'indian/cocos\n'
+    'indian/comoro\n'
+    'indian/kerguelen\n'
+    'indian/mahe\n'
+    'indian/maldives\n'
+    'indian/mauritius\n'
+    'indian/mayotte\n'
+    'indian/reunion\n'
+    'pacific/apia\n'
+    'pacific/auckland\n'
+    'pacific/bougainville\n'
+    'pacific/chatham\n'
+    'pacific/chuuk\n'
+    'pacific/easter\n'
+    'pacific/efate\n'
+    'pacific/enderbury\n'
+    'pacific/fakaofo\n'
+    'pacific/fiji\n'
+    'pacific/funafuti\n'
+    'pacific/galapagos\n'
+    'pacific/gambier\n'
+    'pacific/guadalcanal\n'
+    'pacific/guam\n'
+    'pacific/honolulu\n'
+    'pacific/kiritimati\n'
+    'pacific/kosrae\n'
+    'pacific/kwajalein\n'
+    'pacific/majuro\n'
+    'pacific/marquesas\n'
+    'pacific/nauru\n'
+    'pacific/niue\n'
+    'pacific/norfolk\n'
+    'pacific/noumea\n'
+    'pacific/pago_pago\n'
+    'pacific/palau\n'
+    'pacific/pitcairn\n'
+    'pacific/pohnpei\n'
+    'pacific/port_moresby\n'
+    'pacific/rarotonga\n'
+    'pacific/saipan\n'
+    'pacific/tahiti\n'
+    'pacific/tarawa\n'
+    'pacific/tongatapu\n'
+    'pacific/wallis'
+)
+
+# Capitalized tz names separated by newlines
+ZONE_CAPS = (
+    'Africa/Abidjan\n'
+    'Africa/Accra\n'
+    'Africa/Addis_Ababa\n'
+    'Africa/Algiers\n'
+    'Africa/Asmara\n'
+    'Africa/Bamako\n'
+    'Africa/Bangui\n'
+    'Africa/Banjul\n'
+    'Africa/Bissau\n'
+    'Africa/Blantyre\n'
+    'Africa/Brazzaville\n'
+    'Africa/Bujumbura\n'
+    'Africa/Cairo\n'
+    'Africa/Casablanca\n'
+    'Africa/Ceuta\n'
+    'Africa/Conakry\n'
+    'Africa/Dakar\n'
+    'Africa/Dar_es_Salaam\n'
+    'Africa/Djibouti\n'
+    'Africa/Douala\n'
+    'Africa/El_Aaiun\n'
+    'Africa/Freetown\n'
+    'Africa/Gaborone\n'
+    'Africa/Harare\n'
+    'Africa/Johannesburg\n'
+    'Africa/Juba\n'
+    'Africa/Kampala\n'
+    'Africa/Khartoum\n'
+    'Africa/Kigali\n'
+    'Africa/Kinshasa\n'
+    'Africa/Lagos\n'
+    'Africa/Libreville\n'
+    'Africa/Lome\n'
+    'Africa/Luanda\n'
+    'Africa/Lubumbashi\n'
+    'Africa/Lusaka\n'
+    'Africa/Malabo\n'
+    'Africa/Maputo\n'
+    'Africa/Maseru\n'
+    'Africa/Mbabane\n'
+    'Africa/Mogadishu\n'
+    'Africa/Monrovia\n'
+    'Africa/Nairobi\n'
+    'Africa/Ndjamena\n'
+    'Africa/Niamey\n'
+    'Africa/Nouakchott\n'
+    'Africa/Ouagadougou\n'
+    'Africa/Porto-Novo\n'
+    'Africa/Sao_Tome\n'
+    'Africa/Tripoli\n'
+    'Africa/Tunis\n'
+    'Africa/Windhoek\n'
+    'America/Adak\n'
+    'America/Anchorage\n'
+    'America/Anguilla\n'
+    'America/Antigua\n'
+    'America/Araguaina\n'
+    'America/Argentina/Buenos_Aires\n'
+    'America/Argentina/Catamarca\n'
+    'America/Argentina/Cordoba\n'
+    'America/Argentina/Jujuy\n'
+    'America/Argentina/La_Rioja\n'
+    'America/Argentina/Mendoza\n'
+    'America/Argentina/Rio_Gallegos\n'
+    'America/Argentina/Salta\n'
+    'America/Argentina/San_Luis\n'
+    'America/Argentina/Tucuman\n'
+    'America/Argentina/Ushuaia\n'
+    'America/Aruba\n'
+    'America/Asuncion\n'
+    'America/Atikokan\n'
+    'America/Bahia\n'
+    'America/Bahia_Banderas\n'
+    'America/Barbados\n'
+    'America/Belem\n'
+    'America/Belize\n'
+    'America/Blanc-Sablon\n'
+    'America/Boa_Vista\n'
+    'America/Bogota\n'
+    'America/Boise\n'
+    'America/Cambridge_Bay\n'
+    'America/Campo_Grande\n'
+    'America/Cancun\n'
+    'America/Caracas\n'
+    'America/Cayenne\n'
+    'America/Cayman\n'
+    'America/Chicago\n'
+    'America/Chihuahua\n'
+    'America/Costa_Rica\n'
+    'America/Creston\n'
+    'America/Cuiaba\n'
+    'America/Curacao\n'
+    'America/Danmarkshavn\n'
+    'America/Dawson\n'
+    'America/Dawson_Creek\n'
+    'America/Denver\n'
+    'America/Detroit\n'
+    'America/Dominica\n'
+    'America/Edmonton\n'
+    'America/Eirunepe\n'
+    'America/El_Salvador\n'
+    'America/Fortaleza\n'
+    'America/Fort_Nelson\n'
+    'America/Glace_Bay\n'
+    'America/Goose_Bay\n'
+    'America/Grand_Turk\n'
+    'America/Grenada\n'
+    'America/Guadeloupe\n'
+    'America/Guatemala\n'
+    'America/Guayaquil\n'
+    'America/Guyana\n'
+    'America/Halifax\n'
+    'America/Havana\n'
+    'America/Hermosillo\n'
+    'America/Indiana/Indianapolis\n'
+    'America/Indiana/Tell_City\n'
+    'America/Indiana/Vevay\n'
+    'America/Indiana/Vincennes\n'
+    'America/Indiana/Winamac\n'
+    'America/Inuvik\n'
+    'America/Iqaluit\n'
+    'America/Jamaica\n'
+    'America/Juneau\n'
+    'America/Kentucky/Louisville\n'
+    'America/Kralendijk\n'
+    'America/La_Paz\n'
+    'America/Lima\n'
+    'America/Los_Angeles\n'
+    'America/Lower_Princes\n'
+    'America/Maceio\n'
+    'America/Managua\n'
+    'America/Manaus\n'
+    'America/Marigot\n'
+    'America/Martinique\n'
+    'America/Matamoros\n'
+    'America/Mazatlan\n'
+    'America/Menominee\n'
+    'America/Merida\n'
+    'America/Metlakatla\n'
+    'America/Mexico_City\n'
+    'America/Miquelon\n'
+    'America/Moncton\n'
+    'America/Monterrey\n'
+    'America/Montevideo\n'
+    'America/Montserrat\n'
+    'America/Nassau\n'
+    'America/New_York\n'
+    'America/Nipigon\n'
+    'America/Nome\n'
+    'America/Noronha\n'
+    'America/North_Dakota/Beulah\n'
+    'America/Nuuk\n'
+    'America/Ojinaga\n'
+    'America/Panama\n'
+    'America/Pangnirtung\n'
+    'America/Paramaribo\n'
+    'America/Phoenix\n'
+    'America/Port-au-Prince\n'
+    'America/Port_of_Spain\n'
+    'America/Porto_Velho\n'
+    'America/Puerto_Rico\n'
+    'America/Punta_Arenas\n'
+    'America/Rainy_River\n'
+    'America/Rankin_Inlet\n'
+    'America/Recife\n'
+    'America/Regina\n'
+    'America/Resolute\n'
+    'America/Rio_Branco\n'
+    'America/Santarem\n'
+    'America/Santiago\n'
+    'America/Santo_Domingo\n'
+    'America/Sao_Paulo\n'
+    'America/Scoresbysund\n'
+    'America/Sitka\n'
+    'America/St_Barthelemy\n'
+    'America/St_Johns\n'
+    'America/St_Kitts\n'
+    'America/St_Lucia\n'
+    'America/St_Vincent\n'
+    'America/Swift_Current\n'
+    'America/Tegucigalpa\n'
+    'America/Thule\n'
+    'America/Thunder_Bay\n'
+    'America/Tijuana\n'
+    'America/Toronto\n'
+    'America/Tortola\n'
+    'America/Vancouver\n'
+    'America/Whitehorse\n'
+    'America/Winnipeg\n'
+    'America/Yakutat\n'
+    'America/Yellowknife\n'
+    'Antarctica/Casey\n'
+    'Antarctica/Davis\n'
+    'Antarctica/DumontDUrville\n'
+    'Antarctica/Macquarie\n'
+    'Antarctica/Mawson\n'
+    'Antarctica/McMurdo\n'
+    'Antarctica/Palmer\n'
+    'Antarctica/Rothera\n'
+    'Antarctica/Syowa\n'
+    'Antarctica/Troll\n'
+    'Antarctica/Vostok\n'
+    'Arctic/Longyearbyen\n'
+    'Asia/Aden\n'
+    'Asia/Almaty\n'
+    'Asia/Amman\n'
+    'Asia/Anadyr\n'
+    'Asia/Aqtau\n'
+    'Asia/Aqtobe\n'
+    'Asia/Ashgabat\n'
+    'Asia/Atyrau\n'
+    'Asia/Baghdad\n'
+    'Asia/Bahrain\n'
+    'Asia/Baku\n'
+    'Asia/Bangkok\n'
+    'Asia/Barnaul\n'
+    'Asia/Beirut\n'
+    'Asia/Bishkek\n'
+    'Asia/Brunei\n'
+    'Asia/Chita\n'
+    'Asia/Choibalsan\n'
+    'Asia/Colombo\n'
+    'Asia/Damascus\n'
+    'Asia/Dhaka\n'
+    'Asia/Dili\n'
+    'Asia/Dubai\n'
+    'Asia/Dushanbe\n'
+    'Asia/Famagusta\n'
+    'Asia/Gaza\n'
+    'Asia/Hebron\n'
+    'Asia/Ho_Chi_Minh\n'
+    'Asia/Hong_Kong\n'
+    'Asia/Hovd\n'
+    'Asia/Irkutsk\n'
+    'Asia/Jakarta\n'
+    'Asia/Jayapura\n'
+    'Asia/Jerusalem\n'
+    'Asia/Kabul\n'
+    'Asia/Kamchatka\n'
+    'Asia/Karachi\n'
+    'Asia/Kathmandu\n'
+    'Asia/Khandyga\n'
+    'Asia/Kolkata\n'
+    'Asia/Krasnoyarsk\n'
+    'Asia/Kuala_Lumpur\n'
+    'Asia/Kuching\n'
+    'Asia/Kuwait\n'
+    'Asia/Macau\n'
+    'Asia/Magadan\n'
+    'Asia/Makassar\n'
+    'Asia/Manila\n'
+    'Asia/Muscat\n'
+    'Asia/Nicosia\n'
+    'Asia/Novokuznetsk\n'
+    'Asia/Novosibirsk\n'
+    'Asia/Omsk\n'
+    'Asia/Oral\n'
+    'Asia/Phnom_Penh\n'
+    'Asia/Pontianak\n'
+    'Asia/Pyongyang\n'
+    'Asia/Qatar\n'
+    'Asia/Qostanay\n'
+    'Asia/Qyzylorda\n'
+    'Asia/Riyadh\n'
+    'Asia/Sakhalin\n'
+    'Asia/Samarkand\n'
+    'Asia/Seoul\n'
+    'Asia/Shanghai\n'
+    'Asia/Singapore\n'
+    'Asia/Srednekolymsk\n'
+    'Asia/Taipei\n'
+    'Asia/Tashkent\n'
+    'Asia/Tbilisi\n'
+    'Asia/Tehran\n'
+    'Asia/Thimphu\n'
+    'Asia/Tokyo\n'
+    'Asia/Tomsk\n'
+    'Asia/Ulaanbaatar\n'
+    'Asia/Urumqi\n'
+    'Asia/Ust-Nera\n'
+    'Asia/Vientiane\n'
+    'Asia/Vladivostok\n'
+    'Asia/Yakutsk\n'
+    'Asia/Yangon\n'
+    'Asia/Yekaterinburg\n'
+    'Asia/Yerevan\n'
+    'Atlantic/Azores\n'
+    'Atlantic/Bermuda\n'
+    'Atlantic/Canary\n'
+    'Atlantic/Cape_Verde\n'
+    'Atlantic/Faroe\n'
+    'Atlantic/Madeira\n'
+    'Atlantic/Reykjavik\n'
+    'Atlantic/South_Georgia\n'
+    'Atlantic/Stanley\n'
+    'Atlantic/St_Helena\n'
+    'Australia/Adelaide\n'
+    'Australia/Brisbane\n'
+    'Australia/Broken_Hill\n'
+    'Australia/Currie\n'
+    'Australia/Darwin\n'
+    'Australia/Eucla\n'
+    'Australia/Hobart\n'
+    'Australia/Lindeman\n'
+    'Australia/Lord_Howe\n'
+    'Australia/Melbourne\n'
+    'Australia/Perth\n'
+    'Australia/Sydney\n'
+    'Europe/Amsterdam\n'
+    'Europe/Andorra\n'
+    'Europe/Astrakhan\n'
+    'Europe/Athens\n'
+    'Europe/Belgrade\n'
+    'Europe/Berlin\n'
+    'Europe/Bratislava\n'
+    'Europe/Brussels\n'
+    'Europe/Bucharest\n'
+    'Europe/Budapest\n'
+    'Europe/Busingen\n'
+    'Europe/Chisinau\n'
+    'Europe/Copenhagen\n'
+    'Europe/Dublin\n'
+    'Europe/Gibraltar\n'
+    'Europe/Guernsey\n'
+    'Europe/Helsinki\n'
+    'Europe/Isle_of_Man\n'
+    'Europe/Istanbul\n'
+    'Europe/Jersey\n'
+    'Europe/Kaliningrad\n'
+    'Europe/Kiev\n'
+    'Europe/Kirov\n'
+    'Europe/Lisbon\n'
+    'Europe/Ljubljana\n'
+    'Europe/London\n'
+    'Europe/Luxembourg\n'
+    'Europe/Madrid\n'
+    'Europe/Malta\n'
+    'Europe/Mariehamn\n'
+    'Europe/Minsk\n'
+    'Europe/Monaco\n'
+    'Europe/Moscow\n'
+    'Europe/Oslo\n'
+    'Europe/Paris\n'
+    'Europe/Podgorica\n'
+    'Europe/Prague\n'
+    'Europe/Riga\n'
+    'Europe/Rome\n'
+    'Europe/Samara\n'
+    'Europe/San_Marino\n'
+    'Europe/Sarajevo\n'
+    'Europe/Saratov\n'
+    'Europe/Simferopol\n'
+    'Europe/Skopje\n'
+    'Europe/Sofia\n'
+    'Europe/Stockholm\n'
+    'Europe/Tallinn\n'
+    'Europe/Tirane\n'
+    'Europe/Ulyanovsk\n'
+    'Europe/Uzhgorod\n'
+    'Europe/Vaduz\n'
+    'Europe/Vatican\n'
+    'Europe/Vienna\n'
+    'Europe/Vilnius\n'
+    'Europe/Volgograd\n'
+    'Europe/Warsaw\n'
+    'Europe/Zagreb\n'
+    'Europe/Zaporozhye\n'
+    'Europe/Zurich\n'
+    'Indian/Antananarivo\n'
+    'Indian/Chagos\n'
+    'Indian/Christmas\n'
+    'Indian/Cocos\n'
+    'Indian/Comoro\n'
+    'Indian/Kerguelen\n'
+    'Indian/Mahe\n'
+    'Indian/Maldives\n'
+    'Indian/Mauritius\n'
+    'Indian/Mayotte\n'
+    'Indian/Reunion\n'
+    'Pacific/Apia\n'
+    'Pacific/Auckland\n'
+    'Pacific/Bougainville\n'
+    'Pacific/Chatham\n'
+    'Pacific/Chuuk\n'
+    'Pacific/Easter\n'
+    'Pacific/Efate\n'
+    'Pacific/Enderbury\n'
+    'Pacific/Fakaofo\n'
+    'Pacific/Fiji\n'
+    'Pacific/Funafuti\n'
+    'Pacific/Galapagos\n'
+    'Pacific/Gambier\n'
+    'Pacific/Guadalcanal\n'
+    'Pacific/Guam\n'
+    'Pacific/Honolulu\n'
+    'Pacific/Kiritimati\n'
+    'Pacific/Kosrae\n'
+    'Pacific/Kwajalein\n'
+    'Pacific/Majuro\n'
+    'Pacific/Marquesas\n'
+    'Pacific/Nauru\n'
+    'Pacific/Niue\n'
+    'Pacific/Norfolk\n'
+    'Pacific/Noumea\n'
+    'Pacific/Pago_Pago\n'
+    'Pacific/Palau\n'
+    'Pacific/Pitcairn\n'
+    'Pacific/Pohnpei\n'
+    'Pacific/Port_Moresby\n'
+    'Pacific/Rarotonga\n'
+    'Pacific/Saipan\n'
+    'Pacific/Tahiti\n'
+    'Pacific/Tarawa\n'
+    'Pacific/Tongatapu\n'
+    'Pacific/Wallis'
+)
+
+# Recognized names separated by newlines, in the order of precedence
+NAMES = (
+    'africa/abidjan\n'
+    'abidjan\n'
+    "cote d'ivoire\n"
+    'ivory coast\n'
+    'yamoussaoukro\n'
+    'africa/accra\n'
+    'accra\n'
+    'ghana\n'
+    'africa/addis_ababa\n'
+    'addis ababa\n'
+    'ethiopia\n'
+    'africa/algiers\n'
+    'algiers\n'
+    'algeria\n'
+    'cet\n'
+    'africa/asmara\n'
+    'asmara\n'
+    'eritrea\n'
+    'africa/bamako\n'
+    'bamako\n'
+    'mali\n'
+    'africa/bangui\n'
+    'bangui\n'
+    'central african republic\n'
+    'africa/banjul\n'
+    'banjul\n'
+    'gambia\n'
+    'africa/bissau\n'
+    'bissau\n'
+    'guinea-bissau\n'
+    'africa/blantyre\n'
+    'blantyre\n'
+    'malawi\n'
+    'lilongwe\n'
+    'africa/brazzaville\n'
+    'brazzaville\n'
+    'rotc\n'
+    'congo-brazzaville\n'
+    'congo republic\n'
+    'africa/bujumbura\n'
+    'bujumbura\n'
+    'burundi\n'
+    'africa/cairo\n'
+    'cairo\n'
+    'egypt\n'
+    'eet\n'
+    'africa/casablanca\n'
+    'casablanca\n'
+    'morocco\n'
+    'rabat\n'
+    'africa/ceuta\n'
+    'ceuta\n'
+    'africa/conakry\n'
+    'conakry\n'
+    'guinea\n'
+    'africa/dakar\n'
+    'dakar\n'
+    'senegal\n'
+    'africa/dar_es_salaam\n'
+    'dar es salaam\n'
+    'tanzania\n'
+    'dodoma\n'
+    'zanzibar\n'
+    'africa/djibouti\n'
+    'djibouti\n'
+    'africa/douala\n'
+    'douala\n'
+    'cameroon\n'
+    'yaounde\n'
+    'africa/el_aaiun\n'
+    'el aaiun\n'
+    'western sahara\n'
+    'laayoune\n'
+    'africa/freetown\n'
+    'freetown\n'
+    'sierra leone\n'
+    'africa/gaborone\n'
+    'gaborone\n'
+    'botswana\n'
+    'africa/harare\n'
+    'harare\n'
+    'zimbabwe\n'
+    'africa/johannesburg\n'
+    'johannesburg\n'
+    'pretoria\n'
+    'africa/juba\n'
+    'juba\n'
+    'south sudan\n'
+    'africa/kampala\n'
+    'kampala\n'
+    'uganda\n'
+    'africa/khartoum\n'
+    'khartoum\n'
+    'sudan\n'
+    'africa/kigali\n'
+    'kigali\n'
+    'rwanda\n'
+    'africa/kinshasa\n'
+    'kinshasa\n'
+    'africa/lagos\n'
+    'lagos\n'
+    'nigeria\n'
+    'abuja\n'
+    'africa/libreville\n'
+    'libreville\n'
+    'gabon\n'
+    'africa/lome\n'
+    'lome\n'
+    'togo\n'
+    'africa/luanda\n'
+    'luanda\n'
+    'angola\n'
+    'africa/lubumbashi\n'
+    'lubumbashi\n'
+    'africa/lusaka\n'
+    'lusaka\n'
+    'zambia\n'
+    'africa/malabo\n'
+    'malabo\n'
+    'equatorial guinea\n'
+    'bata\n'
+    'africa/maputo\n'
+    'maputo\n'
+    'mozambique\n'
+    'africa/maseru\n'
+    'maseru\n'
+    'lesotho\n'
+    'africa/mbabane\n'
+    'mbabane\n'
+    'swaziland\n'
+    'eswatini\n'
+    'africa/mogadishu\n'
+    'mogadishu\n'
+    'somalia\n'
+    'hargeisa\n'
+    'africa/monrovia\n'
+    'monrovia\n'
+    'liberia\n'
+    'africa/nairobi\n'
+    'nairobi\n'
+    'kenya\n'
+    'africa/ndjamena\n'
+    'ndjamena\n'
+    'chad\n'
+    "n'djamena\n"
+    'africa/niamey\n'
+    'niamey\n'
+    'niger\n'
+    'africa/nouakchott\n'
+    'nouakchott\n'
+    'mauritania\n'
+    'africa/ouagadougou\n'
+    'ouagadougou\n'
+    'burkina faso\n'
+    'africa/porto-novo\n'
+    'porto-novo\n'
+    'benin\n'
+    'cotonou\n'
+    'africa/sao_tome\n'
+    'sao tome\n'
+    'sao tome and principe\n'
+    'africa/tripoli\n'
+    'tripoli\n'
+    'libya\n'
+    'africa/tunis\n'
+    'tunis\n'
+    'tunisia\n'
+    'africa/windhoek\n'
+    'windhoek\n'
+    'namibia\n'
+    'america/adak\n'
+    'adak\n'
+    'america/anchorage\n'
+    'anchorage\n'
+    'america/anguilla\n'
+    'anguilla\n'
+    'america/antigua\n'
+    'antigua\n'
+    'antigua and barbuda\n'
+    'america/araguaina\n'
+    'araguaina\n'
+    'america/argentina/buenos_aires\n'
+    'buenos aires\n'
+    'america/argentina/catamarca\n'
+    'catamarca\n'
+    'america/argentina/cordoba\n'
+    'cordoba\n'
+    'america/argentina/jujuy\n'
+    'jujuy\n'
+    'america/argentina/la_rioja\n'
+    'la rioja\n'
+    'america/argentina/mendoza\n'
+    'mendoza\n'
+    'america/argentina/rio_gallegos\n'
+    'rio gallegos\n'
+    'america/argentina/salta\n'
+    'salta\n'
+    'america/argentina/san_luis\n'
+    'san luis\n'
+    'america/argentina/tucuman\n'
+    'tucuman\n'
+    'america/argentina/ushuaia\n'
+    'ushuaia\n'
+    'america/aruba\n'
+    'aruba\n'
+    'oranjestad\n'
+    'america/asuncion\n'
+    'asuncion\n'
+    'paraguay\n'
+    'america/atikokan\n'
+    'atikokan\n'
+    'america/bahia\n'
+    'bahia\n'
+    'america/bahia_banderas\n'
+    'bahia banderas\n'
+    'america/barbados\n'
+    'barbados\n'
+    'bridgetown\n'
+    'america/belem\n'
+    'belem\n'
+    'america/belize\n'
+    'belize\n'
+    'belmopan\n'
+    'america/blanc-sablon\n'
+    'blanc-sablon\n'
+    'america/boa_vista\n'
+    'boa vista\n'
+    'america/bogota\n'
+    'bogota\n'
+    'colombia\n'
+    'america/boise\n'
+    'boise\n'
+    'america/cambridge_bay\n'
+    'cambridge bay\n'
+    'america/campo_grande\n'
+    'campo grande\n'
+    'america/cancun\n'
+    'cancun\n'
+    'america/caracas\n'
+    'caracas\n'
+    'venezuela\n'
+    'america/cayenne\n'
+    'cayenne\n'
+    'french guiana\n'
+    'america/cayman\n'
+    'cayman\n'
+    'america/chicago\n'
+    'chicago\n'
+    'houston\n'
+    'oklahoma\n'
+    'dallas\n'
+    'america/chihuahua\n'
+    'chihuahua\n'
+    'america/costa_rica\n'
+    'costa rica\n'
+    'san jose\n'
+    'america/creston\n'
+    'creston\n'
+    'america/cuiaba\n'
+    'cuiaba\n'
+    'america/curacao\n'
+    'curacao\n'
+    'willemstad\n'
+    'america/danmarkshavn\n'
+    'danmarkshavn\n'
+    'america/dawson\n'
+    'dawson\n'
+    'america/dawson_creek\n'
+    'dawson creek\n'
+    'america/denver\n'
+    'denver\n'
+    'cheyenne\n'
+    'salt lake city\n'
+    'america/detroit\n'
+    'detroit\n'
+    'america/dominica\n'
+    'dominica\n'
+    'roseau\n'
+    'america/edmonton\n'
+    'edmonton\n'
+    'america/eirunepe\n'
+    'eirunepe\n'
+    'america/el_salvador\n'
+    'el salvador\n'
+    'san salvador\n'
+    'america/fortaleza\n'
+    'fortaleza\n'
+    'america/fort_nelson\n'
+    'fort nelson\n'
+    'america/glace_bay\n'
+    'glace bay\n'
+    'america/goose_bay\n'
+    'goose bay\n'
+    'america/grand_turk\n'
+    'grand turk\n'
+    'turks and caicos islands\n'
+    'america/grenada\n'
+    'grenada\n'
+    'america/guadeloupe\n'
+    'guadeloupe\n'
+    'america/guatemala\n'
+    'guatemala\n'
+    'guatemala city\n'
+    'america/guayaquil\n'
+    'guayaquil\n'
+    'quito\n'
+    'america/guyana\n'
+    'guyana\n'
+    'america/halifax\n'
+    'halifax\n'
+    'america/havana\n'
+    'havana\n'
+    'cuba\n'
+    'america/hermosillo\n'
+    'hermosillo\n'
+    'america/indiana/indianapolis\n'
+    'indianapolis\n'
+    'america/indiana/tell_city\n'
+    'tell city\n'
+    'america/indiana/vevay\n'
+    'vevay\n'
+    'america/indiana/vincennes\n'
+    'vincennes\n'
+    'america/indiana/winamac\n'
+    'winamac\n'
+    'america/inuvik\n'
+    'inuvik\n'
+    'america/iqaluit\n'
+    'iqaluit\n'
+    'america/jamaica\n'
+    'jamaica\n'
+    'kingston\n'
+    'america/juneau\n'
+    'juneau\n'
+    'america/kentucky/louisville\n'
+    'louisville\n'
+    'america/kralendijk\n'
+    'kralendijk\n'
+    'bonaire\n'
+    'america/la_paz\n'
+    'la paz\n'
+    'bolivia\n'
+    'sucre\n'
+    'america/lima\n'
+    'lima\n'
+    'peru\n'
+    'america/los_angeles\n'
+    'los angeles\n'
+    'las vegas\n'
+    'san francisco\n'
+    'pdt\n'
+    'pst\n'
+    'pt\n'
+    'america/lower_princes\n'
+    'lower princes\n'
+    'america/maceio\n'
+    'maceio\n'
+    'america/managua\n'
+    'managua\n'
+    'nicaragua\n'
+    'america/manaus\n'
+    'manaus\n'
+    'america/marigot\n'
+    'marigot\n'
+    'collectivity of saint martin\n'
+    'america/martinique\n'
+    'martinique\n'
+    'fort-de-france\n'
+    'fort de france\n'
+    'america/matamoros\n'
+    'matamoros\n'
+    'america/mazatlan\n'
+    'mazatlan\n'
+    'america/menominee\n'
+    'menominee\n'
+    'america/merida\n'
+    'merida\n'
+    'america/metlakatla\n'
+    'metlakatla\n'
+    'america/mexico_city\n'
+    'mexico city\n'
+    'america/miquelon\n'
+    'miquelon\n'
+    'saint pierre and miquelon\n'
+    'america/moncton\n'
+    'moncton\n'
+    'america/monterrey\n'
+    'monterrey\n'
+    'america/montevideo\n'
+    'montevideo\n'
+    'uruguay\n'
+    'america/montserrat\n'
+    'montserrat\n'
+    'america/nassau\n'
+    'nassau\n'
+    'bahamas\n'
+    'america/new_york\n'
+    'new york\n'
+    'washington dc\n'
+    'boston\n'
+    'miami\n'
+    'newark\n'
+    'philadelphia\n'
+    'brooklyn\n'
+    'edt\n'
+    'est\n'
+    'et\n'
+    'america/nipigon\n'
+    'nipigon\n'
+    'america/nome\n'
+    'nome\n'
+    'america/noronha\n'
+    'noronha\n'
+    'america/north_dakota/beulah\n'
+    'beulah\n'
+    'america/nuuk\n'
+    'nuuk\n'
+    'america/ojinaga\n'
+    'ojinaga\n'
+    'america/panama\n'
+    'panama\n'
+    'panama city\n'
+    'america/pangnirtung\n'
+    'pangnirtung\n'
+    'america/paramaribo\n'
+    'paramaribo\n'
+    'suriname\n'
+    'america/phoenix\n'
+    'phoenix\n'
+    'america/port-au-prince\n'
+    'port-au-prince\n'
+    'haiti\n'
+    'port au prince\n'
+    'america/port_of_spain\n'
+    'port of spain\n'
+    'trinidad and tobago\n'
+    'america/porto_velho\n'
+    'porto velho\n'
+    'america/puerto_rico\n'
+    'puerto rico\n'
+    'san juan\n'
+    'america/punta_arenas\n'
+    'punta arenas\n'
+    'america/rainy_river\n'
+    'rainy river\n'
+    'america/rankin_inlet\n'
+    'rankin inlet\n'
+    'america/recife\n'
+    'recife\n'
+    'america/regina\n'
+    'regina\n'
+    'america/resolute\n'
+    'resolute\n'
+    'america/rio_branco\n'
+    'rio branco\n'
+    'america/santarem\n'
+    'santarem\n'
+    'america/santiago\n'
+    'santiago\n'
+    'america/santo_domingo\n'
+    'santo domingo\n'
+    'dominican republic\n'
+    'america/sao_paulo\n'
+    'sao paulo\n'
+    'brasilia\n'
+    'america/scoresbysund\n'
+    'scoresbysund\n'
+    'ittoqqortoormiit\n'
+    'america/sitka\n'
+    'sitka\n'
+    'america/st_barthelemy\n'
+    'st barthelemy\n'
+    'gustavia\n'
+    'america/st_johns\n'
+    'st johns\n'
+    'america/st_kitts\n'
+    'st kitts\n'
+    'basseterre\n'
+    'saint kitts and nevis\n'
+    'america/st_lucia\n'
+    'st lucia\n'
+    'saint lucia\n'
+    'castries\n'
+    'america/st_vincent\n'
+    'st vincent\n'
+    'saint vincent and the grenadines\n'
+    'america/swift_current\n'
+    'swift current\n'
+    'america/tegucigalpa\n'
+    'tegucigalpa\n'
+    'honduras\n'
+    'cst\n'
+    'america/thule\n'
+    'thule\n'
+    'thule air base\n'
+    'pituffik\n'
+    'america/thunder_bay\n'
+    'thunder bay\n'
+    'america/tijuana\n'
+    'tijuana\n'
+    'america/toronto\n'
+    'toronto\n'
+    'ottawa\n'
+    'quebec\n'
+    'america/tortola\n'
+    'tortola\n'
+    'british virgin islands\n'
+    'america/vancouver\n'
+    'vancouver\n'
+    'america/whitehorse\n'
+    'whitehorse\n'
+    'america/winnipeg\n'
+    'winnipeg\n'
+    'america/yakutat\n'
+    'yakutat\n'
+    'america/yellowknife\n'
+    'yellowknife\n'
+    'antarctica/casey\n'
+    'casey\n'
+    'antarctica/davis\n'
+    'davis\n'
+    'antarctica/dumontdurville\n'
+    'dumontdurville\n'
+    "dumont d'urville\n"
+    'antarctica/macquarie\n'
+    'macquarie\n'
+    'antarctica/mawson\n'
+    'mawson\n'
+    'antarctica/mcmurdo\n'
+    'mcmurdo\n'
+    'antarctica/palmer\n'
+    'palmer\n'
+    'antarctica/rothera\n'
+    'rothera\n'
+    'antarctica/syowa\n'
+    'syowa\n'
+    'antarctica/troll\n'
+    'troll\n'
+    'antarctica/vostok\n'
+    'vostok\n'
+    'arctic/longyearbyen\n'
+    'longyearbyen\n'
+    'asia/aden\n'
+    'aden\n'
+    'yemen\n'
+    'sana\n'
+    'sanaa\n'
+    "sana'a\n"
+    'asia/almaty\n'
+    'almaty\n'
+    'nur-sultan\n'
+    'astana\n'
+    'asia/amman\n'
+    'amman\n'
+    'jordan\n'
+    'asia/anadyr\n'
+    'anadyr\n'
+    'asia/aqtau\n'
+    'aqtau\n'
+    'asia/aqtobe\n'
+    'aqtobe\n'
+    'aktobe\n'
+    'asia/ashgabat\n'
+    'ashgabat\n'
+    'turkmenistan\n'
+    'asia/atyrau\n'
+    'atyrau\n'
+    'kazakhstan\n'
+    'asia/baghdad\n'
+    'baghdad\n'
+    'iraq\n'
+    'asia/bahrain\n'
+    'bahrain\n'
+    'manama\n'
+    'asia/baku\n'
+    'baku\n'
+    'azerbaijan\n'
+    'asia/bangkok\n'
+    'bangkok\n'
+    'thailand\n'
+    'asia/barnaul\n'
+    'barnaul\n'
+    'asia/beirut\n'
+    'beirut\n'
+    'lebanon\n'
+    'asia/bishkek\n'
+    'bishkek\n'
+    'kyrgyzstan\n'
+    'asia/brunei\n'
+    'brunei\n'
+    'bandar seri begawan\n'
+    'asia/chita\n'
+    'chita\n'
+    'asia/choibalsan\n'
+    'choibalsan\n'
+    'asia/colombo\n'
+    'colombo\n'
+    'sri lanka\n'
+    'asia/damascus\n'
+    'damascus\n'
+    'syria\n'
+    'asia/dhaka\n'
+    'dhaka\n'
+    'bangladesh\n'
+    'asia/dili\n'
+    'dili\n'
+    'timor-leste\n'
+    'east timor\n'
+    'asia/dubai\n'
+    'dubai\n'
+    'uae\n'
+    'united arab emirates\n'
+    'abu dhabi\n'
+    'sharjah\n'
+    'asia/dushanbe\n'
+    'dushanbe\n'
+    'tajikistan\n'
+    'asia/famagusta\n'
+    'famagusta\n'
+    'asia/gaza\n'
+    'gaza\n'
+    'asia/hebron\n'
+    'hebron\n'
+    'ramallah\n'
+    'palestine\n'
+    'asia/ho_chi_minh\n'
+    'ho chi minh\n'
+    'hanoi\n'
+    'vietnam\n'
+    'ho chi minh city\n'
+    'asia/hong_kong\n'
+    'hong kong\n'
+    'asia/hovd\n'
+    'hovd\n'
+    'asia/irkutsk\n'
+    'irkutsk\n'
+    'asia/jakarta\n'
+    'jakarta\n'
+    'asia/jayapura\n'
+    'jayapura\n'
+    'asia/jerusalem\n'
+    'jerusalem\n'
+    'tel aviv\n'
+    'acre\n'
+    'haifa\n'
+    'israel\n'
+    'asia/kabul\n'
+    'kabul\n'
+    'afghanistan\n'
+    'asia/kamchatka\n'
+    'kamchatka\n'
+    'asia/karachi\n'
+    'karachi\n'
+    'pakistan\n'
+    'islamabad\n'
+    'rawalpindi\n'
+    'lahore\n'
+    'asia/kathmandu\n'
+    'kathmandu\n'
+    'nepal\n'
+    'asia/khandyga\n'
+    'khandyga\n'
+    'asia/kolkata\n'
+    'kolkata\n'
+    'india\n'
+    'new delhi\n'
+    'delhi\n'
+    'chennai\n'
+    'mumbai\n'
+    'bangalore\n'
+    'bengaluru\n'
+    'asia/krasnoyarsk\n'
+    'krasnoyarsk\n'
+    'asia/kuala_lumpur\n'
+    'kuala lumpur\n'
+    'malaysia\n'
+    'asia/kuching\n'
+    'kuching\n'
+    'asia/kuwait\n'
+    'kuwait\n'
+    'kuwait city\n'
+    'asia/macau\n'
+    'macau\n'
+    'macao\n'
+    'asia/magadan\n'
+    'magadan\n'
+    'asia/makassar\n'
+    'makassar\n'
+    'asia/manila\n'
+    'manila\n'
+    'philippines\n'
+    'asia/muscat\n'
+    'muscat\n'
+    'oman\n'
+    'asia/nicosia\n'
+    'nicosia\n'
+    'cyprus\n'
+    'asia/novokuznetsk\n'
+    'novokuznetsk\n'
+    'asia/novosibirsk\n'
+    'novosibirsk\n'
+    'asia/omsk\n'
+    'omsk\n'
+    'asia/oral\n'
+    'oral\n'
+    'asia/phnom_penh\n'
+    'phnom penh\n'
+    'cambodia\n'
+    'asia/pontianak\n'
+    'pontianak\n'
+    'asia/pyongyang\n'
+    'pyongyang\n'
+    'north korea\n'
+    'asia/qatar\n'
+    'qatar\n'
+    'doha\n'
+    'asia/qostanay\n'
+    'qostanay\n'
+    'asia/qyzylorda\n'
+    'qyzylorda\n'
+    'asia/riyadh\n'
+    'riyadh\n'
+    'saudi arabia\n'
+    'asia/sakhalin\n'
+    'sakhalin\n'
+    'asia/samarkand\n'
+    'samarkand\n'
+    'asia/seoul\n'
+    'seoul\n'
+    'south korea\n'
+    'asia/shanghai\n'
+    'shanghai\n'
+    'beijing\n'
+    'guangzhou\n'
+    'chongqing\n'
+    'tianjin\n'
+    'chengdu\n'
+    'nanjing\n'
+    'wuhan\n'
+    "xi'an\n"
+    'hangzhou\n'
+    'asia/singapore\n'
+    'singapore\n'
+    'asia/srednekolymsk\n'
+    'srednekolymsk\n'
+    'asia/taipei\n'
+    'taipei\n'
+    'taiwan\n'
+    'asia/tashkent\n'
+    'tashkent\n'
+    'uzbekistan\n'
+    'asia/tbilisi\n'
+    'tbilisi\n'
+    'georgia\n'
+    'asia/tehran\n'
+    'tehran\n'
+    'iran\n'
+    'asia/thimphu\n'
+    'thimphu\n'
+    'bhutan\n'
+    'asia/tokyo\n'
+    'tokyo\n'
+    'japan\n'
+    'kyoto\n'
+    'yokohama\n'
+    'osaka\n'
+    'hiroshima\n'
+    'asia/tomsk\n'
+    'tomsk\n'
+    'asia/ulaanbaatar\n'
+    'ulaanbaatar\n'
+    'asia/urumqi\n'
+    'urumqi\n'
+    'xinjiang\n'
+    'asia/ust-nera\n'
+    'ust-nera\n'
+    'asia/vientiane\n'
+    'vientiane\n'
+    'laos\n'
+    'asia/vladivostok\n'
+    'vladivostok\n'
+    'asia/yakutsk\n'
+    'yakutsk\n'
+    'asia/yangon\n'
+    'yangon\n'
+    'myanmar\n'
+    'naypyidaw\n'
+    'asia/yekaterinburg\n'
+    'yekaterinburg\n'
+    'asia/yerevan\n'
+    'yerevan\n'
+    'armenia\n'
+    'atlantic/azores\n'
+    'azores\n'
+    'atlantic/bermuda\n'
+    'bermuda\n'
+    'atlantic/canary\n'
+    'canary\n'
+    'atlantic/cape_verde\n'
+    'cape verde\n'
+    'praia\n'
+    'atlantic/faroe\n'
+    'faroe\n'
+    'faroe islands\n'
+    'torshavn\n'
+    'atlantic/madeira\n'
+    'madeira\n'
+    'atlantic/reykjavik\n'
+    'reykjavik\n'
+    'iceland\n'
+    'atlantic/south_georgia\n'
+    'south georgia\n'
+    'south georgia and the south sandwich islands\n'
+    'sgssi\n'
+    'atlantic/stanley\n'
+    'stanley\n'
+    'falkland islands\n'
+    'malvinas\n'
+    'atlantic/st_helena\n'
+    'st helena\n'
+    'saint helena\n'
+    'ascension island\n'
+    'tristan da cunha\n'
+    'australia/adelaide\n'
+    'adelaide\n'
+    'australia/brisbane\n'
+    'brisbane\n'
+    'australia/broken_hill\n'
+    'broken hill\n'
+    'australia/currie\n'
+    'currie\n'
+    'australia/darwin\n'
+    'darwin\n'
+    'australia/eucla\n'
+    'eucla\n'
+    'australia/hobart\n'
+    'hobart\n'
+    'australia/lindeman\n'
+    'lindeman\n'
+    'australia/lord_howe\n'
+    'lord howe\n'
+    'australia/melbourne\n'
+    'melbourne\n'
+    'australia/perth\n'
+    'perth\n'
+    'awst\n'
+    'australia/sydney\n'
+    'sydney\n'
+    'canberra\n'
+    'europe/amsterdam\n'
+    'amsterdam\n'
+    'hague\n'
+    'europe/andorra\n'
+    'andorra\n'
+    'andorra la vella\n'
+    'europe/astrakhan\n'
+    'astrakhan\n'
+    'europe/athens\n'
+    'athens\n'
+    'greece\n'
+    'europe/belgrade\n'
+    'belgrade\n'
+    'serbia\n'
+    'europe/berlin\n'
+    'berlin\n'
+    'germany\n'
+    'dresden\n'
+    'dusseldorf\n'
+    'frankfurt\n'
+    'europe/bratislava\n'
+    'bratislava\n'
+    'slovakia\n'
+    'europe/brussels\n'
+    'brussels\n'
+    'belgium\n'
+    'europe/bucharest\n'
+    'bucharest\n'
+    'romania\n'
+    'europe/budapest\n'
+    'budapest\n'
+    'hungary\n'
+    'europe/busingen\n'
+    'busingen\n'
+    'europe/chisinau\n'
+    'chisinau\n'
+    'moldova\n'
+    'europe/copenhagen\n'
+    'copenhagen\n'
+    'aarhus\n'
+    'ronne\n'
+    'europe/dublin\n'
+    'dublin\n'
+    'ireland\n'
+    'europe/gibraltar\n'
+    'gibraltar\n'
+    'europe/guernsey\n'
+    'guernsey\n'
+    'europe/helsinki\n'
+    'helsinki\n'
+    'finland\n'
+    'europe/isle_of_man\n'
+    'isle of man\n'
+    'europe/istanbul\n'
+    'istanbul\n'
+    'turkey\n'
+    'ankara\n'
+    'europe/jersey\n'
+    'jersey\n'
+    'saint helier\n'
+    'europe/kaliningrad\n'
+    'kaliningrad\n'
+    'europe/kiev\n'
+    'kiev\n'
+    'kyiv\n'
+    'europe/kirov\n'
+    'kirov\n'
+    'europe/lisbon\n'
+    'lisbon\n'
+    'europe/ljubljana\n'
+    'ljubljana\n'
+    'slovenia\n'
+    'europe/london\n'
+    'london\n'
+    'united kingdom\n'
+    'uk\n'
+    'edinburg\n'
+    'glasgow\n'
+    'cardiff\n'
+    'belfast\n'
+    'bristol\n'
+    'gmt\n'
+    'utc\n'
+    'europe/luxembourg\n'
+    'luxembourg\n'
+    'luxembourg city\n'
+    'europe/madrid\n'
+    'madrid\n'
+    'europe/malta\n'
+    'malta\n'
+    'valletta\n'
+    'europe/mariehamn\n'
+    'mariehamn\n'
+    'aland islands\n'
+    'europe/minsk\n'
+    'minsk\n'
+    'belarus\n'
+    'europe/monaco\n'
+    'monaco\n'
+    'europe/moscow\n'
+    'moscow\n'
+    'st petersburg\n'
+    'europe/oslo\n'
+    'oslo\n'
+    'norway\n'
+    'europe/paris\n'
+    'paris\n'
+    'europe/podgorica\n'
+    'podgorica\n'
+    'montenegro\n'
+    'europe/prague\n'
+    'prague\n'
+    'czech republic\n'
+    'europe/riga\n'
+    'riga\n'
+    'latvia\n'
+    'europe/rome\n'
+    'rome\n'
+    'italy\n'
+    'europe/samara\n'
+    'samara\n'
+    'europe/san_marino\n'
+    'san marino\n'
+    'europe/sarajevo\n'
+    'sarajevo\n'
+    'bosnia and herzegovina\n'
+    'bosnia\n'
+    'herzegovina\n'
+    'europe/saratov\n'
+    'saratov\n'
+    'europe/simferopol\n'
+    'simferopol\n'
+    'europe/skopje\n'
+    'skopje\n'
+    'north macedonia\n'
+    'europe/sofia\n'
+    'sofia\n'
+    'bulgaria\n'
+    'europe/stockholm\n'
+    'stockholm\n'
+    'sweden\n'
+    'europe/tallinn\n'
+    'tallinn\n'
+    'estonia\n'
+    'europe/tirane\n'
+    'tirane\n'
+    'albania\n'
+    'tirana\n'
+    'europe/ulyanovsk\n'
+    'ulyanovsk\n'
+    'europe/uzhgorod\n'
+    'uzhgorod\n'
+    'europe/vaduz\n'
+    'vaduz\n'
+    'liechtenstein\n'
+    'europe/vatican\n'
+    'vatican\n'
+    'vatican city\n'
+    'europe/vienna\n'
+    'vienna\n'
+    'austria\n'
+    'europe/vilnius\n'
+    'vilnius\n'
+    'lithuania\n'
+    'europe/volgograd\n'
+    'volgograd\n'
+    'europe/warsaw\n'
+    'warsaw\n'
+    'poland\n'
+    'europe/zagreb\n'
+    'zagreb\n'
+    'croatia\n'
+    'europe/zaporozhye\n'
+    'zaporozhye\n'
+    'europe/zurich\n'
+    'zurich\n'
+    'switzerland\n'
+    'bern\n'
+    'indian/antananarivo\n'
+    'antananarivo\n'
+    'madagascar\n'
+    'indian/chagos\n'
+    'chagos\n'
+    'indian/christmas\n'
+    'christmas\n'
+    'christmas island\n'
+    'flying fish cove\n'
+    'indian/cocos\n'
+    'cocos\n'
+    'cocos islands\n'
+    'keeling islands\n'
+    'indian/comoro\n'
+    'comoro\n'
+    'comoros\n'
+    'moroni\n'
+    'eat\n'
+    'indian/kerguelen\n'
+    'kerguelen\n'
+    'kerguelen island\n'
+    'desolation island\n'
+    'indian/mahe\n'
+    'mahe\n'
+    'seychelles\n'
+    'indian/maldives\n'
+    'maldives\n'
+    'male\n'
+    'indian/mauritius\n'
+    'mauritius\n'
+    'port louis\n'
+    'indian/mayotte\n'
+    'mayotte\n'
+    'indian/reunion\n'
+    'reunion\n'
+    'pacific/apia\n'
+    'apia\n'
+    'samoa\n'
+    'pacific/auckland\n'
+    'auckland\n'
+    'wellington\n'
+    'pacific/bougainville\n'
+    'bougainville\n'
+    'pacific/chatham\n'
+    'chatham\n'
+    'chatham islands\n'
+    'pacific/chuuk\n'
+    'chuuk\n'
+    'pacific/easter\n'
+    'easter\n'
+    'pacific/efate\n'
+    'efate\n'
+    'vanuatu\n'
+    'port vila\n'
+    'vila\n'
+    'pacific/enderbury\n'
+    'enderbury\n'
+    'pacific/fakaofo\n'
+    'fakaofo\n'
+    'tokelau\n'
+    'pacific/fiji\n'
+    'fiji\n'
+    'suva\n'
+    'pacific/funafuti\n'
+    'funafuti\n'
+    'tuvalu\n'
+    'pacific/galapagos\n'
+    'galapagos\n'
+    'pacific/gambier\n'
+    'gambier\n'
+    'pacific/guadalcanal\n'
+    'guadalcanal\n'
+    'solomon islands\n'
+    'honiara\n'
+    'pacific/guam\n'
+    'guam\n'
+    'dededo\n'
+    'hagatna\n'
+    'pacific/honolulu\n'
+    'honolulu\n'
+    'hawaii\n'
+    'pacific/kiritimati\n'
+    'kiritimati\n'
+    'pacific/kosrae\n'
+    'kosrae\n'
+    'pacific/kwajalein\n'
+    'kwajalein\n'
+    'pacific/majuro\n'
+    'majuro\n'
+    'pacific/marquesas\n'
+    'marquesas\n'
+    'pacific/nauru\n'
+    'nauru\n'
+    'denigomodu\n'
+    'yaren\n'
+    'pacific/niue\n'
+    'niue\n'
+    'alofi\n'
+    'pacific/norfolk\n'
+    'norfolk\n'
+    'norfolk island\n'
+    'pacific/noumea\n'
+    'noumea\n'
+    'new caledonia\n'
+    'pacific/pago_pago\n'
+    'pago pago\n'
+    'american samoa\n'
+    'pacific/palau\n'
+    'palau\n'
+    'koror\n'
+    'ngerulmud\n'
+    'pacific/pitcairn\n'
+    'pitcairn\n'
+    'pitcairn islands\n'
+    'adamstown\n'
+    'pacific/pohnpei\n'
+    'pohnpei\n'
+    'pacific/port_moresby\n'
+    'port moresby\n'
+    'pacific/rarotonga\n'
+    'rarotonga\n'
+    'cook islands\n'
+    'avarua\n'
+    'pacific/saipan\n'
+    'saipan\n'
+    'northern mariana islands\n'
+    'pacific/tahiti\n'
+    'tahiti\n'
+    'pacific/tarawa\n'
+    'tarawa\n'
+    'pacific/tongatapu\n'
+    'tongatapu\n'
+    'tonga\n'
+    'pacific/wallis\n'
+    'wallis\n'
+    'wallis and futuna\n'
+    'mata utu'
+)
+
+# Positions in ZONES of the tz names of NAMES, as code points
+NAME_ZONES = (
+    '\x00\x00\x00\x00\x00\x01\x01\x01\x02\x02\x02\x03'
+    '\x03\x03\x03\x04\x04\x04\x05\x05\x05\x06\x06\x06'
+    '\x07\x07\x07\x08\x08\x08\t\t\t\t\n\n'
+    '\n\n\n\x0b\x0b\x0b\x0c\x0c\x0c\x0c\r\r'
+    '\r\r\x0e\x0e\x0f\x0f\x0f\x10\x10\x10\x11\x11'
+    '\x11\x11\x11\x12\x12\x13\x13\x13\x13\x14\x14\x14'
+    '\x14\x15\x15\x15\x16\x16\x16\x17\x17\x17\x18\x18'
+    '\x18\x19\x19\x19\x1a\x1a\x1a\x1b\x1b\x1b\x1c\x1c'
+    '\x1c\x1d\x1d\x1e\x1e\x1e\x1e\x1f\x1f\x1f  '
+    ' !!!""###$$$'
+    "$%%%&&&''''("
+    '((()))***+++'
+    '+,,,---...//'
+    '//0001112223'
+    '334455667778'
+    '899::;;<<==>'
+    '>??@@AABBCCD'
+    'DDEEEFFGGHHI'
+    'IIJJKKKLLMMN'
+    'NNOOPPQQRRSS'
+    'STTTUUVVVVVW'
+    'WXXXYYZZ[[[\\'
+    '\\]]^^____``a'
+    'aabbccdddeef'
+    'fgghhiiijjkk'
+    'lllmmmnnoopp'
+    'pqqrrssttuuv'
+    'vwwxxyyyzz{{'
+    '|||}}}}~~~\x7f\x7f'
+    '\x7f\x7f\x7f\x7f\x7f\x80\x80\x81\x81\x82\x82\x82'
+    '\x83\x83\x84\x84\x84\x85\x85\x85\x85\x86\x86\x87'
+    '\x87\x88\x88\x89\x89\x8a\x8a\x8b\x8b\x8c\x8c\x8c'
+    '\x8d\x8d\x8e\x8e\x8f\x8f\x8f\x90\x90\x91\x91\x91'
+    '\x92\x92\x92\x92\x92\x92\x92\x92\x92\x92\x92\x93'
+    '\x93\x94\x94\x95\x95\x96\x96\x97\x97\x98\x98\x99'
+    '\x99\x99\x9a\x9a\x9b\x9b\x9b\x9c\x9c\x9d\x9d\x9d'
+    '\x9d\x9e\x9e\x9e\x9f\x9f\xa0\xa0\xa0¡¡¢'
+    '¢££¤¤¥¥¦¦§§¨'
+    '¨©©ªªª«««¬¬¬'
+    '\xad\xad®®®¯¯°°°°±'
+    '±±±²²²³³´´´´'
+    'µµµµ¶¶··¸¸¸¸'
+    '¹¹¹ºº»»¼¼½½¾'
+    '¾¿¿ÀÀÁÁÁÂÂÃÃ'
+    'ÄÄÅÅÆÆÇÇÈÈÉÉ'
+    'ÊÊËËËËËËÌÌÌÌ'
+    'ÍÍÍÎÎÏÏÐÐÐÑÑ'
+    'ÑÒÒÒÓÓÓÔÔÔÕÕ'
+    'ÕÖÖÖ××ØØØÙÙÙ'
+    'ÚÚÚÛÛÜÜÝÝÝÞÞ'
+    'Þßßßààààáááá'
+    'ááâââããääååå'
+    'åæææææççèèéé'
+    'êêëëììììììíí'
+    'íîîïïïïïïððð'
+    'ññòòòòòòòòòó'
+    'óôôôõõööö÷÷÷'
+    'øøùùúúúûûûüü'
+    'üýýþþÿÿĀĀāāā'
+    'ĂĂăăăĄĄĄąąĆĆ'
+    'ćććĈĈĉĉĊĊĊċċ'
+    'ċċċċċċċċċČČč'
+    'čĎĎĎďďďĐĐĐđđ'
+    'đĒĒĒēēēēēēēĔ'
+    'ĔĕĕĖĖĖėėĘĘĘę'
+    'ęĚĚěěěěĜĜĝĝĝ'
+    'ĞĞğğĠĠġġġĢĢĢ'
+    'ĢģģĤĤĤĥĥĥĥĦĦ'
+    'ĦĦħħħħħĨĨĩĩĪ'
+    'ĪīīĬĬĭĭĮĮįįİ'
+    'İııĲĲĲĳĳĳĴĴĴ'
+    'ĵĵĵĶĶķķķĸĸĸĹ'
+    'ĹĹĹĹĹĺĺĺĻĻĻļ'
+    'ļļĽĽĽľľĿĿĿŀŀ'
+    'ŀŀŁŁŁłłŃŃńńń'
+    'ŅŅņņņņŇŇŇňňŉ'
+    'ŉŉŊŊŋŋŌŌŌōōō'
+    'ōōōōōōōōŎŎŎŏ'
+    'ŏŐŐŐőőőŒŒŒœœ'
+    'ŔŔŔŕŕŕŖŖŗŗŗŘ'
+    'ŘŘřřřŚŚŚśśŜŜ'
+    'ŝŝŝŝŝŞŞşşŠŠŠ'
+    'šššŢŢŢţţţŤŤŤ'
+    'ŤťťŦŦŧŧŧŨŨŨũ'
+    'ũũŪŪŪūūŬŬŬŭŭ'
+    'ŭŮŮůůůůŰŰŰűű'
+    'ŲŲŲŲųųųųŴŴŴŴ'
+    'ŴŵŵŵŵŶŶŶŷŷŷŸ'
+    'ŸŸŹŹźźŻŻŻżżż'
+    'ŽŽžžžſſƀƀƁƁƁ'
+    'ƁƁƂƂƃƃƃƄƄƄƅƅ'
+    'ƅƆƆƇƇƈƈƈƈƉƉƉ'
+    'ƉƊƊƊƋƋƌƌƍƍƎƎ'
+    'ƏƏƐƐƐƐƑƑƑƒƒƒ'
+    'ƓƓƓƔƔƔƕƕƕƕƖƖ'
+    'ƖƖƗƗƘƘƙƙƙƙƚƚ'
+    'ƚƛƛƜƜƝƝƝƞƞƞƞ'
+)
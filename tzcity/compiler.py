@@ -0,0 +1,195 @@
+"""
+Validation and compilation of the bundled data
+
+After editing tzcity/data.py, run
+
+    python -m tzcity.compiler
+
+to check the data and regenerate tzcity/compiled.py, the lookup index
+which tzcity loads instead of building it from the data. With --check,
+nothing is written and the exit status is 1 if the data has problems or
+tzcity/compiled.py is out of date.
+"""
+
+# pylint: disable=protected-access
+
+import argparse
+import os
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+from tzcity import core, iana
+
+# Path of the compiled lookup index
+COMPILED_PATH = os.path.join(os.path.dirname(__file__), 'compiled.py')
+
+_HEADER = '''\
+"""
+Lookup index compiled from tzcity/data.py by python -m tzcity.compiler
+
+Do not edit.
+"""
+
+# pylint: disable=too-many-lines
+'''
+
+
+def validate(city_dict: Dict[str, List[str]],
+             coordinates: Optional[Dict[str, Tuple[float, float]]] = None
+             ) -> List[str]:
+    """
+    Return descriptions of the problems found in city_dict, and in the
+    coordinates of its time zones if given, which are valid if there are
+    none.
+
+    Names must be in normalized form and listed once for each time zone.
+    A name may not be associated with more than one time zone, also when
+    ignoring accents and punctuation. Time zones must be in the time zone
+    database when zoneinfo is available and capitalized as in it, and have
+    coordinates in range.
+    """
+    problems = []
+    for tz, cities in city_dict.items():
+        seen: Set[str] = set()
+        for name in [tz] + cities:
+            if name != core._normalize(name) or '  ' in name:
+                problems.append(f"{name!r} of {tz}: Not normalized")
+            elif name in seen:
+                problems.append(f"{name!r} of {tz}: Listed more than once")
+            seen.add(name)
+
+    for name, found in core._build_multi_index(city_dict).items():
+        if len(found) > 1:
+            zones = ', '.join(f"{candidate.tz} as {candidate.kind}"
+                              for candidate in found)
+            problems.append(f"{name!r}: Associated with {zones}")
+
+    folded: Dict[str, str] = {}
+    index = core._build_index(city_dict)
+    for name, tz in index.items():
+        other = folded.setdefault(core._fold(name), name)
+        if index[other] != tz:
+            problems.append(f"{other!r} and {name!r}: Same when folded")
+
+    problems.extend(_database_problems(city_dict))
+
+    if coordinates is not None:
+        problems.extend(_coordinate_problems(city_dict, coordinates))
+    return problems
+
+
+def _database_problems(city_dict: Dict[str, List[str]]) -> List[str]:
+    """
+    Return descriptions of the differences between the time zones of
+    city_dict and the installed time zone database, or none if zoneinfo
+    is not available. Time zones renamed in the database are not problems.
+    """
+    try:
+        differences = iana.check(city_dict)
+    except ImportError:
+        return []
+    problems = [f"{tz}: Not in the time zone database"
+                for tz in differences.missing]
+    problems.extend(f"{tz}: Capitalized as {core._caps_tz(tz)}, not {name} "
+                    f"as in the time zone database"
+                    for tz, name in differences.capitalization.items())
+    return problems
+
+
+def _coordinate_problems(city_dict: Dict[str, List[str]],
+                         coordinates: Dict[str, Tuple[float, float]]
+                         ) -> List[str]:
+    """
+    Return descriptions of the problems found in the coordinates of the
+    time zones of city_dict.
+    """
+    problems = [f"{tz}: No coordinates"
+                for tz in city_dict if tz not in coordinates]
+    for tz, (lat, lon) in coordinates.items():
+        if tz not in city_dict:
+            problems.append(f"{tz}: Coordinates of unknown time zone")
+        elif not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            problems.append(f"{tz}: Coordinates out of range")
+    return problems
+
+
+def generate(city_dict: Dict[str, List[str]]) -> str:
+    """
+    Return the source of the compiled lookup index of city_dict.
+
+    Names are joined into single strings, as a few large constants load
+    much faster than a dict display or tuples of many constants.
+    """
+    zones = list(city_dict)
+    zone_ids = {tz: zone_id for zone_id, tz in enumerate(zones)}
+    index = core._build_index(city_dict)
+    name_zones = ''.join(chr(zone_ids[tz]) for tz in index.values())
+    return '\n'.join([
+        _HEADER,
+        '# tz names separated by newlines',
+        *_constant('ZONES', [f"{tz}\n" for tz in zones]),
+        '# Capitalized tz names separated by newlines',
+        *_constant('ZONE_CAPS', [f"{core._caps_tz(tz)}\n" for tz in zones]),
+        '# Recognized names separated by newlines, in the order of '
+        'precedence',
+        *_constant('NAMES', [f"{name}\n" for name in index]),
+        '# Positions in ZONES of the tz names of NAMES, as code points',
+        *_constant('NAME_ZONES', [name_zones[start:start + 12]
+                                  for start in range(0, len(name_zones), 12)]),
+    ])
+
+
+def _constant(name: str, parts: List[str]) -> List[str]:
+    """
+    Return the lines defining a string constant joining parts, with one
+    part per line. A newline ending the last part is left out.
+    """
+    parts = parts[:-1] + [parts[-1].rstrip('\n')]
+    return [f"{name} = ("] + [f"    {part!r}" for part in parts] + [')', '']
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Validate the bundled data and write or check its compiled index.
+
+    Returns the exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m tzcity.compiler',
+        description="Validate tzcity/data.py and compile its lookup index.")
+    parser.add_argument('--check', action='store_true',
+                        help="fail if the compiled index is out of date "
+                             "instead of writing it")
+    parser.add_argument('--output', default=COMPILED_PATH,
+                        help="path of the compiled index")
+    args = parser.parse_args(argv)
+
+    # pylint: disable=import-outside-toplevel
+    from tzcity.data import COORDINATES
+
+    city_dict = core._city_dict()
+    problems = validate(city_dict, COORDINATES)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if problems:
+        return 1
+
+    source = generate(city_dict)
+    if args.check:
+        try:
+            with open(args.output, encoding='utf-8') as compiled:
+                current = compiled.read()
+        except FileNotFoundError:
+            current = ''
+        if current != source:
+            print(f"{args.output}: Out of date, run python -m "
+                  f"tzcity.compiler", file=sys.stderr)
+            return 1
+    else:
+        with open(args.output, 'w', encoding='utf-8') as compiled:
+            compiled.write(source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,9 +2,300 @@
 Core functionality of tzcity
 """
 
-import re
+import sys
+from functools import lru_cache
+from time import perf_counter
+from types import MappingProxyType
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Mapping,
+                    MutableMapping, NamedTuple, Optional, Sequence, Set, Tuple,
+                    TypeVar, cast)
 
-from tzcity.data import CITY_DICT
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class Candidate(NamedTuple):
+    """
+    A time zone associated with a name.
+
+    kind tells how the name matched the tz name: as the 'zone' name
+    itself, as the 'tz city' name which is part of it or as an 'alias'.
+    rank is the position of the tz name in CITY_DICT, preceded by extra
+    data sources which override it and followed by other extra sources.
+    Lower ranks are preferred.
+    """
+    tz: str
+    kind: str
+    rank: int
+
+
+def _build_index(city_dict: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Build a reverse index mapping every recognized name to its tz name.
+
+    Keys are complete tz names, tz city names (last component of the tz
+    name with underscores as spaces) and the cities associated with a tz.
+
+    When a name is associated with more than one tz, the tz that comes
+    first in city_dict wins.
+    """
+    index: Dict[str, str] = {}
+    for tz, cities in city_dict.items():
+        index.setdefault(tz, tz)
+        index.setdefault(_tz_city(tz), tz)
+        for city in cities:
+            index.setdefault(city, tz)
+    return index
+
+
+def _merge_index(index: Dict[str, str], entries: Dict[str, str],
+                 override: bool) -> None:
+    """
+    Add entries to an index in place.
+
+    Names already in the index are kept unless override is true.
+    """
+    if override:
+        index.update(entries)
+    else:
+        for name, value in entries.items():
+            index.setdefault(name, value)
+
+
+def _tz_city(tz: str) -> str:
+    """
+    Return the city name which is part of a tz name.
+    """
+    return tz.split('/')[-1].replace('_', ' ')
+
+
+@lru_cache(maxsize=None)
+def _city_dict() -> Dict[str, List[str]]:
+    """
+    Return CITY_DICT, loading the data on first use.
+
+    Lookups use _bundled() instead, so CITY_DICT is only loaded for code
+    using it directly and for tzcity.compiler.
+    """
+    # pylint: disable=import-outside-toplevel
+    from tzcity import data
+    return data.CITY_DICT
+
+
+@lru_cache(maxsize=None)
+def _bundled() -> Dict[str, Tuple[str, ...]]:
+    """
+    Return the bundled data loaded from tzcity.compiled, mapping every tz
+    name to the other names associated with it, starting with its tz city
+    name, in the order of CITY_DICT.
+
+    Each name is a single string object, shared with the lookup indexes
+    built from it, so CITY_DICT is not loaded for lookups.
+    """
+    # pylint: disable=import-outside-toplevel
+    from tzcity import compiled
+
+    zones = compiled.ZONES.split('\n')
+    _TZ_CAPS.update(zip(zones, compiled.ZONE_CAPS.split('\n')))
+    names: Dict[str, List[str]] = {tz: [] for tz in zones}
+    for name, zone_id in zip(compiled.NAMES.split('\n'),
+                             compiled.NAME_ZONES):
+        tz = zones[ord(zone_id)]
+        if name != tz:
+            names[tz].append(name)
+    return {tz: tuple(tz_names) for tz, tz_names in names.items()}
+
+
+# Data sources added by tzcity.sources.add_source(), in the order of
+# precedence. Overrides take precedence over the bundled data, extras
+# come after it.
+_OVERRIDES: List[Dict[str, List[str]]] = []
+_EXTRAS: List[Dict[str, List[str]]] = []
+
+
+def _sources() -> List[Mapping[str, Sequence[str]]]:
+    """
+    Return all data sources in the order of precedence.
+    """
+    return [*_OVERRIDES, _bundled(), *_EXTRAS]
+
+
+# Functions clearing the caches of data derived from the lookup index
+_DERIVED: List[Callable[[], None]] = []
+
+
+def _derived(func: F) -> F:
+    """
+    Cache the result of func, which computes data derived from the lookup
+    index, until _data_changed() is called.
+    """
+    cached = lru_cache(maxsize=None)(func)
+    _DERIVED.append(cached.cache_clear)
+    return cast(F, cached)
+
+
+def _data_changed() -> None:
+    """
+    Clear the caches of derived data after the lookup index changed.
+    """
+    for clear in _DERIVED:
+        clear()
+    if _CACHE is not None:
+        _CACHE.clear()
+
+
+# Lookup table shared between processes and its folded index, set by
+# tzcity.shared.use_table()
+_TABLE: Optional[Mapping[str, str]] = None
+_FOLDED_TABLE: Optional[Mapping[str, str]] = None
+
+# Called after each lookup with the normalized name, the tz name found or
+# None, and the seconds taken. Set by tzcity.stats.enable().
+_OBSERVER: Optional[Callable[[str, Optional[str], float], None]] = None
+
+# Results of tzcity() by the names passed to it, as returned by _lookup().
+# Set by tzcity.cache.enable().
+_CACHE: Optional[MutableMapping[str, Tuple[str, Optional[str]]]] = None
+
+# Looks up names in place of _lookup() while any tzcity.profiling.profile()
+# is active, set and cleared by it.
+_PROFILER: Optional[Callable[[str], Tuple[str, Optional[str]]]] = None
+
+
+def _index() -> Mapping[str, str]:
+    """
+    Return the reverse index mapping recognized names to tz names.
+    """
+    if _TABLE is not None:
+        if _OVERRIDES or _EXTRAS:
+            return _table_overlay()[0]
+        return _TABLE
+    return _dict_index()
+
+
+@lru_cache(maxsize=None)
+def _dict_index() -> Dict[str, str]:
+    """
+    Return the reverse index of all data sources, building it on first
+    use.
+
+    The index of the bundled data is built from _bundled() instead of
+    CITY_DICT, its names already being unique. tzcity.sources updates the
+    index in place as sources are added.
+    """
+    bundled = {}
+    for tz, names in _bundled().items():
+        bundled[tz] = tz
+        bundled.update(dict.fromkeys(names, tz))
+    indexes = [_build_index(city_dict) for city_dict in _OVERRIDES]
+    indexes.append(bundled)
+    indexes += [_build_index(city_dict) for city_dict in _EXTRAS]
+    index = indexes[0]
+    for entries in indexes[1:]:
+        _merge_index(index, entries, override=False)
+    return index
+
+
+def _folded() -> Mapping[str, str]:
+    """
+    Return the folded index of the lookup index in use.
+    """
+    if _FOLDED_TABLE is not None:
+        if _OVERRIDES or _EXTRAS:
+            return _table_overlay()[1]
+        return _FOLDED_TABLE
+    return _folded_index()
+
+
+@lru_cache(maxsize=None)
+def _folded_index() -> Dict[str, str]:
+    """
+    Return an index mapping the folded form of every recognized name to
+    the name, building it on first use.
+    """
+    return _build_folded_index(_index())
+
+
+@_derived
+def _table_overlay() -> Tuple[Mapping[str, str], Mapping[str, str]]:
+    """
+    Return the lookup index and the folded index of the shared table with
+    the names of extra data sources laid over them, as they would be in
+    _dict_index() and _folded_index().
+    """
+    overrides: Dict[str, str] = {}
+    for city_dict in _OVERRIDES:
+        _merge_index(overrides, _build_index(city_dict), override=False)
+    extras: Dict[str, str] = {}
+    for city_dict in _EXTRAS:
+        _merge_index(extras, _build_index(city_dict), override=False)
+    return (_Overlay(overrides, cast(Mapping[str, str], _TABLE), extras),
+            _Overlay(_build_folded_index(overrides),
+                     cast(Mapping[str, str], _FOLDED_TABLE),
+                     _build_folded_index(extras)))
+
+
+class _Overlay(Mapping[str, str]):
+    """
+    Read-only view of mappings where a name takes its value from the first
+    mapping having it.
+    """
+
+    def __init__(self, *mappings: Mapping[str, str]) -> None:
+        self._mappings = mappings
+
+    def __getitem__(self, name: str) -> str:
+        for mapping in self._mappings:
+            value = mapping.get(name)
+            if value is not None:
+                return value
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        seen: Set[str] = set()
+        for mapping in self._mappings:
+            for name in mapping:
+                if name not in seen:
+                    seen.add(name)
+                    yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def _build_folded_index(index: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Build an index mapping the folded form of every name of index to the
+    name.
+    """
+    folded: Dict[str, str] = {}
+    for name in index:
+        key = _fold(name)
+        # Most names are their own folded form, sharing the string
+        folded.setdefault(name if key == name else key, name)
+    return folded
+
+
+def _reset_index() -> None:
+    """
+    Clear the lookup indexes and the data derived from them.
+    """
+    _dict_index.cache_clear()
+    _folded_index.cache_clear()
+    _data_changed()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Load CITY_DICT on first access for code that used it from here.
+    """
+    if name == 'CITY_DICT':
+        return _city_dict()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # No module __getattr__ before Python 3.7
+    CITY_DICT = _city_dict()
 
 
 def tzcity(city: str) -> str:
@@ -13,29 +304,272 @@ def tzcity(city: str) -> str:
 
     Return time zone name itself if argument is a time zone.
     """
-    tz_value = ''
-    city = city.strip().lower()
-    for tz in CITY_DICT:
+    start = 0.0 if _OBSERVER is None else perf_counter()
+    cache = _CACHE
+    result = None if cache is None else cache.get(city)
+    if result is None:
+        result = _lookup(city)
+        if cache is not None:
+            cache[city] = result
+    name, tz_value = result
+    if _OBSERVER is not None:
+        _OBSERVER(name, tz_value, perf_counter() - start)
+    if tz_value is None:
+        raise ValueError(f"{name}: Ambiguous or unknown time zone")
+    return capitalize(tz_value)
 
-        # Complete tz name
-        if tz == city:
-            tz_value = tz
-            break
 
-        # tz city name
-        tz_city = tz.split('/')[-1].replace('_', ' ')
-        if city == tz_city:
-            tz_value = tz
-            break
+def _lookup(city: str) -> Tuple[str, Optional[str]]:
+    """
+    Find the time zone associated with a city.
+
+    Returns the recognized name matched and its tz name, or the
+    normalized city and None if it is not recognized.
+    """
+    if _PROFILER is not None:
+        return _PROFILER(city)
+    city = _normalize(city)
+    index = _index()
+    tz_value = index.get(city)
+    if tz_value is None:
+        return _find_folded(index, city)
+    return city, tz_value
+
 
-        # city associated with tz
-        if city in CITY_DICT[tz]:
-            tz_value = tz
-            break
-    if tz_value:
-        return capitalize(tz_value)
+def tzcity_many(cities: Iterable[str],
+                default: Optional[str] = None) -> Iterator[Optional[str]]:
+    """
+    Find the time zones associated with many cities.
 
-    raise ValueError(f"{city}: Ambiguous or unknown time zone")
+    Accepts any iterable of city names, including lazy ones like a file.
+    Yields time zone names in the order of the input.
+
+    Unrecognized names yield default instead of raising ValueError.
+
+    Repeated names are looked up once, keeping the results of up to
+    _MANY_RESULTS distinct names at a time in memory.
+    """
+    results: Dict[str, Optional[str]] = {}
+    for city in cities:
+        try:
+            yield results[city]
+        except KeyError:
+            if len(results) >= _MANY_RESULTS:
+                # Starting afresh keeps memory bounded on long streams of
+                # distinct names, at the cost of looking up some names
+                # again
+                results.clear()
+            start = 0.0 if _OBSERVER is None else perf_counter()
+            name, tz_value = _lookup(city)
+            if _OBSERVER is not None:
+                _OBSERVER(name, tz_value, perf_counter() - start)
+            if tz_value is None:
+                result = default
+            else:
+                result = capitalize(tz_value)
+            results[city] = result
+            yield result
+
+
+# Number of distinct names whose results tzcity_many() keeps at a time
+_MANY_RESULTS = 4096
+
+
+def candidates(city: str) -> List[Candidate]:
+    """
+    Find all the time zones associated with a city.
+
+    Returns them in the order of preference, the first one being the
+    time zone returned by tzcity(), or an empty list if unrecognized.
+    """
+    name = _normalize(city)
+    if name not in _multi_index():
+        name = _find_folded(_index(), name)[0]
+    return list(_multi_index().get(name, ()))
+
+
+def collisions() -> Dict[str, List[str]]:
+    """
+    Return the names associated with more than one time zone along with
+    those time zone names in the order of preference.
+    """
+    return {name: [candidate.tz for candidate in found]
+            for name, found in _multi_index().items() if len(found) > 1}
+
+
+def cities_for(zone: str) -> Tuple[str, ...]:
+    """
+    Return the capitalized names of the cities associated with a tz name,
+    starting with the city which is part of the tz name.
+
+    Raises ValueError if zone is not a known tz name.
+    """
+    return _reverse_table()[_known_zone(zone)][0]
+
+
+def display_label(zone: str) -> str:
+    """
+    Return a label of a tz name for showing in lists of time zones, like
+    'Asia/Kolkata (India, New Delhi)'.
+
+    The label names the first few cities associated with the tz name
+    other than its tz city, in the order of the data.
+
+    Raises ValueError if zone is not a known tz name.
+    """
+    return _reverse_table()[_known_zone(zone)][1]
+
+
+# Number of cities named after the tz name by display_label()
+_LABEL_CITIES = 2
+
+
+def _known_zone(zone: str) -> str:
+    """
+    Return the normalized form of a tz name, raising ValueError if it is
+    not a known tz name.
+    """
+    tz = _normalize(zone)
+    if tz not in _reverse_table():
+        raise ValueError(f"{zone}: Unknown time zone")
+    return tz
+
+
+@_derived
+def _reverse_table() -> Mapping[str, Tuple[Tuple[str, ...], str]]:
+    """
+    Return the cities and display label of every tz name, computing them
+    on first use.
+
+    The table is read-only, as the same tuples and strings are returned
+    to every caller.
+    """
+    city_dict: Dict[str, List[str]] = {}
+    for source in _sources():
+        for tz, cities in source.items():
+            city_dict.setdefault(tz, []).extend(cities)
+
+    table = {}
+    for tz, cities in city_dict.items():
+        tz_city = _capitalize_lenient(_tz_city(tz))
+        others = [_capitalize_lenient(city) for city in cities]
+        # The tz city may also be listed as an alias
+        others = [city for city in dict.fromkeys(others) if city != tz_city]
+        label = _TZ_CAPS.get(tz) or _caps_tz(tz)
+        if others:
+            label += f" ({', '.join(others[:_LABEL_CITIES])})"
+        table[tz] = (tuple([tz_city] + others), label)
+    return MappingProxyType(table)
+
+
+@_derived
+def _multi_index() -> Dict[str, Tuple[Candidate, ...]]:
+    """
+    Return the multi-valued index of all data sources, building it on
+    first use.
+    """
+    return _build_multi_index(*_sources())
+
+
+def _build_multi_index(*city_dicts: Mapping[str, Sequence[str]]
+                       ) -> Dict[str, Tuple[Candidate, ...]]:
+    """
+    Build an index mapping every recognized name to all of its tz names,
+    in the order of city_dicts and of the tz names in each.
+
+    Equal tuples of candidates are shared, as most names of a tz name have
+    the same one.
+    """
+    index: Dict[str, List[Candidate]] = {}
+    pairs = [pair for city_dict in city_dicts for pair in city_dict.items()]
+    for rank, (tz, cities) in enumerate(pairs):
+        tz_caps = _TZ_CAPS.get(tz) or _caps_tz(tz)
+        for kind, names in [('zone', [tz]), ('tz city', [_tz_city(tz)]),
+                            ('alias', cities)]:
+            candidate = Candidate(tz_caps, kind, rank)
+            for name in names:
+                found = index.setdefault(name, [])
+                # A name can be both the tz city name and an alias, and a
+                # tz name can be in more than one source
+                if all(known.tz != tz_caps for known in found):
+                    found.append(candidate)
+    shared: Dict[Tuple[Candidate, ...], Tuple[Candidate, ...]] = {}
+    return {name: shared.setdefault(tuple(found), tuple(found))
+            for name, found in index.items()}
+
+
+def _normalize(city: str) -> str:
+    """
+    Return the form of a city name used for lookups.
+
+    Names not found in this form are looked up by their folded form.
+    """
+    return city.strip().lower()
+
+
+def _find_folded(index: Mapping[str, str],
+                 name: str) -> Tuple[str, Optional[str]]:
+    """
+    Find a normalized name which is not in index by its folded form.
+
+    Returns the recognized name matched and its tz name, or name and None
+    if there is no match.
+    """
+    folded = _fold(name)
+    folded_index = _folded()
+    known = folded_index.get(folded)
+    if known is None and folded.endswith(' city'):
+        # As in 'Ho Chi Minh City' and 'Kuwait City'
+        known = folded_index.get(folded[:-len(' city')])
+    if known is None:
+        return name, None
+    return known, index.get(known)
+
+
+def _fold(name: str) -> str:
+    """
+    Return the folded form of a normalized name, which ignores accents,
+    case, punctuation, spacing and abbreviations like 'St.' for 'Saint'.
+    """
+    try:
+        # Most names are ASCII, needing no Unicode normalization
+        name = name.encode('ascii').translate(_FOLD_ASCII, b"'`").decode()
+    except UnicodeEncodeError:
+        # Imported here, keeping it out of the import of tzcity
+        # pylint: disable=import-outside-toplevel
+        from unicodedata import category, normalize
+        name = normalize('NFKD', name).casefold()
+        name = ''.join([_fold_char(char, category(char)) for char in name])
+    return ' '.join([_ABBREVIATIONS.get(word, word) for word in name.split()])
+
+
+def _fold_char(char: str, category: str) -> str:
+    """
+    Return the folded form of a character of a name in NFKD form, given
+    its Unicode category.
+    """
+    if category == 'Mn' or char in _APOSTROPHES:
+        # Accents and apostrophes, as in "Xi'an"
+        return ''
+    if category[0] in 'PSZ' and char != '/':
+        return ' '
+    return _LETTERS.get(char, char)
+
+
+# Dropped by _fold()
+_APOSTROPHES = "'`\u2018\u2019\u02bc\u00b4"
+
+# Letters not decomposed by NFKD
+_LETTERS = {'\u00f8': 'o', '\u00e6': 'ae', '\u0153': 'oe', '\u0111': 'd',
+            '\u0142': 'l', '\u00fe': 'th', '\u00f0': 'd', '\u0131': 'i'}
+
+# Table turning ASCII punctuation other than '/', the characters of
+# string.punctuation but '/', into spaces
+_PUNCTUATION = b"!\"#$%&'()*+,-.:;<=>?@[\\]^_`{|}~"
+_FOLD_ASCII = bytes.maketrans(_PUNCTUATION, b' ' * len(_PUNCTUATION))
+
+# Abbreviated words of names expanded by _fold()
+_ABBREVIATIONS = {'st': 'saint', 'ste': 'sainte'}
 
 
 def capitalize(name: str) -> str:
@@ -46,55 +580,111 @@ def capitalize(name: str) -> str:
     """
 
     # a tz name
-    if name in CITY_DICT:
-        # tz names will have at least one '/'
-        tzfull, city = name.rsplit('/', maxsplit=1)
-        if '/' in tzfull:
-            # 3-part tz names
-            continent, country = tzfull.split('/')
-            continent = continent.title()
-            country = country.title()
-        else:
-            # normal 2-part tz names
-            continent = ""
-            country = tzfull.title()
-        city = city.replace('_', ' ')
-        city = _caps_city(city)
-        city = city.replace(' ', '_')
-        if continent:
-            return f"{continent}/{country}/{city}"
-        return f"{country}/{city}"
+    try:
+        return _TZ_CAPS[name]
+    except KeyError:
+        pass
+    if _index().get(name) == name:
+        _TZ_CAPS[name] = _caps_tz(name)
+        return _TZ_CAPS[name]
 
     # Not a tz name
     return _caps_city(name)
 
 
-def _caps_city(name: str) -> str:
+def _capitalize_lenient(name: str) -> str:
     """
-    Capitalize city names appropriately.
+    Return capitalized form of a recognized name like capitalize(), or
+    its title case form if capitalize() cannot capitalize it.
+
+    For names from extra data sources, which a single odd name should not
+    keep from being shown.
+    """
+    try:
+        return capitalize(name)
+    except ValueError:
+        return name.title()
+
+
+def capitalize_cache_info() -> Tuple[int, int, Optional[int], int]:
+    """
+    Return hits, misses, maximum size and current size of the cache
+    used by capitalize() for names which are not tz names.
+    """
+    return _caps_city.cache_info()
+
+
+def _caps_tz(name: str) -> str:
+    """
+    Capitalize tz names appropriately.
     For use of capitalize() function.
-    Cannot handle tz names.
 
-    Accepts a city name.
+    Accepts a tz name in lower case.
 
-    Returns capitalized version of input city name
+    Returns capitalized version of input tz name
     """
+    if name in _TZ_CAPS_EXCEPTIONS:
+        return _TZ_CAPS_EXCEPTIONS[name]
+    # tz names will have at least one '/'
+    tzfull, city = name.rsplit('/', maxsplit=1)
+    if '/' in tzfull:
+        # 3-part tz names
+        continent, country = tzfull.split('/')
+        continent = continent.title()
+        country = country.title()
+    else:
+        # normal 2-part tz names
+        continent = ""
+        country = tzfull.title()
+    city = city.replace('_', ' ')
+    city = _caps_city(city)
+    # Unlike city names, as in 'America/La_Paz'
+    city = city[0].upper() + city[1:]
+    city = city.replace(' ', '_')
+    if continent:
+        return f"{continent}/{country}/{city}"
+    return f"{country}/{city}"
+
+
+# Capitalized tz names, filled from tzcity.compiled, by tzcity.sources and
+# on first use of other tz names
+_TZ_CAPS: Dict[str, str] = {}
+
+# tz names not capitalized by the rules of _caps_tz()
+_TZ_CAPS_EXCEPTIONS = {
+    'antarctica/dumontdurville': 'Antarctica/DumontDUrville',
+}
 
-    SPECIAL_PATTERNS = {
-        # For 'Andorra la vella', 'Port of Prince', 'Dar es Salaam', etc
-        'lower': ['la', 'de', 'da', 'and', 'of', 'the', 'es'],
+# Maximum number of non-tz names whose capitalized form is cached
+_CAPS_CACHE_SIZE = 1024
 
-        # For 'UK', 'UAE', 'Washington DC', etc
-        'upper': ['uk', 'uae', 'sgssi', 'dc'],
+SPECIAL_PATTERNS = {
+    # For 'Andorra la vella', 'Port of Prince', 'Dar es Salaam', etc
+    'lower': ['la', 'de', 'da', 'and', 'of', 'the', 'es'],
 
-        # For 'Port-au-Prince', 'Fort-de-France', etc
-        'hyphen': ['au', 'de'],
-    }
+    # For 'UK', 'UAE', 'Washington DC', etc
+    'upper': ['uk', 'uae', 'sgssi', 'dc'],
 
-    # For 'McMurdo', 'Dumont d'Urville', 'N'Djamena', etc
-    # length of each value must be same as its key.
-    OTHERS = {'mc': 'Mc', "d'": "d'", "n'": "N'"}
+    # For 'Port-au-Prince', 'Fort-de-France', etc
+    'hyphen': ['au', 'de'],
+}
 
+# For 'McMurdo', 'Dumont d'Urville', 'N'Djamena', etc
+# length of each value must be same as its key.
+OTHERS = {'mc': 'Mc', "d'": "d'", "n'": "N'"}
+
+
+@lru_cache(maxsize=_CAPS_CACHE_SIZE)
+def _caps_city(name: str) -> str:
+    """
+    Capitalize city names appropriately.
+    For use of capitalize() function.
+    Cannot handle tz names.
+
+    Accepts a city name.
+
+    Returns capitalized version of input city name
+    """
     name = name.lower()  # no strip() as split() will handle that
     words = name.split()
 
@@ -105,20 +695,21 @@ def _caps_city(name: str) -> str:
             new_word = word.lower()
         elif word in SPECIAL_PATTERNS['upper']:
             new_word = word.upper()
-        elif any([f"-{x}-" in word for x in SPECIAL_PATTERNS['hyphen']]):
-            pre, hyphen, post = word.replace('-', ' ').split()
-            new_word = f"{pre.title()}-{hyphen}-{post.title()}"
+        elif any(f"-{x}-" in word for x in SPECIAL_PATTERNS['hyphen']):
+            # Any number of hyphens, as in 'Saint-Jean-de-Luz'
+            parts = word.split('-')
+            new_word = '-'.join([
+                part if 0 < i < len(parts) - 1
+                and part in SPECIAL_PATTERNS['hyphen'] else part.title()
+                for i, part in enumerate(parts)])
         else:
-            re_str = ')|('.join(OTHERS)
-            re_str = rf"({re_str})"
-            re_match = re.match(re_str, word)
-            if re_match is not None:
-                match_str = re_match.group(0)
-                if len(word) > len(match_str):
-                    repl_str = OTHERS[match_str]
-                    new_word = f"{repl_str}{word[len(match_str):].title()}"
-                else:
-                    raise ValueError(f"{word} Could not capitalize")
+            for match_str, repl_str in OTHERS.items():
+                if word.startswith(match_str):
+                    if len(word) > len(match_str):
+                        new_word = f"{repl_str}{word[len(match_str):].title()}"
+                    else:
+                        raise ValueError(f"{word} Could not capitalize")
+                    break
             else:
                 new_word = word.title()
         new_words.append(new_word)
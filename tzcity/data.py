@@ -2,7 +2,7 @@
 Data used by tzcity
 """
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 CITY_DICT: Dict[str, List[str]] = {
     "africa/abidjan": ["cote d'ivoire", "ivory coast", "yamoussaoukro"],
@@ -426,3 +426,423 @@ CITY_DICT: Dict[str, List[str]] = {
     "pacific/tongatapu": ["tonga"],
     "pacific/wallis": ["wallis and futuna", "mata utu"],
 }
+
+# Coordinates of the cities whose names are part of the tz names, as
+# (latitude, longitude) in degrees. From zone.tab of the tz database.
+COORDINATES: Dict[str, Tuple[float, float]] = {
+    "africa/abidjan": (5.32, -4.03),
+    "africa/accra": (5.55, -0.22),
+    "africa/addis_ababa": (9.03, 38.7),
+    "africa/algiers": (36.78, 3.05),
+    "africa/asmara": (15.33, 38.88),
+    "africa/bamako": (12.65, -8.0),
+    "africa/bangui": (4.37, 18.58),
+    "africa/banjul": (13.47, -16.65),
+    "africa/bissau": (11.85, -15.58),
+    "africa/blantyre": (-15.78, 35.0),
+    "africa/brazzaville": (-4.27, 15.28),
+    "africa/bujumbura": (-3.38, 29.37),
+    "africa/cairo": (30.05, 31.25),
+    "africa/casablanca": (33.65, -7.58),
+    "africa/ceuta": (35.88, -5.32),
+    "africa/conakry": (9.52, -13.72),
+    "africa/dakar": (14.67, -17.43),
+    "africa/dar_es_salaam": (-6.8, 39.28),
+    "africa/djibouti": (11.6, 43.15),
+    "africa/douala": (4.05, 9.7),
+    "africa/el_aaiun": (27.15, -13.2),
+    "africa/freetown": (8.5, -13.25),
+    "africa/gaborone": (-24.65, 25.92),
+    "africa/harare": (-17.83, 31.05),
+    "africa/johannesburg": (-26.25, 28.0),
+    "africa/juba": (4.85, 31.62),
+    "africa/kampala": (0.32, 32.42),
+    "africa/khartoum": (15.6, 32.53),
+    "africa/kigali": (-1.95, 30.07),
+    "africa/kinshasa": (-4.3, 15.3),
+    "africa/lagos": (6.45, 3.4),
+    "africa/libreville": (0.38, 9.45),
+    "africa/lome": (6.13, 1.22),
+    "africa/luanda": (-8.8, 13.23),
+    "africa/lubumbashi": (-11.67, 27.47),
+    "africa/lusaka": (-15.42, 28.28),
+    "africa/malabo": (3.75, 8.78),
+    "africa/maputo": (-25.97, 32.58),
+    "africa/maseru": (-29.47, 27.5),
+    "africa/mbabane": (-26.3, 31.1),
+    "africa/mogadishu": (2.07, 45.37),
+    "africa/monrovia": (6.3, -10.78),
+    "africa/nairobi": (-1.28, 36.82),
+    "africa/ndjamena": (12.12, 15.05),
+    "africa/niamey": (13.52, 2.12),
+    "africa/nouakchott": (18.1, -15.95),
+    "africa/ouagadougou": (12.37, -1.52),
+    "africa/porto-novo": (6.48, 2.62),
+    "africa/sao_tome": (0.33, 6.73),
+    "africa/tripoli": (32.9, 13.18),
+    "africa/tunis": (36.8, 10.18),
+    "africa/windhoek": (-22.57, 17.1),
+    "america/adak": (51.88, -176.66),
+    "america/anchorage": (61.22, -149.9),
+    "america/anguilla": (18.2, -63.07),
+    "america/antigua": (17.05, -61.8),
+    "america/araguaina": (-7.2, -48.2),
+    "america/argentina/buenos_aires": (-34.6, -58.45),
+    "america/argentina/catamarca": (-28.47, -65.78),
+    "america/argentina/cordoba": (-31.4, -64.18),
+    "america/argentina/jujuy": (-24.18, -65.3),
+    "america/argentina/la_rioja": (-29.43, -66.85),
+    "america/argentina/mendoza": (-32.88, -68.82),
+    "america/argentina/rio_gallegos": (-51.63, -69.22),
+    "america/argentina/salta": (-24.78, -65.42),
+    "america/argentina/san_luis": (-33.32, -66.35),
+    "america/argentina/tucuman": (-26.82, -65.22),
+    "america/argentina/ushuaia": (-54.8, -68.3),
+    "america/aruba": (12.5, -69.97),
+    "america/asuncion": (-25.27, -57.67),
+    "america/atikokan": (48.76, -91.62),
+    "america/bahia": (-12.98, -38.52),
+    "america/bahia_banderas": (20.8, -105.25),
+    "america/barbados": (13.1, -59.62),
+    "america/belem": (-1.45, -48.48),
+    "america/belize": (17.5, -88.2),
+    "america/blanc-sablon": (51.42, -57.12),
+    "america/boa_vista": (2.82, -60.67),
+    "america/bogota": (4.6, -74.08),
+    "america/boise": (43.61, -116.2),
+    "america/cambridge_bay": (69.11, -105.05),
+    "america/campo_grande": (-20.45, -54.62),
+    "america/cancun": (21.08, -86.77),
+    "america/caracas": (10.5, -66.93),
+    "america/cayenne": (4.93, -52.33),
+    "america/cayman": (19.3, -81.38),
+    "america/chicago": (41.85, -87.65),
+    "america/chihuahua": (28.63, -106.08),
+    "america/costa_rica": (9.93, -84.08),
+    "america/creston": (49.1, -116.52),
+    "america/cuiaba": (-15.58, -56.08),
+    "america/curacao": (12.18, -69.0),
+    "america/danmarkshavn": (76.77, -18.67),
+    "america/dawson": (64.07, -139.42),
+    "america/dawson_creek": (55.77, -120.23),
+    "america/denver": (39.74, -104.98),
+    "america/detroit": (42.33, -83.05),
+    "america/dominica": (15.3, -61.4),
+    "america/edmonton": (53.55, -113.47),
+    "america/eirunepe": (-6.67, -69.87),
+    "america/el_salvador": (13.7, -89.2),
+    "america/fortaleza": (-3.72, -38.5),
+    "america/fort_nelson": (58.8, -122.7),
+    "america/glace_bay": (46.2, -59.95),
+    "america/goose_bay": (53.33, -60.42),
+    "america/grand_turk": (21.47, -71.13),
+    "america/grenada": (12.05, -61.75),
+    "america/guadeloupe": (16.23, -61.53),
+    "america/guatemala": (14.63, -90.52),
+    "america/guayaquil": (-2.17, -79.83),
+    "america/guyana": (6.8, -58.17),
+    "america/halifax": (44.65, -63.6),
+    "america/havana": (23.13, -82.37),
+    "america/hermosillo": (29.07, -110.97),
+    "america/indiana/indianapolis": (39.77, -86.16),
+    "america/indiana/tell_city": (37.95, -86.76),
+    "america/indiana/vevay": (38.75, -85.07),
+    "america/indiana/vincennes": (38.68, -87.53),
+    "america/indiana/winamac": (41.05, -86.6),
+    "america/inuvik": (68.35, -133.72),
+    "america/iqaluit": (63.73, -68.47),
+    "america/jamaica": (17.97, -76.79),
+    "america/juneau": (58.3, -134.42),
+    "america/kentucky/louisville": (38.25, -85.76),
+    "america/kralendijk": (12.15, -68.28),
+    "america/la_paz": (-16.5, -68.15),
+    "america/lima": (-12.05, -77.05),
+    "america/los_angeles": (34.05, -118.24),
+    "america/lower_princes": (18.05, -63.05),
+    "america/maceio": (-9.67, -35.72),
+    "america/managua": (12.15, -86.28),
+    "america/manaus": (-3.13, -60.02),
+    "america/marigot": (18.07, -63.08),
+    "america/martinique": (14.6, -61.08),
+    "america/matamoros": (25.83, -97.5),
+    "america/mazatlan": (23.22, -106.42),
+    "america/menominee": (45.11, -87.61),
+    "america/merida": (20.97, -89.62),
+    "america/metlakatla": (55.13, -131.58),
+    "america/mexico_city": (19.4, -99.15),
+    "america/miquelon": (47.05, -56.33),
+    "america/moncton": (46.1, -64.78),
+    "america/monterrey": (25.67, -100.32),
+    "america/montevideo": (-34.91, -56.21),
+    "america/montserrat": (16.72, -62.22),
+    "america/nassau": (25.08, -77.35),
+    "america/new_york": (40.71, -74.01),
+    "america/nipigon": (49.02, -88.27),
+    "america/nome": (64.5, -165.41),
+    "america/noronha": (-3.85, -32.42),
+    "america/north_dakota/beulah": (47.26, -101.78),
+    "america/nuuk": (64.18, -51.73),
+    "america/ojinaga": (29.57, -104.42),
+    "america/panama": (8.97, -79.53),
+    "america/pangnirtung": (66.13, -65.73),
+    "america/paramaribo": (5.83, -55.17),
+    "america/phoenix": (33.45, -112.07),
+    "america/port-au-prince": (18.53, -72.33),
+    "america/port_of_spain": (10.65, -61.52),
+    "america/porto_velho": (-8.77, -63.9),
+    "america/puerto_rico": (18.47, -66.11),
+    "america/punta_arenas": (-53.15, -70.92),
+    "america/rainy_river": (48.72, -94.57),
+    "america/rankin_inlet": (62.82, -92.08),
+    "america/recife": (-8.05, -34.9),
+    "america/regina": (50.4, -104.65),
+    "america/resolute": (74.7, -94.83),
+    "america/rio_branco": (-9.97, -67.8),
+    "america/santarem": (-2.43, -54.87),
+    "america/santiago": (-33.45, -70.67),
+    "america/santo_domingo": (18.47, -69.9),
+    "america/sao_paulo": (-23.53, -46.62),
+    "america/scoresbysund": (70.48, -21.97),
+    "america/sitka": (57.18, -135.3),
+    "america/st_barthelemy": (17.88, -62.85),
+    "america/st_johns": (47.57, -52.72),
+    "america/st_kitts": (17.3, -62.72),
+    "america/st_lucia": (14.02, -61.0),
+    "america/st_vincent": (13.15, -61.23),
+    "america/swift_current": (50.28, -107.83),
+    "america/tegucigalpa": (14.1, -87.22),
+    "america/thule": (76.57, -68.78),
+    "america/thunder_bay": (48.38, -89.25),
+    "america/tijuana": (32.53, -117.02),
+    "america/toronto": (43.65, -79.38),
+    "america/tortola": (18.45, -64.62),
+    "america/vancouver": (49.27, -123.12),
+    "america/whitehorse": (60.72, -135.05),
+    "america/winnipeg": (49.88, -97.15),
+    "america/yakutat": (59.55, -139.73),
+    "america/yellowknife": (62.45, -114.35),
+    "antarctica/casey": (-66.28, 110.52),
+    "antarctica/davis": (-68.58, 77.97),
+    "antarctica/dumontdurville": (-66.67, 140.02),
+    "antarctica/macquarie": (-54.5, 158.95),
+    "antarctica/mawson": (-67.6, 62.88),
+    "antarctica/mcmurdo": (-77.83, 166.6),
+    "antarctica/palmer": (-64.8, -64.1),
+    "antarctica/rothera": (-67.57, -68.13),
+    "antarctica/syowa": (-69.01, 39.59),
+    "antarctica/troll": (-72.01, 2.53),
+    "antarctica/vostok": (-78.4, 106.9),
+    "arctic/longyearbyen": (78.0, 16.0),
+    "asia/aden": (12.75, 45.2),
+    "asia/almaty": (43.25, 76.95),
+    "asia/amman": (31.95, 35.93),
+    "asia/anadyr": (64.75, 177.48),
+    "asia/aqtau": (44.52, 50.27),
+    "asia/aqtobe": (50.28, 57.17),
+    "asia/ashgabat": (37.95, 58.38),
+    "asia/atyrau": (47.12, 51.93),
+    "asia/baghdad": (33.35, 44.42),
+    "asia/bahrain": (26.38, 50.58),
+    "asia/baku": (40.38, 49.85),
+    "asia/bangkok": (13.75, 100.52),
+    "asia/barnaul": (53.37, 83.75),
+    "asia/beirut": (33.88, 35.5),
+    "asia/bishkek": (42.9, 74.6),
+    "asia/brunei": (4.93, 114.92),
+    "asia/chita": (52.05, 113.47),
+    "asia/choibalsan": (48.07, 114.5),
+    "asia/colombo": (6.93, 79.85),
+    "asia/damascus": (33.5, 36.3),
+    "asia/dhaka": (23.72, 90.42),
+    "asia/dili": (-8.55, 125.58),
+    "asia/dubai": (25.3, 55.3),
+    "asia/dushanbe": (38.58, 68.8),
+    "asia/famagusta": (35.12, 33.95),
+    "asia/gaza": (31.5, 34.47),
+    "asia/hebron": (31.53, 35.09),
+    "asia/ho_chi_minh": (10.75, 106.67),
+    "asia/hong_kong": (22.28, 114.15),
+    "asia/hovd": (48.02, 91.65),
+    "asia/irkutsk": (52.27, 104.33),
+    "asia/jakarta": (-6.17, 106.8),
+    "asia/jayapura": (-2.53, 140.7),
+    "asia/jerusalem": (31.78, 35.22),
+    "asia/kabul": (34.52, 69.2),
+    "asia/kamchatka": (53.02, 158.65),
+    "asia/karachi": (24.87, 67.05),
+    "asia/kathmandu": (27.72, 85.32),
+    "asia/khandyga": (62.66, 135.55),
+    "asia/kolkata": (22.53, 88.37),
+    "asia/krasnoyarsk": (56.02, 92.83),
+    "asia/kuala_lumpur": (3.17, 101.7),
+    "asia/kuching": (1.55, 110.33),
+    "asia/kuwait": (29.33, 47.98),
+    "asia/macau": (22.2, 113.54),
+    "asia/magadan": (59.57, 150.8),
+    "asia/makassar": (-5.12, 119.4),
+    "asia/manila": (14.59, 120.97),
+    "asia/muscat": (23.6, 58.58),
+    "asia/nicosia": (35.17, 33.37),
+    "asia/novokuznetsk": (53.75, 87.12),
+    "asia/novosibirsk": (55.03, 82.92),
+    "asia/omsk": (55.0, 73.4),
+    "asia/oral": (51.22, 51.35),
+    "asia/phnom_penh": (11.55, 104.92),
+    "asia/pontianak": (-0.03, 109.33),
+    "asia/pyongyang": (39.02, 125.75),
+    "asia/qatar": (25.28, 51.53),
+    "asia/qostanay": (53.2, 63.62),
+    "asia/qyzylorda": (44.8, 65.47),
+    "asia/riyadh": (24.63, 46.72),
+    "asia/sakhalin": (46.97, 142.7),
+    "asia/samarkand": (39.67, 66.8),
+    "asia/seoul": (37.55, 126.97),
+    "asia/shanghai": (31.23, 121.47),
+    "asia/singapore": (1.28, 103.85),
+    "asia/srednekolymsk": (67.47, 153.72),
+    "asia/taipei": (25.05, 121.5),
+    "asia/tashkent": (41.33, 69.3),
+    "asia/tbilisi": (41.72, 44.82),
+    "asia/tehran": (35.67, 51.43),
+    "asia/thimphu": (27.47, 89.65),
+    "asia/tokyo": (35.65, 139.74),
+    "asia/tomsk": (56.5, 84.97),
+    "asia/ulaanbaatar": (47.92, 106.88),
+    "asia/urumqi": (43.8, 87.58),
+    "asia/ust-nera": (64.56, 143.23),
+    "asia/vientiane": (17.97, 102.6),
+    "asia/vladivostok": (43.17, 131.93),
+    "asia/yakutsk": (62.0, 129.67),
+    "asia/yangon": (16.78, 96.17),
+    "asia/yekaterinburg": (56.85, 60.6),
+    "asia/yerevan": (40.18, 44.5),
+    "atlantic/azores": (37.73, -25.67),
+    "atlantic/bermuda": (32.28, -64.77),
+    "atlantic/canary": (28.1, -15.4),
+    "atlantic/cape_verde": (14.92, -23.52),
+    "atlantic/faroe": (62.02, -6.77),
+    "atlantic/madeira": (32.63, -16.9),
+    "atlantic/reykjavik": (64.15, -21.85),
+    "atlantic/south_georgia": (-54.27, -36.53),
+    "atlantic/stanley": (-51.7, -57.85),
+    "atlantic/st_helena": (-15.92, -5.7),
+    "australia/adelaide": (-34.92, 138.58),
+    "australia/brisbane": (-27.47, 153.03),
+    "australia/broken_hill": (-31.95, 141.45),
+    "australia/currie": (-39.93, 143.87),
+    "australia/darwin": (-12.47, 130.83),
+    "australia/eucla": (-31.72, 128.87),
+    "australia/hobart": (-42.88, 147.32),
+    "australia/lindeman": (-20.27, 149.0),
+    "australia/lord_howe": (-31.55, 159.08),
+    "australia/melbourne": (-37.82, 144.97),
+    "australia/perth": (-31.95, 115.85),
+    "australia/sydney": (-33.87, 151.22),
+    "europe/amsterdam": (52.37, 4.9),
+    "europe/andorra": (42.5, 1.52),
+    "europe/astrakhan": (46.35, 48.05),
+    "europe/athens": (37.97, 23.72),
+    "europe/belgrade": (44.83, 20.5),
+    "europe/berlin": (52.5, 13.37),
+    "europe/bratislava": (48.15, 17.12),
+    "europe/brussels": (50.83, 4.33),
+    "europe/bucharest": (44.43, 26.1),
+    "europe/budapest": (47.5, 19.08),
+    "europe/busingen": (47.7, 8.68),
+    "europe/chisinau": (47.0, 28.83),
+    "europe/copenhagen": (55.67, 12.58),
+    "europe/dublin": (53.33, -6.25),
+    "europe/gibraltar": (36.13, -5.35),
+    "europe/guernsey": (49.45, -2.54),
+    "europe/helsinki": (60.17, 24.97),
+    "europe/isle_of_man": (54.15, -4.47),
+    "europe/istanbul": (41.02, 28.97),
+    "europe/jersey": (49.18, -2.11),
+    "europe/kaliningrad": (54.72, 20.5),
+    "europe/kiev": (50.43, 30.52),
+    "europe/kirov": (58.6, 49.65),
+    "europe/lisbon": (38.72, -9.13),
+    "europe/ljubljana": (46.05, 14.52),
+    "europe/london": (51.51, -0.13),
+    "europe/luxembourg": (49.6, 6.15),
+    "europe/madrid": (40.4, -3.68),
+    "europe/malta": (35.9, 14.52),
+    "europe/mariehamn": (60.1, 19.95),
+    "europe/minsk": (53.9, 27.57),
+    "europe/monaco": (43.7, 7.38),
+    "europe/moscow": (55.76, 37.62),
+    "europe/oslo": (59.92, 10.75),
+    "europe/paris": (48.87, 2.33),
+    "europe/podgorica": (42.43, 19.27),
+    "europe/prague": (50.08, 14.43),
+    "europe/riga": (56.95, 24.1),
+    "europe/rome": (41.9, 12.48),
+    "europe/samara": (53.2, 50.15),
+    "europe/san_marino": (43.92, 12.47),
+    "europe/sarajevo": (43.87, 18.42),
+    "europe/saratov": (51.57, 46.03),
+    "europe/simferopol": (44.95, 34.1),
+    "europe/skopje": (41.98, 21.43),
+    "europe/sofia": (42.68, 23.32),
+    "europe/stockholm": (59.33, 18.05),
+    "europe/tallinn": (59.42, 24.75),
+    "europe/tirane": (41.33, 19.83),
+    "europe/ulyanovsk": (54.33, 48.4),
+    "europe/uzhgorod": (48.62, 22.3),
+    "europe/vaduz": (47.15, 9.52),
+    "europe/vatican": (41.9, 12.45),
+    "europe/vienna": (48.22, 16.33),
+    "europe/vilnius": (54.68, 25.32),
+    "europe/volgograd": (48.73, 44.42),
+    "europe/warsaw": (52.25, 21.0),
+    "europe/zagreb": (45.8, 15.97),
+    "europe/zaporozhye": (47.83, 35.17),
+    "europe/zurich": (47.38, 8.53),
+    "indian/antananarivo": (-18.92, 47.52),
+    "indian/chagos": (-7.33, 72.42),
+    "indian/christmas": (-10.42, 105.72),
+    "indian/cocos": (-12.17, 96.92),
+    "indian/comoro": (-11.68, 43.27),
+    "indian/kerguelen": (-49.35, 70.22),
+    "indian/mahe": (-4.67, 55.47),
+    "indian/maldives": (4.17, 73.5),
+    "indian/mauritius": (-20.17, 57.5),
+    "indian/mayotte": (-12.78, 45.23),
+    "indian/reunion": (-20.87, 55.47),
+    "pacific/apia": (-13.83, -171.73),
+    "pacific/auckland": (-36.87, 174.77),
+    "pacific/bougainville": (-6.22, 155.57),
+    "pacific/chatham": (-43.95, -176.55),
+    "pacific/chuuk": (7.42, 151.78),
+    "pacific/easter": (-27.15, -109.43),
+    "pacific/efate": (-17.67, 168.42),
+    "pacific/enderbury": (-3.13, -171.08),
+    "pacific/fakaofo": (-9.37, -171.23),
+    "pacific/fiji": (-18.13, 178.42),
+    "pacific/funafuti": (-8.52, 179.22),
+    "pacific/galapagos": (-0.9, -89.6),
+    "pacific/gambier": (-23.13, -134.95),
+    "pacific/guadalcanal": (-9.53, 160.2),
+    "pacific/guam": (13.47, 144.75),
+    "pacific/honolulu": (21.31, -157.86),
+    "pacific/kiritimati": (1.87, -157.33),
+    "pacific/kosrae": (5.32, 162.98),
+    "pacific/kwajalein": (9.08, 167.33),
+    "pacific/majuro": (7.15, 171.2),
+    "pacific/marquesas": (-9.0, -139.5),
+    "pacific/nauru": (-0.52, 166.92),
+    "pacific/niue": (-19.02, -169.92),
+    "pacific/norfolk": (-29.05, 167.97),
+    "pacific/noumea": (-22.27, 166.45),
+    "pacific/pago_pago": (-14.27, -170.7),
+    "pacific/palau": (7.33, 134.48),
+    "pacific/pitcairn": (-25.07, -130.08),
+    "pacific/pohnpei": (6.97, 158.22),
+    "pacific/port_moresby": (-9.5, 147.17),
+    "pacific/rarotonga": (-21.23, -159.77),
+    "pacific/saipan": (15.2, 145.75),
+    "pacific/tahiti": (-17.53, -149.57),
+    "pacific/tarawa": (1.42, 173.0),
+    "pacific/tongatapu": (-21.13, -175.2),
+    "pacific/wallis": (-13.3, -176.17),
+}
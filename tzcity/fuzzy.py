@@ -0,0 +1,131 @@
+"""
+Typo tolerant lookup of time zones
+"""
+
+# pylint: disable=protected-access
+
+import heapq
+from collections import Counter, defaultdict
+from itertools import chain
+from typing import Dict, List, Set, Tuple
+
+from tzcity import core
+
+# Number of best trigram matches whose edit distance is computed
+_CANDIDATES = 8
+
+
+def tzcity_fuzzy(city: str, cutoff: float = 0.75) -> Tuple[str, float]:
+    """
+    Find the time zone associated with a possibly misspelt city.
+
+    Returns the time zone name and a score between 0 and 1 indicating
+    how similar the best matching known name is to the argument.
+    An exact match, ignoring accents and punctuation, has a score of 1.
+
+    Raises ValueError if no known name has a score of at least cutoff,
+    or if cutoff is not greater than 0 and at most 1.
+    """
+    if not 0 < cutoff <= 1:
+        raise ValueError(f"cutoff {cutoff}: Must be greater than 0 and at "
+                         "most 1")
+    city = core._normalize(city)
+    tz_value = core._index().get(city)
+    if tz_value is None:
+        tz_value = core._find_folded(core._index(), city)[1]
+    if tz_value is not None:
+        return core.capitalize(tz_value), 1.0
+
+    best_name = ''
+    best_score = 0.0
+    for name in _candidates(city, cutoff):
+        length = max(len(city), len(name))
+        # Farther names cannot beat the best match found so far
+        limit = int((1 - max(cutoff, best_score)) * length)
+        score = 1 - _distance(city, name, limit) / length
+        if score > best_score:
+            best_name, best_score = name, score
+
+    if best_name and best_score >= cutoff:
+        return core.capitalize(core._index()[best_name]), best_score
+    raise ValueError(f"{city}: Ambiguous or unknown time zone")
+
+
+def _candidates(city: str, cutoff: float) -> List[str]:
+    """
+    Return the known names sharing the most trigrams with a city name,
+    most similar first.
+    """
+    names, sizes, postings = _trigram_index()
+    city_trigrams = _trigrams(city)
+
+    # Count trigrams shared with each known name
+    shared = Counter(chain.from_iterable(
+        postings.get(trigram, ()) for trigram in city_trigrams))
+
+    # An edit changes at most 3 trigrams, so names with too few shared
+    # trigrams cannot be close enough to reach cutoff.
+    max_edits = int((1 - cutoff) * len(city) / cutoff)
+    min_shared = len(city_trigrams) - 3 * max_edits
+
+    # Rank by Dice coefficient of trigram sets, earlier names first on ties
+    size = len(city_trigrams)
+    ranked = [(2 * count / (size + sizes[name_id]), -name_id)
+              for name_id, count in shared.items() if count >= min_shared]
+    return [names[-neg_id]
+            for _, neg_id in heapq.nlargest(_CANDIDATES, ranked)]
+
+
+@core._derived
+def _trigram_index() -> Tuple[List[str], List[int],
+                              Dict[str, List[int]]]:
+    """
+    Build an inverted index from trigrams to the known names having them.
+
+    Returns the list of known names, the number of trigrams of each name
+    and a mapping from each trigram to the positions of the names having
+    it in that list.
+    """
+    names = list(core._index())
+    sizes = []
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for name_id, name in enumerate(names):
+        trigrams = _trigrams(name)
+        sizes.append(len(trigrams))
+        for trigram in trigrams:
+            postings[trigram].append(name_id)
+    return names, sizes, dict(postings)
+
+
+def _trigrams(name: str) -> Set[str]:
+    """
+    Return the set of trigrams of a name padded with spaces.
+    """
+    padded = f"  {name} "
+    return {padded[i:i+3] for i in range(len(padded) - 2)}
+
+
+def _distance(first: str, second: str, limit: int) -> int:
+    """
+    Return the Levenshtein edit distance between two strings.
+
+    Only distances up to limit are computed exactly. limit + 1 is
+    returned for anything farther apart.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    far = limit + 1
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, start=1):
+        # Only cells within limit of the diagonal can be within limit
+        low = max(1, i - limit)
+        high = min(len(second), i + limit)
+        current = [far] * (len(second) + 1)
+        current[0] = i
+        for j in range(low, high + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                             previous[j - 1] + (first_char != second[j - 1]))
+        if min(current) > limit:
+            return far
+        previous = current
+    return min(previous[-1], far)
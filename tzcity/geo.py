@@ -0,0 +1,170 @@
+"""
+Time zones of places from their coordinates
+
+A place is mapped to the time zone of the nearest city in COORDINATES,
+which has the cities whose names are part of the tz names. As time zone
+borders are not bundled, places near a border may be mapped to the
+time zone on the other side of it.
+"""
+
+# pylint: disable=protected-access
+
+import math
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from tzcity import core
+
+# Size of the cells of the grid in degrees of latitude and longitude
+_CELL = 1
+
+# Size of the cells of the coarse grid from which the candidates of the
+# cells of the grid are picked, a multiple of _CELL
+_COARSE = 15
+
+# Number of cells of each row of the grid
+_COLUMNS = 360 // _CELL
+
+# Number of rows of the grid
+_ROWS = 180 // _CELL
+
+# Capitalized tz name and position of its city on the unit sphere
+City = Tuple[str, float, float, float]
+
+# Cities which may be the nearest to a place in each cell of the grid, by
+# cell number. Cells are filled in when first needed.
+_CANDIDATES: Dict[int, List[City]] = {}
+
+
+def nearest(lat: float, lon: float) -> str:
+    """
+    Return the time zone of the city nearest to the place at latitude lat
+    and longitude lon, in degrees.
+
+    Raises ValueError if the coordinates are out of range.
+    """
+    candidates = _cell(lat, lon)
+    if len(candidates) == 1:
+        return candidates[0][0]
+    return _closest(candidates, lat, lon)
+
+
+def nearest_many(points: Iterable[Tuple[float, float]]) -> Iterator[str]:
+    """
+    Yield nearest(lat, lon) for each (lat, lon) in points.
+
+    This is faster than calling nearest() in a loop.
+    """
+    cells = _CANDIDATES
+    for lat, lon in points:
+        if -90 <= lat < 90 and -180 <= lon < 180:
+            key = int((lat + 90) // _CELL) * _COLUMNS + int((lon + 180)
+                                                            // _CELL)
+            candidates = cells.get(key) or _cell(lat, lon)
+        else:
+            candidates = _cell(lat, lon)
+        if len(candidates) == 1:
+            yield candidates[0][0]
+        else:
+            yield _closest(candidates, lat, lon)
+
+
+def _cell(lat: float, lon: float) -> List[City]:
+    """
+    Return the candidates of the cell of the grid having (lat, lon).
+
+    Raises ValueError if the coordinates are out of range.
+    """
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError(f"{lat}, {lon}: Coordinates out of range")
+    row = min(int((lat + 90) // _CELL), _ROWS - 1)
+    column = int((lon + 180) // _CELL) % _COLUMNS
+    key = row * _COLUMNS + column
+    candidates = _CANDIDATES.get(key)
+    if candidates is None:
+        south = row * _CELL - 90
+        west = column * _CELL - 180
+        coarse = _coarse_candidates(int((south + 90) // _COARSE),
+                                    int((west + 180) // _COARSE))
+        candidates = _CANDIDATES[key] = _cell_candidates(south, west, _CELL,
+                                                         coarse)
+    return candidates
+
+
+@lru_cache(maxsize=None)
+def _coarse_candidates(row: int, column: int) -> List[City]:
+    """
+    Return the candidates of a cell of the coarse grid.
+    """
+    return _cell_candidates(row * _COARSE - 90, column * _COARSE - 180,
+                            _COARSE, _cities())
+
+
+def _cell_candidates(south: float, west: float, size: float,
+                     cities: List[City]) -> List[City]:
+    """
+    Pick the cities which may be the nearest to a place in a cell, given
+    cities having all those of the cell.
+
+    A city is left out if its distance from the center of the cell, less
+    the distance from the center to the farthest corner of the cell, is
+    more than the distance from the center to the city nearest to the
+    center plus that same distance to the corner.
+    """
+    x, y, z = _vector(south + size / 2, west + size / 2)
+    distances = [_chord(city[1] * x + city[2] * y + city[3] * z)
+                 for city in cities]
+    radius = max(_chord(sum(a * b for a, b in zip((x, y, z),
+                                                  _vector(lat, lon))))
+                 for lat in (south, south + size)
+                 for lon in (west, west + size))
+    # Allow for rounding errors
+    bound = min(distances) + 2 * radius + 1e-9
+    return [city for city, distance in zip(cities, distances)
+            if distance <= bound]
+
+
+def _closest(candidates: List[City], lat: float, lon: float) -> str:
+    """
+    Return the tz name of the candidate closest to (lat, lon).
+    """
+    x, y, z = _vector(lat, lon)
+    # The closest has the largest dot product with the position
+    best = -2.0
+    tz = ''
+    for city in candidates:
+        dot = city[1] * x + city[2] * y + city[3] * z
+        if dot > best:
+            best = dot
+            tz = city[0]
+    return tz
+
+
+@lru_cache(maxsize=None)
+def _cities() -> List[City]:
+    """
+    Return the capitalized tz names of COORDINATES with the positions of
+    their cities on the unit sphere.
+    """
+    # pylint: disable=import-outside-toplevel
+    from tzcity.data import COORDINATES
+    return [(core._caps_tz(tz), *_vector(lat, lon))
+            for tz, (lat, lon) in COORDINATES.items()]
+
+
+def _vector(lat: float, lon: float) -> Tuple[float, float, float]:
+    """
+    Return the position of (lat, lon) on the unit sphere.
+    """
+    lat = math.radians(lat)
+    lon = math.radians(lon)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon),
+            math.sin(lat))
+
+
+def _chord(dot: float) -> float:
+    """
+    Return the straight line distance between two positions on the unit
+    sphere from their dot product.
+    """
+    return math.sqrt(max(2 - 2 * dot, 0.0))
@@ -0,0 +1,116 @@
+"""
+Consistency of the data with the installed IANA time zone database
+
+The names of time zones and of the links to them are read once from the
+tzdata.zi file of the time zone database found by zoneinfo. Without such
+a file, as with the tzdata package, names are read from zoneinfo and no
+links are known.
+
+Needs the zoneinfo module of Python 3.9 or later.
+"""
+
+# pylint: disable=protected-access
+
+import os
+from functools import lru_cache
+from typing import (Dict, Iterable, List, Mapping, NamedTuple, Optional,
+                    Sequence, Tuple)
+
+from tzcity import core
+
+
+class Differences(NamedTuple):
+    """
+    Differences between the tz names of the data and the installed time
+    zone database.
+
+    missing has the tz names not in the database. renamed maps the tz
+    names which are links to the names of the time zones they link to,
+    like 'europe/kiev' to 'Europe/Kyiv'. capitalization maps the tz names
+    capitalized differently by capitalize() to their names in the
+    database.
+    """
+    missing: List[str]
+    renamed: Dict[str, str]
+    capitalization: Dict[str, str]
+
+
+def iana_name(tz: str) -> Optional[str]:
+    """
+    Return the name of a time zone or link as in the installed database,
+    found regardless of case, or None if it is not there.
+    """
+    return _database()[0].get(core._normalize(tz))
+
+
+def canonical_name(tz: str) -> Optional[str]:
+    """
+    Return the name of the time zone a name refers to, following links
+    like 'Asia/Calcutta' to 'Asia/Kolkata', or None if it is not in the
+    installed database.
+    """
+    names, links = _database()
+    tz = core._normalize(tz)
+    return links.get(tz) or names.get(tz)
+
+
+def check(city_dict: Optional[Mapping[str, Sequence[str]]] = None
+          ) -> Differences:
+    """
+    Compare the tz names of city_dict, by default the bundled data, with
+    the installed time zone database.
+    """
+    if city_dict is None:
+        city_dict = core._bundled()
+    names, links = _database()
+    missing = []
+    renamed = {}
+    capitalization = {}
+    for tz in city_dict:
+        if tz not in names:
+            missing.append(tz)
+            continue
+        if tz in links:
+            renamed[tz] = links[tz]
+        if core._caps_tz(tz) != names[tz]:
+            capitalization[tz] = names[tz]
+    return Differences(missing, renamed, capitalization)
+
+
+@lru_cache(maxsize=None)
+def _database() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Load the installed time zone database.
+
+    Returns the names of time zones and links by their lower case forms,
+    and the names of the time zones linked to by the lower case names of
+    the links.
+    """
+    # pylint: disable=import-outside-toplevel
+    import zoneinfo  # type: ignore
+
+    for directory in zoneinfo.TZPATH:
+        path = os.path.join(directory, 'tzdata.zi')
+        if os.path.isfile(path):
+            with open(path, encoding='utf-8') as tzdata:
+                return _read_tzdata(tzdata)
+    return ({tz.lower(): tz for tz in zoneinfo.available_timezones()}, {})
+
+
+def _read_tzdata(lines: Iterable[str]
+                 ) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Read the names of time zones and links from lines of tzdata.zi, the
+    compact text form of the time zone database.
+    """
+    names = {}
+    links = {}
+    for line in lines:
+        fields = line.split()
+        if fields[:1] == ['Z']:
+            names[fields[1].lower()] = fields[1]
+        elif fields[:1] == ['L']:
+            # L target link
+            names[fields[2].lower()] = fields[2]
+            links[fields[2].lower()] = fields[1]
+    return names, links
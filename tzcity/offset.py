@@ -0,0 +1,156 @@
+"""
+UTC offsets and daylight saving time of the time zones of cities
+
+Needs the zoneinfo module of Python 3.9 or later.
+"""
+
+# pylint: disable=protected-access
+
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import (Any, Dict, Iterable, Iterator, NamedTuple, Optional,
+                    Tuple, Union)
+
+from tzcity import core, iana
+
+# Seconds in a day, the span of each entry of the transition table
+_DAY = 86400
+
+# Number of entries of the transition table after which it is emptied
+_MAX_DAYS = 1 << 20
+
+When = Union[None, datetime, float]
+
+
+class ZoneState(NamedTuple):
+    """
+    UTC offset of a time zone at some instant and whether daylight saving
+    time is in effect then.
+    """
+    tz: str
+    utcoffset: timedelta
+    dst: bool
+
+
+# Transitions of time zones by (tz, day number since the epoch). A day is
+# mapped to its ZoneState if it has no transition in it, and otherwise to
+# the timestamp of the transition with the states before and after it.
+# Days are filled in when first needed, assuming at most one transition a
+# day, so converting many timestamps needs no datetime objects.
+_DAYS: Dict[Tuple[str, int],
+            Union[ZoneState, Tuple[int, ZoneState, ZoneState]]] = {}
+
+# Equal states, to share one object between all days having that state
+_STATES: Dict[ZoneState, ZoneState] = {}
+
+
+def tzoffset(city: str, when: When = None) -> ZoneState:
+    """
+    Find the time zone associated with city and return its UTC offset
+    and daylight saving time state at when.
+
+    when may be an aware datetime, a naive datetime taken to be in UTC or
+    a POSIX timestamp. It defaults to now.
+
+    Raises ValueError if city is not recognized.
+    """
+    return _lookup(core.tzcity(city), _timestamp(when))
+
+
+def tzoffset_many(pairs: Iterable[Tuple[str, When]],
+                  default: Optional[ZoneState] = None
+                  ) -> Iterator[Optional[ZoneState]]:
+    """
+    Yield tzoffset(city, when) for each (city, when) in pairs, or default
+    where the city is not recognized.
+
+    Each distinct city is looked up once, so this is faster than calling
+    tzoffset() in a loop. Like tzcity_many(), the time zones of up to a
+    fixed number of distinct cities are kept at a time.
+    """
+    zones: Dict[str, Optional[str]] = {}
+    for city, when in pairs:
+        if city not in zones:
+            if len(zones) >= core._MANY_RESULTS:
+                zones.clear()
+            try:
+                zones[city] = core.tzcity(city)
+            except ValueError:
+                zones[city] = None
+        tz = zones[city]
+        if tz is None:
+            yield default
+        else:
+            yield _lookup(tz, _timestamp(when))
+
+
+def _timestamp(when: When) -> float:
+    """
+    Return when as a POSIX timestamp.
+    """
+    if when is None:
+        return time.time()
+    if isinstance(when, datetime):
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return when.timestamp()
+    return when
+
+
+def _lookup(tz: str, timestamp: float) -> ZoneState:
+    """
+    Return the state of tz at timestamp from the transition table.
+    """
+    key = (tz, int(timestamp // _DAY))
+    entry = _DAYS.get(key)
+    if entry is None:
+        if len(_DAYS) >= _MAX_DAYS:
+            _DAYS.clear()
+        entry = _DAYS[key] = _transition(_zone(tz), key[1] * _DAY)
+    if isinstance(entry, ZoneState):
+        return entry
+    transition, before, after = entry
+    return before if timestamp < transition else after
+
+
+def _transition(zone: Any, start: int
+                ) -> Union[ZoneState, Tuple[int, ZoneState, ZoneState]]:
+    """
+    Return the transition table entry of zone for the day from start.
+    """
+    before = _state(zone, start)
+    after = _state(zone, start + _DAY - 1)
+    if before == after:
+        return before
+
+    # Bisect for the first second having the state after the transition
+    low, high = start, start + _DAY - 1
+    while high - low > 1:
+        middle = (low + high) // 2
+        if _state(zone, middle) == before:
+            low = middle
+        else:
+            high = middle
+    return high, before, after
+
+
+def _state(zone: Any, timestamp: int) -> ZoneState:
+    """
+    Compute the state of zone at timestamp.
+    """
+    local = datetime.fromtimestamp(timestamp, zone)
+    state = ZoneState(zone.key, local.utcoffset() or timedelta(0),
+                      bool(local.dst()))
+    return _STATES.setdefault(state, state)
+
+
+@lru_cache(maxsize=None)
+def _zone(tz: str) -> Any:
+    """
+    Return the ZoneInfo object of tz.
+    """
+    # pylint: disable=import-outside-toplevel
+    import zoneinfo  # type: ignore
+
+    return zoneinfo.ZoneInfo(iana.iana_name(tz) or tz)
@@ -0,0 +1,48 @@
+"""
+Autocompletion of city and time zone names
+"""
+
+# pylint: disable=protected-access
+
+import heapq
+from bisect import bisect_left
+from typing import List, Tuple
+
+from tzcity import core
+
+
+def complete(prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+    """
+    Find the recognized names starting with prefix.
+
+    Returns up to limit pairs of capitalized name and time zone name,
+    in the order of the data: by time zone name, then in the order the
+    names of a time zone are listed.
+    """
+    # Trailing whitespace is kept as it separates words of the prefix
+    prefix = prefix.lstrip().lower()
+    names, ranks, ranked_names = _sorted_names()
+    low = bisect_left(names, prefix)
+    high = bisect_left(names, prefix + '\U0010ffff', lo=low)
+    matches = [ranked_names[rank]
+               for rank in heapq.nsmallest(limit, ranks[low:high])]
+    # Not through tzcity(), as suggestions are not lookups for
+    # tzcity.stats and tzcity.cache
+    index = core._index()
+    return [(core._capitalize_lenient(name), core.capitalize(index[name]))
+            for name in matches]
+
+
+@core._derived
+def _sorted_names() -> Tuple[List[str], List[int], List[str]]:
+    """
+    Return the recognized names in sorted order, their ranks and the
+    names in the order of their ranks.
+
+    The rank of a name is its position in the lookup index, which follows
+    the order of CITY_DICT, which is sorted by tz name.
+    """
+    ranked_names = list(core._index())
+    ranked = sorted((name, rank) for rank, name in enumerate(ranked_names))
+    return ([name for name, _ in ranked], [rank for _, rank in ranked],
+            ranked_names)
@@ -0,0 +1,253 @@
+"""
+Explanations of how names are looked up, for finding out why a lookup
+was slow or found an unexpected time zone
+
+explain() looks up a name stage by stage, timing each stage. profile()
+explains every lookup made while it is active and adds them up into a
+report. Lookups outside of profile() only check whether one is active.
+"""
+
+# pylint: disable=protected-access
+
+import heapq
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import (Any, Dict, Iterator, List, Mapping, NamedTuple, Optional,
+                    Tuple)
+
+from tzcity import core
+from tzcity.stats import match_kind
+
+# Number of slowest lookups kept by a report
+_SLOWEST = 10
+
+
+class Stage(NamedTuple):
+    """
+    A stage of a lookup, with the seconds it took, the number of index
+    entries it probed and what it did.
+    """
+    name: str
+    seconds: float
+    probes: int
+    detail: str
+
+
+class Explanation(NamedTuple):
+    """
+    How a name was looked up.
+
+    match is how the name was recognized: 'exact' if its normalized form
+    is a recognized name, 'folded' if its folded form is that of one,
+    'folded city' if it was recognized without a trailing 'city', or None
+    if it was not recognized. kind is the kind of the recognized name as
+    in tzcity.stats.match_kind().
+    """
+    city: str
+    normalized: str
+    match: Optional[str]
+    matched: Optional[str]
+    kind: Optional[str]
+    tz: Optional[str]
+    label: Optional[str]
+    stages: Tuple[Stage, ...]
+
+    @property
+    def seconds(self) -> float:
+        """
+        Seconds taken by all stages.
+        """
+        return sum(stage.seconds for stage in self.stages)
+
+
+def explain(city: str) -> Explanation:
+    """
+    Look up city like tzcity() and explain how its time zone was found.
+
+    The stages are normalizing the name, looking it up as given, looking
+    it up by its folded form if needed, and capitalizing the tz name and
+    the recognized name.
+    """
+    return _explain(city)[0]
+
+
+def _explain(city: str) -> Tuple[Explanation, Tuple[str, Optional[str]]]:
+    """
+    Explain the lookup of city, also returning the result of the lookup
+    as returned by core._lookup().
+    """
+    stages = []
+
+    start = perf_counter()
+    normalized = core._normalize(city)
+    stages.append(Stage('normalize', perf_counter() - start, 0,
+                        repr(normalized)))
+
+    index = core._index()
+    start = perf_counter()
+    tz_value = index.get(normalized)
+    stages.append(Stage('exact', perf_counter() - start, 1,
+                        'miss' if tz_value is None else 'hit'))
+    match: Optional[str] = 'exact'
+    matched = normalized
+
+    if tz_value is None:
+        match, matched, tz_value, stage = _folded_stage(index, normalized)
+        stages.append(stage)
+        if tz_value is None:
+            return (Explanation(city, normalized, None, None, None, None,
+                                None, tuple(stages)),
+                    (normalized, None))
+
+    tz, label, capitalize_stages = _capitalize(matched, tz_value)
+    stages.extend(capitalize_stages)
+    return (Explanation(city, normalized, match, matched,
+                        match_kind(matched, tz_value), tz, label,
+                        tuple(stages)),
+            (matched, tz_value))
+
+
+def _folded_stage(index: Mapping[str, str], normalized: str
+                  ) -> Tuple[Optional[str], str, Optional[str], Stage]:
+    """
+    Look up a normalized name by its folded form.
+
+    Returns the kind of match or None, the recognized name, its tz name
+    or None and the stage.
+    """
+    start = perf_counter()
+    matched, tz_value = core._find_folded(index, normalized)
+    seconds = perf_counter() - start
+    folded = core._fold(normalized)
+    if tz_value is None:
+        return None, matched, None, Stage(
+            'folded', seconds, 1 + folded.endswith(' city'),
+            f"{folded!r} not recognized")
+    match = 'folded' if folded in core._folded() else 'folded city'
+    return match, matched, tz_value, Stage(
+        'folded', seconds, 1 if match == 'folded' else 2,
+        f"{folded!r} is the folded form of {matched!r}")
+
+
+def _capitalize(matched: str, tz_value: str
+                ) -> Tuple[str, str, List[Stage]]:
+    """
+    Capitalize a tz name and the recognized name associated with it.
+
+    Returns both capitalized and the stages.
+    """
+    cached = tz_value in core._TZ_CAPS
+    start = perf_counter()
+    tz = core.capitalize(tz_value)
+    tz_stage = Stage('capitalize tz', perf_counter() - start, 1,
+                     'cached' if cached else 'computed')
+
+    hits = core._caps_city.cache_info().hits
+    start = perf_counter()
+    label = core._capitalize_lenient(matched)
+    seconds = perf_counter() - start
+    if matched == tz_value:
+        detail = 'tz name'
+    elif core._caps_city.cache_info().hits > hits:
+        detail = 'cached'
+    else:
+        detail = 'computed'
+    return tz, label, [tz_stage, Stage('capitalize name', seconds, 1, detail)]
+
+
+class Report:
+    """
+    Explanations of many lookups added up.
+
+    Adding takes no locks, so counts may be slightly off when lookups
+    happen in many threads at once.
+    """
+
+    def __init__(self) -> None:
+        self.lookups = 0
+        self.matches: Counter = Counter()
+        self.kinds: Counter = Counter()
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.probes: Counter = Counter()
+        self.slowest: List[Tuple[float, str]] = []
+
+    def add(self, explanation: Explanation) -> None:
+        """
+        Add an explanation of a lookup to the report.
+        """
+        self.lookups += 1
+        self.matches[explanation.match or 'unrecognized'] += 1
+        if explanation.kind is not None:
+            self.kinds[explanation.kind] += 1
+        for stage in explanation.stages:
+            self.seconds[stage.name] += stage.seconds
+            self.probes[stage.name] += stage.probes
+        item = (explanation.seconds, explanation.city)
+        if len(self.slowest) < _SLOWEST:
+            heapq.heappush(self.slowest, item)
+        else:
+            heapq.heappushpop(self.slowest, item)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the report as a dictionary.
+
+        Gives the number of lookups, the number recognized by each kind of
+        match and of name or unrecognized, the seconds taken and index
+        entries probed by each stage, and the slowest lookups with their
+        seconds, slowest first.
+        """
+        return {
+            'lookups': self.lookups,
+            'matches': {match: self.matches[match]
+                        for match in ('exact', 'folded', 'folded city',
+                                      'unrecognized')},
+            'kinds': {kind: self.kinds[kind]
+                      for kind in ('zone', 'tz city', 'alias')},
+            'seconds': dict(self.seconds),
+            'probes': dict(self.probes),
+            'slowest': [(city, seconds) for seconds, city
+                        in sorted(self.slowest, reverse=True)],
+        }
+
+
+# Reports of the active profile() blocks, changed under the lock and
+# copied by lookups
+_REPORTS: List[Report] = []
+_REPORTS_LOCK = threading.Lock()
+
+
+@contextmanager
+def profile() -> Iterator[Report]:
+    """
+    Explain the lookups of tzcity() and tzcity_many() made in the with
+    block, in all threads, and add them up into the report given.
+
+    Lookups served by tzcity.cache are not explained. Results are the
+    same as without profiling. Blocks may overlap, each lookup being added
+    to the reports of all the active ones.
+    """
+    report = Report()
+    with _REPORTS_LOCK:
+        _REPORTS.append(report)
+        core._PROFILER = _profiled_lookup
+    try:
+        yield report
+    finally:
+        with _REPORTS_LOCK:
+            _REPORTS.remove(report)
+            if not _REPORTS:
+                core._PROFILER = None
+
+
+def _profiled_lookup(city: str) -> Tuple[str, Optional[str]]:
+    """
+    Look up city like core._lookup(), adding the explanation of the lookup
+    to the active reports.
+    """
+    explanation, result = _explain(city)
+    for report in _REPORTS.copy():
+        report.add(explanation)
+    return result
@@ -0,0 +1,231 @@
+"""
+HTTP server for looking up time zones from other programs
+
+Run with
+
+    python -m tzcity.server --port 8080
+
+Endpoints, all returning JSON:
+
+    GET  /tzcity?city=NAME      {"city": NAME, "tz": TZ}
+    POST /tzcity                ["NAME", ...] -> {"tz": [TZ or null, ...]}
+    GET  /capitalize?name=NAME  {"name": NAME, "capitalized": CAPITALIZED}
+    GET  /metrics               request counts and lookup statistics
+
+Unrecognized names give a 404 response with an "error" message, except in
+batch lookups.
+"""
+
+# pylint: disable=protected-access
+
+import argparse
+import json
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from tzcity import __version__, core, stats
+
+
+# Called after each lookup like tzcity.stats.LookupStats
+Observer = Callable[[str, Optional[str], float], None]
+
+# Requests counted for /metrics by endpoint, others being counted together
+_ENDPOINTS = {'GET /tzcity', 'GET /capitalize', 'GET /metrics',
+              'POST /tzcity'}
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    """
+    HTTP server handling each connection in a thread.
+
+    If lookup_stats is given, lookups are recorded in it until the server
+    is closed, along with any statistics the program records already.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int],
+                 lookup_stats: Optional[stats.LookupStats] = None) -> None:
+        super().__init__(address, _Handler)
+        self.lookup_stats = lookup_stats
+        self.requests: Counter = Counter()
+        self._previous = core._OBSERVER
+        self._observer: Optional[Observer] = None
+        if lookup_stats is not None:
+            self._observer = _chain(lookup_stats, self._previous)
+            core._OBSERVER = self._observer
+
+    def server_close(self) -> None:
+        """
+        Close the server and stop recording lookups, restoring the
+        observer of lookups replaced when it was made.
+        """
+        super().server_close()
+        # Unless replaced since, as by tzcity.stats.enable()
+        if self._observer is not None and core._OBSERVER is self._observer:
+            core._OBSERVER = self._previous
+        self._observer = None
+
+
+def _chain(first: Observer, second: Optional[Observer]) -> Observer:
+    """
+    Return an observer of lookups calling first and then second, if any.
+    """
+    if second is None:
+        return first
+
+    def observe(name: str, tz_value: Optional[str], seconds: float) -> None:
+        first(name, tz_value, seconds)
+        second(name, tz_value, seconds)
+    return observe
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Handler of requests to Server.
+    """
+    # Needed for keep-alive connections
+    protocol_version = 'HTTP/1.1'
+    server_version = f"tzcity/{__version__}"
+    # Headers and body are written separately, so without this each
+    # response on a kept-alive connection waits for a delayed ACK
+    disable_nagle_algorithm = True
+    server: Server
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Handle GET requests.
+        """
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        self._count(f"GET {url.path}")
+        if url.path == '/tzcity' and 'city' in query:
+            city = query['city'][0]
+            try:
+                self._send(200, {'city': city, 'tz': core.tzcity(city)})
+            except ValueError as error:
+                self._send(404, {'error': str(error)})
+        elif url.path == '/capitalize' and 'name' in query:
+            name = query['name'][0]
+            try:
+                self._send(200, {'name': name,
+                                 'capitalized': core.capitalize(name)})
+            except ValueError as error:
+                self._send(404, {'error': str(error)})
+        elif url.path == '/metrics':
+            self._send(200, self._metrics())
+        else:
+            self._send(400, {'error': f"Bad request: {self.path}"})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """
+        Handle POST requests.
+        """
+        self._count(f"POST {self.path}")
+        length = self._content_length()
+        if length is None:
+            # The body cannot be skipped to read the next request
+            self.close_connection = True
+            self._send(400, {'error': "Expected a valid Content-Length"})
+            return
+        try:
+            cities = json.loads(self.rfile.read(length))
+        except ValueError:
+            cities = None
+        if (self.path != '/tzcity' or not isinstance(cities, list)
+                or not all(isinstance(city, str) for city in cities)):
+            self._send(400, {'error': "Expected a JSON list of names "
+                                      "posted to /tzcity"})
+            return
+        self._send(200, {'tz': list(core.tzcity_many(cities))})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """
+        Do not log requests, as that slows down the server.
+        """
+
+    def _count(self, endpoint: str) -> None:
+        """
+        Count a request to endpoint, or to another one if it is not known,
+        keeping the counts bounded whatever paths are requested.
+        """
+        if endpoint not in _ENDPOINTS:
+            endpoint = 'other'
+        self.server.requests[endpoint] += 1
+
+    def _content_length(self) -> Optional[int]:
+        """
+        Return the length of the body of the request, or None if it is
+        missing or invalid.
+        """
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            return None
+        return length if length >= 0 else None
+
+    def _metrics(self) -> Dict[str, Any]:
+        """
+        Return the request counts and lookup statistics.
+        """
+        metrics: Dict[str, Any] = {'requests': dict(self.server.requests)}
+        if self.server.lookup_stats is not None:
+            metrics['lookups'] = self.server.lookup_stats.snapshot()
+        return metrics
+
+    def _send(self, status: int, body: Dict[str, Any]) -> None:
+        """
+        Send a response with body as JSON.
+        """
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def make_server(host: str = '127.0.0.1', port: int = 8080,
+                record_stats: bool = True) -> Server:
+    """
+    Return a server listening on host and port, ready to serve_forever().
+
+    The lookup index is built before returning so that the first
+    requests are not slowed down. Statistics of lookups are recorded for
+    /metrics if record_stats is true, until the server is closed.
+    """
+    core._index()
+    for tz in core._bundled():
+        core.capitalize(tz)
+    lookup_stats = stats.LookupStats() if record_stats else None
+    return Server((host, port), lookup_stats)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the server with the given command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m tzcity.server',
+        description="Serve time zone lookups over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8080,
+                        help="port to listen on, 0 for any (default: 8080)")
+    parser.add_argument('--no-stats', action='store_true',
+                        help="do not record statistics of lookups")
+    args = parser.parse_args(argv)
+
+    with make_server(args.host, args.port, not args.no_stats) as server:
+        print(f"Serving on http://{args.host}:{server.server_port}",
+              flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""
+Lookup table in a file shared by processes through mmap
+
+A server with many worker processes can build the table once with
+build_table() and have every worker call use_table(). The operating
+system keeps a single copy of the table in memory for all of them.
+"""
+
+# pylint: disable=protected-access
+
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, Iterator, List, Mapping, Optional, cast
+from zlib import crc32
+
+from tzcity import core
+
+# File layout, with all integers unsigned 32-bit in native byte order:
+#
+#   magic, number of names, number of tz names, number of folded names,
+#     number of hash slots of names, number of hash slots of folded names
+#   file offsets of names, in lookup index order, and of the end of the
+#     last name
+#   hash slots of names holding 1 + name id, or 0 if empty
+#   tz name id of each name
+#   file offsets of tz names and of the end of the last tz name
+#   file offsets of folded names and of the end of the last folded name
+#   hash slots of folded names holding 1 + folded name id, or 0 if empty
+#   name id of each folded name
+#   UTF-8 encoded names
+#   UTF-8 encoded tz names
+#   UTF-8 encoded folded names
+#
+# Folded names are the keys of the folded index, mapping to the names
+# they are the folded forms of. Names hash to slots with CRC-32 and
+# collisions go to the next slot.
+_MAGIC = b'TZC2'
+_HEADER = struct.Struct('=4sIIIII')
+
+
+class _Strings:
+    """
+    Strings of a table file by id, found by hash slots if given.
+    """
+
+    def __init__(self, data: mmap.mmap, offsets: memoryview,
+                 slots: Optional[memoryview] = None) -> None:
+        self._data = data
+        self._offsets = offsets
+        self._slots = slots
+
+    def __getitem__(self, string_id: int) -> bytes:
+        offsets = self._offsets
+        return self._data[offsets[string_id]:offsets[string_id + 1]]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def find(self, string: str) -> int:
+        """
+        Return the id of string, or -1 if it is not there.
+        """
+        try:
+            key = string.encode()
+        except UnicodeEncodeError:
+            # Lone surrogates, which no recognized name has
+            return -1
+        slots = cast(memoryview, self._slots)
+        mask = len(slots) - 1
+        slot = crc32(key) & mask
+        while slots[slot]:
+            string_id = slots[slot] - 1
+            if self[string_id] == key:
+                return string_id
+            slot = (slot + 1) & mask
+        return -1
+
+
+class SharedTable(Mapping[str, str]):
+    """
+    Read-only mapping from recognized names to tz names backed by a
+    file built with build_table().
+
+    folded is the folded index of the table, mapping the folded forms of
+    the names to the names.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as table_file:
+            data = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, names, zones, folded, slots, folded_slots = \
+            _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"{path}: Not a tzcity lookup table")
+        view = memoryview(data)
+        start = _HEADER.size
+
+        def section(count: int) -> memoryview:
+            nonlocal start
+            start += 4 * count
+            return view[start - 4 * count:start].cast('I')
+
+        # In the order of the file
+        self._names = _Strings(data, section(names + 1), section(slots))
+        self._name_zones = section(names)
+        self._zones = _Strings(data, section(zones + 1))
+        self.folded = _FoldedTable(
+            _Strings(data, section(folded + 1), section(folded_slots)),
+            section(folded), self._names)
+
+    def __getitem__(self, name: str) -> str:
+        name_id = self._names.find(name)
+        if name_id < 0:
+            raise KeyError(name)
+        return self._zones[self._name_zones[name_id]].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        for name_id in range(len(self)):
+            yield self._names[name_id].decode()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class _FoldedTable(Mapping[str, str]):
+    """
+    Read-only folded index of a SharedTable.
+    """
+
+    def __init__(self, folded: _Strings, folded_names: memoryview,
+                 names: _Strings) -> None:
+        self._folded = folded
+        self._folded_names = folded_names
+        self._names = names
+
+    def __getitem__(self, folded: str) -> str:
+        folded_id = self._folded.find(folded)
+        if folded_id < 0:
+            raise KeyError(folded)
+        return self._names[self._folded_names[folded_id]].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        for folded_id in range(len(self)):
+            yield self._folded[folded_id].decode()
+
+    def __len__(self) -> int:
+        return len(self._folded)
+
+
+def build_table(path: str) -> None:
+    """
+    Write the lookup table to a file.
+
+    The file is replaced atomically, so processes which already use an
+    older table at that path are not affected.
+    """
+    index = core._index()
+    zones: Dict[str, int] = {}
+    name_zones = array('I', [zones.setdefault(tz, len(zones))
+                             for tz in index.values()])
+    name_ids = {name: name_id for name_id, name in enumerate(index)}
+    folded_index = core._build_folded_index(index)
+    folded_names = array('I', [name_ids[name]
+                               for name in folded_index.values()])
+    names = [name.encode() for name in index]
+    folded = [key.encode() for key in folded_index]
+    slots = _hash_slots(names)
+    folded_slots = _hash_slots(folded)
+    header = _HEADER.pack(_MAGIC, len(names), len(zones), len(folded),
+                          len(slots), len(folded_slots))
+    _write_table(path, header,
+                 [names, [tz.encode() for tz in zones], folded],
+                 [[slots, name_zones], [], [folded_slots, folded_names]])
+
+
+def _write_table(path: str, header: bytes, strings: List[List[bytes]],
+                 sections: List[List[array]]) -> None:
+    """
+    Write a table file atomically: the header, the offsets of each list of
+    strings followed by its sections, and then all strings.
+    """
+    start = len(header) + sum(4 * (len(blobs) + 1) for blobs in strings) \
+        + sum(4 * len(section) for group in sections for section in group)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as table_file:
+        table_file.write(header)
+        for blobs, group in zip(strings, sections):
+            offsets = _offsets(blobs, start)
+            start = offsets[-1]
+            for section in [offsets] + group:
+                table_file.write(section.tobytes())
+        for blobs in strings:
+            table_file.write(b''.join(blobs))
+    os.replace(tmp_path, path)
+
+
+def use_table(path: Optional[str]) -> None:
+    """
+    Make lookups in this process use the lookup table in a file.
+
+    None makes lookups go back to using the bundled data.
+    """
+    table = None if path is None else SharedTable(path)
+    core._TABLE = table
+    core._FOLDED_TABLE = None if table is None else table.folded
+    core._reset_index()
+
+
+def _hash_slots(names: List[bytes]) -> array:
+    """
+    Return the hash slots of names, keeping at most half of them filled.
+    """
+    mask = 1
+    while mask + 1 < 2 * len(names):
+        mask = 2 * mask + 1
+    slots = array('I', [0] * (mask + 1))
+    for name_id, name in enumerate(names):
+        slot = crc32(name) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = name_id + 1
+    return slots
+
+
+def _offsets(blobs: List[bytes], start: int) -> array:
+    """
+    Return the offsets at which each blob starts when they are joined
+    and written at start, followed by the offset of their end.
+    """
+    offsets = array('I', [start])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return offsets
@@ -0,0 +1,125 @@
+"""
+Extra data sources merged with the bundled data
+
+A source is a mapping from tz names to the names of cities associated
+with them, like CITY_DICT. It can be read from CSV or from GeoNames dumps
+like cities15000.txt with the functions here.
+"""
+
+# pylint: disable=protected-access
+
+import csv
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+from tzcity import core, iana
+
+# Columns of the GeoNames dump format. See
+# http://download.geonames.org/export/dump/readme.txt
+_GEONAMES_NAME = 1
+_GEONAMES_ASCII_NAME = 2
+_GEONAMES_ALTERNATE_NAMES = 3
+_GEONAMES_POPULATION = 14
+_GEONAMES_TZ = 17
+
+
+def add_source(cities: Mapping[str, Iterable[str]],
+               override: bool = False) -> None:
+    """
+    Add a source of cities for lookups in this process.
+
+    By default, names already known from the bundled data or from sources
+    added before are not changed. With override, names of this source
+    take precedence over those of the bundled data and of every source
+    added before. The same goes for the names of a shared lookup table
+    in use.
+
+    The lookup index is updated in place instead of being rebuilt.
+    """
+    source = {core._normalize(tz): [core._normalize(city) for city in names]
+              for tz, names in cities.items()}
+    _record_caps(cities)
+    if override:
+        core._OVERRIDES.insert(0, source)
+    else:
+        core._EXTRAS.append(source)
+    # Only indexes which were already built need updating
+    # pylint: disable=too-many-function-args
+    if core._dict_index.cache_info().currsize:
+        entries = core._build_index(source)
+        core._merge_index(core._dict_index(), entries, override)
+        if core._folded_index.cache_info().currsize:
+            core._merge_index(core._folded_index(),
+                              core._build_folded_index(entries), override)
+    else:
+        core._folded_index.cache_clear()
+    core._data_changed()
+
+
+def _record_caps(cities: Mapping[str, Iterable[str]]) -> None:
+    """
+    Record the names of the time zones of a source as in the installed
+    time zone database, which capitalize() then returns.
+    """
+    try:
+        for tz in cities:
+            name = iana.iana_name(tz)
+            if name is not None:
+                core._TZ_CAPS[core._normalize(tz)] = name
+    except ImportError:
+        pass
+
+
+def clear_sources() -> None:
+    """
+    Remove all sources added by add_source(), leaving the bundled data.
+    """
+    core._OVERRIDES.clear()
+    core._EXTRAS.clear()
+    core._reset_index()
+
+
+def read_csv(lines: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Read a source from lines of CSV having a header with 'city' and 'tz'
+    columns, one city per row.
+
+    Raises ValueError if either column is missing.
+    """
+    reader = csv.DictReader(lines)
+    if not {'city', 'tz'} <= set(reader.fieldnames or ()):
+        raise ValueError("CSV needs 'city' and 'tz' columns")
+    cities: Dict[str, List[str]] = {}
+    for row in reader:
+        cities.setdefault(row['tz'], []).append(row['city'])
+    return cities
+
+
+def read_geonames(lines: Iterable[str],
+                  alternate_names: bool = False) -> Dict[str, List[str]]:
+    """
+    Read a source from lines of a GeoNames dump like cities15000.txt.
+
+    The name and ASCII name of each place are used, along with its
+    alternate names if alternate_names is true. A name shared by places
+    in different time zones goes to the most populous place, and the
+    cities of each tz name are ordered by population like CITY_DICT.
+    """
+    best: Dict[str, Tuple[int, str]] = {}
+    for line in lines:
+        fields = line.rstrip('\r\n').split('\t')
+        if len(fields) <= _GEONAMES_TZ or not fields[_GEONAMES_TZ]:
+            continue
+        tz = fields[_GEONAMES_TZ]
+        population = int(fields[_GEONAMES_POPULATION] or 0)
+        names = [fields[_GEONAMES_NAME], fields[_GEONAMES_ASCII_NAME]]
+        if alternate_names:
+            names += fields[_GEONAMES_ALTERNATE_NAMES].split(',')
+        for name in names:
+            name = core._normalize(name)
+            if name and (name not in best or population > best[name][0]):
+                best[name] = (population, tz)
+
+    cities: Dict[str, List[str]] = {}
+    for name, (_, tz) in sorted(best.items(), key=lambda item: -item[1][0]):
+        cities.setdefault(tz, []).append(name)
+    return cities
@@ -0,0 +1,149 @@
+"""
+Optional statistics of lookups
+
+Nothing is recorded until enable() is called. Recording takes no locks,
+so counts may be slightly off when lookups happen in many threads at once.
+"""
+
+# pylint: disable=protected-access
+
+from collections import Counter
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tzcity import core
+
+# Number of latency histogram buckets. Bucket i counts lookups which
+# took less than 2**i nanoseconds but not less than 2**(i-1).
+_BUCKETS = 32
+
+Callback = Callable[[str, Optional[str], Optional[str], float], None]
+
+
+class TopCounter:
+    """
+    Approximate counts of the most frequent items in bounded memory.
+
+    Uses the Space-Saving algorithm: once size items are being counted, a
+    new item replaces the least counted one and inherits its count.
+
+    Counting takes no lock. No step can fail when threads count at once,
+    at worst losing counts or keeping more than size items until the next
+    item is replaced.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.counts: Dict[str, int] = {}
+
+    def add(self, item: str) -> None:
+        """
+        Count an occurrence of item.
+        """
+        counts = self.counts
+        count = counts.get(item)
+        if count is not None or len(counts) < self.size:
+            counts[item] = (count or 0) + 1
+        else:
+            count = 0
+            # Other threads may have added items meanwhile
+            while counts and len(counts) >= self.size:
+                # A copy, as other threads may change counts meanwhile
+                least, count = min(counts.copy().items(), key=itemgetter(1))
+                counts.pop(least, None)
+            counts[item] = count + 1
+
+    def most_common(self) -> List[Tuple[str, int]]:
+        """
+        Return the counted items with their counts, most frequent first.
+        """
+        return Counter(self.counts).most_common()
+
+
+class LookupStats:
+    """
+    Statistics of the lookups made by tzcity() and tzcity_many().
+
+    tzcity_many() counts each distinct name once per call, or again when
+    it looks the name up again after many other distinct names.
+    """
+
+    def __init__(self, top: int = 100,
+                 callback: Optional[Callback] = None) -> None:
+        self.hits: Counter = Counter()
+        self.misses = 0
+        self.top_missed = TopCounter(top)
+        self.top_aliases = TopCounter(top)
+        self.latency = [0] * _BUCKETS
+        self.callback = callback
+
+    def __call__(self, name: str, tz_value: Optional[str],
+                 seconds: float) -> None:
+        """
+        Record a lookup of name which found tz_value in seconds.
+        """
+        kind = None
+        if tz_value is None:
+            self.misses += 1
+            self.top_missed.add(name)
+        else:
+            kind = match_kind(name, tz_value)
+            self.hits[kind] += 1
+            if kind == 'alias':
+                self.top_aliases.add(name)
+        bucket = min(int(seconds * 1e9).bit_length(), _BUCKETS - 1)
+        self.latency[bucket] += 1
+        if self.callback is not None:
+            self.callback(name, tz_value, kind, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the statistics recorded so far as a dictionary.
+
+        Latencies are given as a mapping from the upper bound of each
+        histogram bucket in nanoseconds to the number of lookups in it.
+        """
+        return {
+            'hits': {kind: self.hits[kind]
+                     for kind in ('zone', 'tz city', 'alias')},
+            'misses': self.misses,
+            'top_missed': self.top_missed.most_common(),
+            'top_aliases': self.top_aliases.most_common(),
+            'latency_ns': {2 ** bucket: count
+                           for bucket, count in enumerate(self.latency)
+                           if count},
+        }
+
+
+def match_kind(name: str, tz_value: str) -> str:
+    """
+    Return how name matched tz_value: as the 'zone' name itself, as the
+    'tz city' name which is part of it or as an 'alias' of it.
+    """
+    if name == tz_value:
+        return 'zone'
+    if name == core._tz_city(tz_value):
+        return 'tz city'
+    return 'alias'
+
+
+def enable(top: int = 100,
+           callback: Optional[Callback] = None) -> LookupStats:
+    """
+    Start recording statistics of lookups and return them.
+
+    Up to top most frequently missed names and most frequently used
+    aliases are kept. callback, if given, is called after each lookup
+    with the normalized name, the tz name found or None, the kind of
+    match or None, and the seconds taken.
+    """
+    stats = LookupStats(top, callback)
+    core._OBSERVER = stats
+    return stats
+
+
+def disable() -> None:
+    """
+    Stop recording statistics of lookups.
+    """
+    core._OBSERVER = None
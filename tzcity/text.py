@@ -0,0 +1,98 @@
+"""
+Finding names of cities and time zones in free text
+"""
+
+# pylint: disable=protected-access
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from tzcity import core
+
+# Words of text, with '/' as a word of its own to find tz names in text
+# like 'Asia/Kolkata' and city names in text like 'Bangalore/remote'.
+# Apostrophes and accents are part of words as _fold() drops them.
+_WORD = re.compile("/|(?:[^\\W_]|[\u0300-\u036f" + core._APOSTROPHES + "])+")
+
+
+class Match(NamedTuple):
+    """
+    A name found in text, with the time zone associated with it and its
+    span in the text.
+    """
+    name: str
+    tz: str
+    start: int
+    end: int
+
+
+def extract(text: str) -> List[Match]:
+    """
+    Find the recognized names of cities and time zones in text.
+
+    Names are matched as whole words, ignoring accents, case and
+    punctuation like tzcity(). Where names overlap, the longest one
+    starting first is taken, so 'New York' is found rather than 'York'.
+
+    Returns the matches in the order of the text.
+    """
+    words: List[str] = []
+    spans: List[Tuple[int, int]] = []
+    for match in _WORD.finditer(text):
+        for word in _words(match.group()):
+            words.append(word)
+            spans.append(match.span())
+
+    trie = _trie()
+    matches = []
+    position = 0
+    while position < len(words):
+        # Walk the trie along the words from position, keeping the end of
+        # the longest name
+        node: Any = trie
+        longest = None
+        for end in range(position, len(words)):
+            node = node.get(words[end])
+            if node is None:
+                break
+            if '' in node:
+                longest = end, node['']
+        if longest is None:
+            position += 1
+            continue
+        end, (name, tz) = longest
+        matches.append(Match(core._capitalize_lenient(name),
+                             core.capitalize(tz),
+                             spans[position][0], spans[end][1]))
+        position = end + 1
+    return matches
+
+
+@lru_cache(maxsize=1 << 16)
+def _words(token: str) -> Tuple[str, ...]:
+    """
+    Return the words of the folded form of a word of text.
+
+    Cached as the same words recur in text like logs.
+    """
+    return tuple(core._fold(token.lower()).split())
+
+
+@core._derived
+def _trie() -> Dict[str, Any]:
+    """
+    Build a trie of the words of the folded forms of the recognized
+    names.
+
+    Each node is a dict from words to child nodes, having the recognized
+    name ending there and its tz name under '' if there is one. Of names
+    with the same folded form, the first one is kept, as with tzcity().
+    """
+    trie: Dict[str, Any] = {}
+    for name, tz in core._index().items():
+        node = trie
+        for word in core._fold(name).replace('/', ' / ').split():
+            node = node.setdefault(word, {})
+        node.setdefault('', (name, tz))
+    return trie
@@ -1 +1,10 @@
 _.citytz  # unused attribute (tzcity/__init__.py:18)
+daemon_threads  # unused variable (tzcity/server.py:47)
+protocol_version  # unused variable (tzcity/server.py:90)
+server_version  # unused variable (tzcity/server.py:91)
+disable_nagle_algorithm  # unused variable (tzcity/server.py:94)
+_.do_GET  # unused method (tzcity/server.py:97)
+_.do_POST  # unused method (tzcity/server.py:122)
+_.close_connection  # unused attribute (tzcity/server.py:130)
+_.log_message  # unused method (tzcity/server.py:144)
+format  # unused variable (tzcity/server.py:144)